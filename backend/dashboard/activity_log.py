@@ -0,0 +1,104 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+
+from .models import Activity
+
+logger = logging.getLogger(__name__)
+
+class ActivityBuffer:
+    """
+    Buffers Activity rows in process memory and writes them with one
+    bulk_create per batch, so logging adds no INSERT to the request that
+    caused it.
+
+    A batch is flushed when it reaches ``batch_size`` rows or its oldest row
+    is ``flush_interval`` seconds old, and at interpreter exit. Age is checked
+    on each record and at the end of each request, and a timer started with
+    the batch catches a worker that goes idle before either comes along. Rows still buffered when the
+    process is killed are lost: the log is for dashboards, not auditing.
+    """
+
+    def __init__(self, batch_size=50, flush_interval=5.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._oldest = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def record(self, activity_type, message, user, event=None, coordinator=None):
+        """
+        Log an activity once the current transaction commits, so rolled
+        back work leaves no trace
+
+        Args:
+            activity_type: One of Activity.ACTIVITY_TYPES
+            message: Short description shown in the panels
+            user: User (or user ID) who acted
+            event: Event concerned (optional)
+            coordinator: Coordinator (or ID) whose panel shows it (optional)
+        """
+        activity = Activity(
+            type=activity_type,
+            message=message[:255],
+            user_id=getattr(user, 'pk', user),
+            event_id=getattr(event, 'pk', event),
+            coordinator_id=getattr(coordinator, 'pk', coordinator),
+            timestamp=timezone.now(),
+        )
+        transaction.on_commit(lambda: self._append(activity))
+
+    def _append(self, activity):
+        with self._lock:
+            self._pending.append(activity)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._timer = threading.Timer(self.flush_interval, self._flush_idle)
+                self._timer.daemon = True
+                self._timer.start()
+        self.flush_if_due()
+
+    def _flush_idle(self):
+        try:
+            self.flush()
+        finally:
+            # No request_finished closes the timer thread's connection
+            connections.close_all()
+
+    def flush_if_due(self):
+        with self._lock:
+            due = self._pending and (
+                len(self._pending) >= self.batch_size or
+                time.monotonic() - self._oldest >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        Write everything buffered
+
+        Returns:
+            int: Number of activities written
+        """
+        with self._lock:
+            batch, self._pending, self._oldest = self._pending, [], None
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if not batch:
+            return 0
+        try:
+            Activity.objects.bulk_create(batch, batch_size=500)
+        except DatabaseError as e:
+            logger.error(f"Dropped {len(batch)} activities: {e}")
+            return 0
+        return len(batch)
+
+activity_log = ActivityBuffer()
+atexit.register(activity_log.flush)
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from .models import Activity
+
+@admin.register(Activity)
+class ActivityAdmin(admin.ModelAdmin):
+    """Browse the activity log; rows are append-only, so nothing is editable"""
+    list_display = ('timestamp', 'type', 'message', 'user', 'event')
+    list_filter = ('type',)
+    search_fields = ('message', 'user__username')
+    date_hierarchy = 'timestamp'
+    raw_id_fields = ('user', 'event', 'coordinator')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,105 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_activity(apps, schema_editor):
+    Activity = apps.get_model('dashboard', 'Activity')
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    Event = apps.get_model('events', 'Event')
+    EventParticipant = apps.get_model('events', 'EventParticipant')
+    EventFeedback = apps.get_model('events', 'EventFeedback')
+    EventUpdate = apps.get_model('events', 'EventUpdate')
+    Payment = apps.get_model('payments', 'Payment')
+
+    # (type, rows of (user, timestamp, event, coordinator, event name), message)
+    sources = [
+        ('event_created', Event.objects.values_list(
+            'created_by_id', 'created_at', 'id', 'created_by_id', 'event_name'
+        ), "{} was created"),
+        ('event_registration', EventParticipant.objects.values_list(
+            'user_id', 'registered_at', 'event_id', 'event__created_by_id', 'event__event_name'
+        ), "New registration for {}"),
+        ('feedback_posted', EventFeedback.objects.values_list(
+            'user_id', 'created_at', 'event_id', 'event__created_by_id', 'event__event_name'
+        ), "New feedback for {}"),
+        ('event_updated', EventUpdate.objects.values_list(
+            'sender_id', 'created_at', 'event_id', 'event__created_by_id', 'event__event_name'
+        ), "Update posted for {}"),
+        ('payment_completed', Payment.objects.filter(payment_status='completed').values_list(
+            'coordinator_id', 'created_at', 'event_id', 'event__created_by_id', 'event__event_name'
+        ), "Payment completed for {}"),
+    ]
+
+    def activities():
+        for activity_type, rows, message in sources:
+            for user_id, timestamp, event_id, coordinator_id, event_name in rows.iterator():
+                yield Activity(
+                    type=activity_type, message=message.format(event_name)[:255], timestamp=timestamp,
+                    user_id=user_id, event_id=event_id, coordinator_id=coordinator_id
+                )
+        for user_id, timestamp, username in User.objects.values_list('id', 'created_at', 'username').iterator():
+            yield Activity(
+                type='user_register', message=f"{username} joined", timestamp=timestamp, user_id=user_id
+            )
+
+    # Write as we go so memory stays flat however long the history is
+    batch = []
+    for activity in activities():
+        batch.append(activity)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Activity.objects.bulk_create(batch)
+            batch = []
+    Activity.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('events', '0015_eventsimilarity'),
+        ('payments', '0004_venue_booking_interval'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activity',
+            name='coordinator',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='event_activities', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='event',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='activities', to='events.event'),
+        ),
+        migrations.AlterField(
+            model_name='activity',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='activity',
+            name='type',
+            field=models.CharField(choices=[('user_register', 'User Registration'), ('user_login', 'User Login'), ('event_created', 'Event Created'), ('event_approved', 'Event Approved'), ('event_rejected', 'Event Rejected'), ('event_registration', 'Event Registration'), ('event_updated', 'Event Updated'), ('feedback_posted', 'Feedback Posted'), ('payment_completed', 'Payment Completed'), ('ticket_purchased', 'Ticket Purchased'), ('coordinator_request', 'Coordinator Request')], max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['user', '-timestamp'], name='activity_user_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['type', '-timestamp'], name='activity_type_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['coordinator', '-timestamp'], name='activity_coordinator_time_idx'),
+        ),
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
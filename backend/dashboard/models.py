@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from events.models import Event
+
+class Activity(models.Model):
+    """
+    Append-only log of what happens on the platform, read by the admin and
+    coordinator activity panels. Rows are written in batches by
+    dashboard.activity_log and never updated.
+    """
+    ACTIVITY_TYPES = [
+        ('user_register', 'User Registration'),
+        ('user_login', 'User Login'),
+        ('event_created', 'Event Created'),
+        ('event_approved', 'Event Approved'),
+        ('event_rejected', 'Event Rejected'),
+        ('event_registration', 'Event Registration'),
+        ('event_updated', 'Event Updated'),
+        ('feedback_posted', 'Feedback Posted'),
+        ('payment_completed', 'Payment Completed'),
+        ('ticket_purchased', 'Ticket Purchased'),
+        ('coordinator_request', 'Coordinator Request'),
+    ]
+
+    # The user who acted
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='activities')
+    type = models.CharField(max_length=50, choices=ACTIVITY_TYPES)
+    message = models.CharField(max_length=255)
+    # When it happened, which can be a little before the row is flushed
+    timestamp = models.DateTimeField(default=timezone.now)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, null=True, blank=True, related_name='activities')
+    # Coordinator of the event concerned, whose panel shows the activity
+    coordinator = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name='event_activities'
+    )
+
+    def __str__(self):
+        return f"{self.get_type_display()}: {self.message}"
+
+    class Meta:
+        verbose_name_plural = 'Activities'
+        ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['user', '-timestamp'], name='activity_user_time_idx'),
+            models.Index(fields=['type', '-timestamp'], name='activity_type_time_idx'),
+            models.Index(fields=['coordinator', '-timestamp'], name='activity_coordinator_time_idx'),
+        ]
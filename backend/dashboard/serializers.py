@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from .models import Activity
+
+class ActivitySerializer(serializers.ModelSerializer):
+    username = serializers.CharField(source='user.username', read_only=True)
+    event_name = serializers.CharField(source='event.event_name', read_only=True, default=None)
+
+    class Meta:
+        model = Activity
+        fields = ['id', 'type', 'message', 'timestamp', 'user', 'username', 'event', 'event_name', 'coordinator']
+        read_only_fields = fields
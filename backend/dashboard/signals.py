@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.signals import request_finished
+from django.db.models.signals import post_save
+
+from events.models import CoordinatorRequest, Event, EventFeedback, EventParticipant, EventUpdate
+from payments.models import Payment
+
+from .activity_log import activity_log
+
+def _user_registered(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record('user_register', f"{instance.username} joined", instance)
+
+def _event_created(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record(
+            'event_created', f"{instance.event_name} was created",
+            instance.created_by_id, event=instance, coordinator=instance.created_by_id
+        )
+
+def _participant_registered(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record(
+            'event_registration', f"New registration for {instance.event.event_name}",
+            instance.user_id, event=instance.event_id, coordinator=instance.event.created_by_id
+        )
+
+def _feedback_posted(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record(
+            'feedback_posted', f"New {instance.rating}-star feedback for {instance.event.event_name}",
+            instance.user_id, event=instance.event_id, coordinator=instance.event.created_by_id
+        )
+
+def _event_updated(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record(
+            'event_updated', f"Update posted for {instance.event.event_name}",
+            instance.sender_id, event=instance.event_id, coordinator=instance.event.created_by_id
+        )
+
+def _payment_completed(sender, instance, created, **kwargs):
+    # Payment.from_db remembers the loaded status, so only the save that
+    # completes a payment is logged
+    if instance.payment_status == 'completed' and getattr(instance, '_loaded_status', None) != 'completed':
+        instance._loaded_status = 'completed'
+        activity_log.record(
+            'payment_completed', f"Payment of {instance.amount} completed for {instance.event.event_name}",
+            instance.coordinator_id, event=instance.event_id, coordinator=instance.event.created_by_id
+        )
+
+def _coordinator_requested(sender, instance, created, **kwargs):
+    if created:
+        activity_log.record('coordinator_request', "Requested coordinator access", instance.user_id)
+
+def _flush_due_activities(sender, **kwargs):
+    activity_log.flush_if_due()
+
+def connect_signals():
+    post_save.connect(_user_registered, sender=get_user_model(), dispatch_uid='activity-user-register')
+    post_save.connect(_event_created, sender=Event, dispatch_uid='activity-event-created')
+    post_save.connect(_participant_registered, sender=EventParticipant, dispatch_uid='activity-registration')
+    post_save.connect(_feedback_posted, sender=EventFeedback, dispatch_uid='activity-feedback')
+    post_save.connect(_event_updated, sender=EventUpdate, dispatch_uid='activity-event-update')
+    post_save.connect(_payment_completed, sender=Payment, dispatch_uid='activity-payment-completed')
+    post_save.connect(_coordinator_requested, sender=CoordinatorRequest, dispatch_uid='activity-coordinator-request')
+    request_finished.connect(_flush_due_activities, dispatch_uid='activity-flush')
@@ -0,0 +1,102 @@
+import threading
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from dashboard.activity_log import ActivityBuffer, activity_log
+from dashboard.models import Activity
+from events.models import Event, EventParticipant
+from payments.models import Payment
+from users.models import User
+
+
+class ActivityBufferTests(TestCase):
+    """
+    Buffered activities reach the table in batches, and none are left
+    behind by an idle worker
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='member', email='member@example.com')
+
+    def record(self, buffer, count):
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(count):
+                buffer.record('user_login', f"Login {index}", self.user)
+
+    def test_full_batch_is_written(self):
+        buffer = ActivityBuffer(batch_size=3, flush_interval=60)
+        self.record(buffer, 2)
+        self.assertEqual(Activity.objects.count(), 0)
+
+        self.record(buffer, 1)
+        self.assertEqual(Activity.objects.count(), 3)
+
+    def test_flush_writes_a_partial_batch(self):
+        buffer = ActivityBuffer(batch_size=50, flush_interval=60)
+        self.record(buffer, 2)
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(Activity.objects.filter(user=self.user).count(), 2)
+
+    def test_rolled_back_work_is_not_logged(self):
+        buffer = ActivityBuffer(batch_size=1, flush_interval=60)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            buffer.record('user_login', "Login", self.user)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_idle_buffer_is_flushed_by_its_timer(self):
+        buffer = ActivityBuffer(batch_size=50, flush_interval=0.01)
+        flushed = threading.Event()
+        with mock.patch.object(buffer, 'flush', side_effect=flushed.set):
+            self.record(buffer, 1)
+            self.assertTrue(flushed.wait(5))
+
+
+class ActivitySignalTests(TestCase):
+    """
+    Saves that matter to the dashboards are logged as activities
+    """
+
+    def setUp(self):
+        self.coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.member = User.objects.create(username='member', email='member@example.com')
+        self.event = Event.objects.create(
+            created_by=self.coordinator, event_name='Workshop', event_type='workshop',
+            is_paid=False, event_time=timezone.now() + timedelta(days=1),
+        )
+        activity_log.flush()
+        Activity.objects.all().delete()
+
+    def tearDown(self):
+        activity_log.flush()
+
+    def test_registration_is_logged_for_the_coordinator(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            EventParticipant.objects.create(event=self.event, user=self.member)
+        activity_log.flush()
+
+        activity = Activity.objects.get()
+        self.assertEqual(activity.type, 'event_registration')
+        self.assertEqual(activity.user, self.member)
+        self.assertEqual(activity.event, self.event)
+        self.assertEqual(activity.coordinator, self.coordinator)
+
+    def test_payment_completion_is_logged_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            payment = Payment.objects.create(
+                event=self.event, coordinator=self.coordinator, amount=Decimal('10.00'),
+                payment_status='pending',
+            )
+            payment.payment_status = 'completed'
+            payment.save()
+            payment.save()
+            Payment.objects.get(pk=payment.pk).save()
+        activity_log.flush()
+
+        self.assertEqual(Activity.objects.filter(type='payment_completed').count(), 1)
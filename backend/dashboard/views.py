@@ -0,0 +1,35 @@
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .models import Activity
+from .pagination import ActivityCursorPagination
+from .serializers import ActivitySerializer
+
+class ActivityViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Activity feed, newest first. Admins see the whole platform and may
+    narrow it with ?type= and ?user=; coordinators see activity on their
+    own events.
+
+    Activities are written in batches, so the feed can trail the platform
+    by up to ActivityBuffer.flush_interval seconds.
+    """
+    serializer_class = ActivitySerializer
+    pagination_class = ActivityCursorPagination
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        user = self.request.user
+        queryset = Activity.objects.select_related('user', 'event')
+        if user.user_role != 'admin':
+            return queryset.filter(coordinator=user)
+
+        activity_type = self.request.query_params.get('type')
+        if activity_type:
+            queryset = queryset.filter(type=activity_type)
+        user_id = self.request.query_params.get('user')
+        if user_id and user_id.isdigit():
+            queryset = queryset.filter(user_id=user_id)
+        return queryset
@@ -0,0 +1,82 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from dashboard.models import Activity
+
+# Activity log types shown in the coordinator panel, and the names the
+# panel knows them by
+FEED_TYPES = {
+    'event_registration': 'registration',
+    'feedback_posted': 'feedback',
+    'payment_completed': 'payment',
+    'event_updated': 'update',
+}
+
+def time_ago(timestamp, now=None):
+    """Format a timestamp as e.g. "2 hours ago" or "3 days ago" """
+    time_diff = (now or timezone.now()) - timestamp
+    if time_diff.days > 0:
+        return f"{time_diff.days} days ago"
+    hours = time_diff.seconds // 3600
+    if hours > 0:
+        return f"{hours} hours ago"
+    minutes = (time_diff.seconds % 3600) // 60
+    return f"{minutes} minutes ago"
+
+def encode_cursor(item):
+    position = [item['timestamp'].isoformat(), item['id']]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+def decode_cursor(cursor):
+    """Return (timestamp, id) from a cursor, or None if it is malformed"""
+    try:
+        timestamp, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), int(item_id)
+    except (ValueError, TypeError):
+        return None
+
+def coordinator_activity_feed(user, cursor=None, limit=5):
+    """
+    Recent registrations, feedback, payments and updates on a coordinator's
+    events, newest first.
+
+    A page is one range scan of the activity log's (coordinator, -timestamp)
+    index, however much history there is, and the cursor from one page
+    continues exactly where it stopped. Activities are written in batches,
+    so the feed can trail by up to ActivityBuffer.flush_interval seconds.
+
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    queryset = Activity.objects.filter(coordinator=user, type__in=FEED_TYPES)
+
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        timestamp, cursor_id = position
+        queryset = queryset.filter(
+            Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=cursor_id)
+        )
+
+    items = list(queryset.order_by('-timestamp', '-id').annotate(
+        event_name=F('event__event_name')
+    ).values('id', 'type', 'event_id', 'event_name', 'timestamp')[:limit + 1])
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1])
+
+    now = timezone.now()
+    return [
+        {
+            'type': FEED_TYPES[item['type']],
+            'event': item['event_name'],
+            'event_id': item['event_id'],
+            'timestamp': item['timestamp'],
+            'time': time_ago(item['timestamp'], now),
+        }
+        for item in items
+    ], next_cursor
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
+
+    def ready(self):
+        from . import cache, ratings, search
+        cache.connect_signals()
+        ratings.connect_signals()
+        search.connect_signals()
@@ -0,0 +1,189 @@
+import functools
+import hashlib
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import checks
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .models import Event, EventFeedback, EventParticipant, EventPhoto, EventTag, EventUpdate, Venue
+from .signals import event_status_changed
+
+logger = logging.getLogger(__name__)
+
+# Which cached namespaces a write to each model makes stale. Tag responses
+# embed event cards (EventTagViewSet.events), so event writes reach them too.
+INVALIDATED_BY = {
+    Event: ('events', 'tags'),
+    EventParticipant: ('events', 'tags'),
+    EventPhoto: ('events',),
+    EventUpdate: ('events',),
+    EventTag: ('events', 'tags'),
+    # Event cards carry the rating summary
+    EventFeedback: ('events', 'tags'),
+    # Venue coordinates decide which events the nearby search finds
+    Venue: ('venues', 'events'),
+}
+
+def response_caching_enabled():
+    """
+    Whether API responses may be cached. Namespace versions must live in a
+    cache every worker shares, or a write only invalidates the worker that
+    made it; a per-process locmem cache qualifies only when the server runs
+    as a single process (settings.RESPONSE_CACHE_SINGLE_PROCESS).
+    """
+    if isinstance(caches['default'], LocMemCache):
+        return getattr(settings, 'RESPONSE_CACHE_SINGLE_PROCESS', False)
+    return True
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if isinstance(caches['default'], LocMemCache):
+        return [checks.Warning(
+            "The default cache is per process (locmem), so API response caching is "
+            "off unless RESPONSE_CACHE_SINGLE_PROCESS is set.",
+            hint="Set CACHE_BACKEND=redis so every worker shares the cache.",
+            id='events.W001',
+        )]
+    return []
+
+def _version_key(namespace):
+    return f'response-version:{namespace}'
+
+def namespace_version(namespace):
+    """Current version of a namespace; bumping it orphans every cached response in it"""
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), 1, timeout=None)
+        version = cache.get(_version_key(namespace), 1)
+    return version
+
+def bump_namespace(namespace):
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        # The version expired or was evicted: start again above anything cached
+        cache.set(_version_key(namespace), 2, timeout=None)
+
+def invalidate(*namespaces):
+    """
+    Invalidate cached responses once the current transaction commits, so a
+    concurrent read cannot cache the old rows again under the new version
+    """
+    def bump():
+        for namespace in namespaces:
+            bump_namespace(namespace)
+    transaction.on_commit(bump)
+
+def request_signature(request):
+    """
+    Host, path and sorted query string of a request (the host is included
+    because pagination links are absolute)
+    """
+    query = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    )
+    return f'{request.get_host()}{request.path}?{query}'
+
+def response_cache_key(namespace, request):
+    digest = hashlib.md5(request_signature(request).encode()).hexdigest()
+    return f'response:{namespace}:v{namespace_version(namespace)}:{digest}'
+
+def cached_response(view_method):
+    """
+    Serve a viewset action from the cache.
+
+    The viewset sets ``cache_namespace`` and ``cache_timeout``. Only 200
+    responses are stored, as serialized data, so content negotiation still
+    happens per request. Writes to the models in INVALIDATED_BY drop the
+    namespace at once; the timeout bounds staleness from anything without a
+    signal, such as an event's time passing. Nothing is cached unless
+    response_caching_enabled().
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if not response_caching_enabled():
+            return view_method(self, request, *args, **kwargs)
+
+        key = response_cache_key(self.cache_namespace, request)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.cache_timeout)
+        return response
+    return wrapper
+
+def rows_state(queryset, **aggregates):
+    """Row count and max(updated_at) of a queryset, plus any extra aggregates"""
+    return queryset.order_by().aggregate(
+        count=Count('id'), last_modified=Max('updated_at'), **aggregates
+    )
+
+def conditional_response(view_method):
+    """
+    Answer If-None-Match with 304 Not Modified before any serialization.
+
+    The viewset's ``get_conditional_state()`` returns a dict of cheap
+    aggregates over the rows behind the response, including
+    ``last_modified`` (their max(updated_at)); the ETag hashes them with the
+    request signature. Only the ETag is compared: Last-Modified is sent for
+    information, but a deleted row lowers the count without moving
+    max(updated_at), so If-Modified-Since alone cannot be trusted.
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        state = self.get_conditional_state()
+        last_modified = state.get('last_modified')
+        fingerprint = f'{request_signature(request)}|{sorted(state.items())}'
+        etag = quote_etag(hashlib.md5(fingerprint.encode()).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response.headers['ETag'] = etag
+        if last_modified:
+            response.headers['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+    return wrapper
+
+def _invalidate_for_instance(sender, **kwargs):
+    invalidate(*INVALIDATED_BY[sender])
+
+def _invalidate_events(sender, **kwargs):
+    invalidate(*INVALIDATED_BY[Event])
+
+# User fields that event cards show, as the organizer name
+ORGANIZER_FIELDS = {'first_name', 'last_name', 'username'}
+
+def _invalidate_for_organizer(sender, update_fields=None, **kwargs):
+    # Saves such as the last_login update on sign in change no card
+    if update_fields and not set(update_fields) & ORGANIZER_FIELDS:
+        return
+    invalidate(*INVALIDATED_BY[Event])
+
+def connect_signals():
+    for model in INVALIDATED_BY:
+        post_save.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'cache-save-{model.__name__}')
+        post_delete.connect(_invalidate_for_instance, sender=model, dispatch_uid=f'cache-delete-{model.__name__}')
+    m2m_changed.connect(
+        _invalidate_events, sender=Event.tags.through, dispatch_uid='cache-event-tags'
+    )
+    event_status_changed.connect(_invalidate_events, dispatch_uid='cache-status-changed')
+    post_save.connect(
+        _invalidate_for_organizer, sender=get_user_model(), dispatch_uid='cache-organizer'
+    )
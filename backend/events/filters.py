@@ -0,0 +1,144 @@
+from datetime import datetime, time
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from .models import Event
+
+BOOLEAN_VALUES = {'true': True, '1': True, 'false': False, '0': False}
+
+def _boolean(params, name):
+    value = params.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        return BOOLEAN_VALUES[value.lower()]
+    except KeyError:
+        raise ValidationError({name: "Must be true or false."})
+
+def _decimal(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValidationError({name: "Must be a number."})
+
+def parse_moment(params, name, end_of_day=False):
+    """
+    A datetime, or a date meaning the start (or with end_of_day, the end)
+    of that day in the current timezone
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    # Dates are tried first: parse_datetime also accepts a bare date, as midnight
+    try:
+        day = parse_date(value)
+        moment = datetime.combine(day, time.max if end_of_day else time.min) if day else parse_datetime(value)
+    except ValueError:
+        moment = None
+    if moment is None:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD) or datetime."})
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+def filter_events(queryset, params):
+    """
+    Apply the catalogue filters in ``params`` (request query params):
+
+    tag, event_type, venue: exact values (tag is a tag slug)
+    is_paid: true/false
+    min_price, max_price: price range, inclusive
+    starts_after, starts_before: event_time window (date or datetime)
+    available: true for events with seats left, false for full events
+    """
+    tag = params.get('tag')
+    if tag:
+        queryset = queryset.filter(tags__slug=tag)
+
+    event_type = params.get('event_type')
+    if event_type:
+        queryset = queryset.filter(event_type=event_type)
+
+    venue = params.get('venue')
+    if venue:
+        queryset = queryset.filter(venue=venue)
+
+    is_paid = _boolean(params, 'is_paid')
+    if is_paid is not None:
+        queryset = queryset.filter(is_paid=is_paid)
+
+    min_price = _decimal(params, 'min_price')
+    if min_price is not None:
+        queryset = queryset.filter(price__gte=min_price)
+    max_price = _decimal(params, 'max_price')
+    if max_price is not None:
+        # Free events have no price; they are within any upper bound
+        queryset = queryset.filter(Q(price__lte=max_price) | Q(is_paid=False))
+
+    starts_after = parse_moment(params, 'starts_after')
+    if starts_after:
+        queryset = queryset.filter(event_time__gte=starts_after)
+    starts_before = parse_moment(params, 'starts_before', end_of_day=True)
+    if starts_before:
+        queryset = queryset.filter(event_time__lte=starts_before)
+
+    available = _boolean(params, 'available')
+    # Matches Event.reserve_seat: no limit, or a limit of zero or less, means unlimited
+    has_seats = (
+        Q(max_participants__isnull=True) |
+        Q(max_participants__lte=0) |
+        Q(registered_count__lt=F('max_participants'))
+    )
+    if available is True:
+        queryset = queryset.filter(has_seats)
+    elif available is False:
+        queryset = queryset.exclude(has_seats)
+
+    return queryset
+
+def event_facets(queryset):
+    """
+    Facet counts over a filtered Event queryset: one grouped query over
+    (event_type, venue, is_paid) feeds three facets, and one over the tag
+    table feeds the fourth.
+
+    Returns:
+        dict: total, event_types, venues, tags and is_paid counts
+    """
+    groups = queryset.order_by().values('event_type', 'venue', 'is_paid').annotate(count=Count('id'))
+
+    event_types, venues = {}, {}
+    paid = {'paid': 0, 'free': 0}
+    for group in groups:
+        event_types[group['event_type']] = event_types.get(group['event_type'], 0) + group['count']
+        if group['venue']:
+            venues[group['venue']] = venues.get(group['venue'], 0) + group['count']
+        paid['paid' if group['is_paid'] else 'free'] += group['count']
+
+    tags = Event.tags.through.objects.filter(
+        event_id__in=queryset.order_by().values('id')
+    ).values('eventtag__slug', 'eventtag__name').annotate(count=Count('id')).order_by('-count', 'eventtag__name')
+
+    def ranked(counts):
+        return [
+            {'value': value, 'count': count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    return {
+        'total': paid['paid'] + paid['free'],
+        'event_types': ranked(event_types),
+        'venues': ranked(venues),
+        'tags': [
+            {'slug': tag['eventtag__slug'], 'name': tag['eventtag__name'], 'count': tag['count']}
+            for tag in tags
+        ],
+        'is_paid': paid,
+    }
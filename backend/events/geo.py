@@ -0,0 +1,87 @@
+import math
+
+from django.db.models import Q
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+# Precision stored on Venue.geohash: cells of roughly 5 x 5 metres
+GEOHASH_PRECISION = 9
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Standard base32 geohash of a point"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    geohash = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(geohash) < precision:
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            bounds[0] = middle
+        else:
+            bits = bits << 1
+            bounds[1] = middle
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            geohash.append(BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(geohash)
+
+def cell_size(precision):
+    """(latitude, longitude) extent in degrees of a geohash cell"""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+def precision_for_radius(latitude, radius_km):
+    """
+    Finest precision whose cells are at least radius_km across, so the cell
+    holding a point and its eight neighbours cover the whole circle
+    """
+    lng_scale = max(math.cos(math.radians(latitude)), 0.01)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_degrees, lng_degrees = cell_size(precision)
+        if (lat_degrees * KM_PER_DEGREE >= radius_km and
+                lng_degrees * KM_PER_DEGREE * lng_scale >= radius_km):
+            return precision
+    return 1
+
+def covering_cells(latitude, longitude, radius_km):
+    """Geohash prefixes of the 3 x 3 block of cells around a point"""
+    precision = precision_for_radius(latitude, radius_km)
+    lat_degrees, lng_degrees = cell_size(precision)
+    cells = set()
+    for lat_step in (-1, 0, 1):
+        for lng_step in (-1, 0, 1):
+            lat = min(max(latitude + lat_step * lat_degrees, -90.0), 90.0)
+            lng = (longitude + lng_step * lng_degrees + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(lat, lng, precision))
+    return sorted(cells)
+
+def prefix_filter(field, prefixes):
+    """
+    Q matching values of ``field`` that start with any of ``prefixes``. Each
+    LIKE 'prefix%' is a range scan of an index on the field and, unlike a
+    hand-built upper bound, follows the column's collation.
+    """
+    condition = Q()
+    for prefix in prefixes:
+        condition |= Q(**{f'{field}__startswith': prefix})
+    return condition
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two points in kilometres"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from events.recommendations import BATCH_SIZE, TOP_K, build_recommendations
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Precompute the related events list of every event (needs numpy)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=TOP_K,
+            help=f'Similar events kept per event (default {TOP_K})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help=f'Events scored per batch (default {BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Meant to be scheduled, e.g. nightly; events created in between are
+        served by the live fallback in events.recommendations.related_events
+        """
+        start_time = timezone.now()
+        try:
+            written = build_recommendations(
+                top_k=max(options['top_k'], 1),
+                batch_size=max(options['batch_size'], 1)
+            )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        duration = (timezone.now() - start_time).total_seconds()
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} event similarities in {duration:.2f} seconds")
+        )
+        logger.info(f"Wrote {written} event similarities")
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from events.ratings import recompute_rating_stats
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Rebuild the events\' rating statistics from their feedback, e.g. after bulk imports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'event_ids',
+            nargs='*',
+            type=int,
+            help='Events to rebuild (default: all)',
+        )
+
+    def handle(self, *args, **options):
+        start_time = timezone.now()
+        rated = recompute_rating_stats(options['event_ids'] or None)
+
+        duration = (timezone.now() - start_time).total_seconds()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt rating statistics, {rated} events with feedback, in {duration:.2f} seconds")
+        )
+        logger.info(f"Rating statistics rebuilt; {rated} events have feedback")
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from events.search import rebuild_search_index
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Rebuild the event search index, e.g. after changing the field weights'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of events reindexed per transaction (default 500)',
+        )
+
+    def handle(self, *args, **options):
+        start_time = timezone.now()
+        indexed = rebuild_search_index(batch_size=max(options['batch_size'], 1))
+
+        duration = (timezone.now() - start_time).total_seconds()
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} events in {duration:.2f} seconds")
+        )
+        logger.info(f"Search index rebuilt for {indexed} events")
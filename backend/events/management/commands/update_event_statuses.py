@@ -2,37 +2,103 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from events.models import Event
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = 'Update event statuses for past events (upcoming → completed)'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running, sleeping until the next event starts between sweeps',
+        )
+        parser.add_argument(
+            '--max-sleep',
+            type=int,
+            default=300,
+            help='Longest time in seconds to sleep in --loop mode, so newly created events are picked up',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of events moved to completed per UPDATE statement',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report how many events would be updated without changing them',
+        )
+
     def handle(self, *args, **options):
         """
         This command checks all upcoming events and updates them to 'completed'
-        if their scheduled time has passed.
+        if their scheduled time has passed. With --loop it runs as the status
+        scheduler, waking up at each event_time boundary.
+        """
+        self.batch_size = max(options['batch_size'], 1)
+        self.dry_run = options['dry_run']
+
+        if not options['loop']:
+            self.sweep()
+            return
+
+        max_sleep = max(options['max_sleep'], 1)
+        self.stdout.write(f"Starting event status scheduler (max sleep {max_sleep}s)")
+        try:
+            while True:
+                self.sweep()
+                time.sleep(self.seconds_until_next_transition(max_sleep))
+        except KeyboardInterrupt:
+            self.stdout.write("Event status scheduler stopped")
+
+    def seconds_until_next_transition(self, max_sleep):
+        """
+        Seconds until the next upcoming event starts, capped at max_sleep
         """
+        try:
+            next_transition = Event.next_status_transition()
+        except Exception as e:
+            logger.error(f"Error finding next event status transition: {str(e)}")
+            return max_sleep
+
+        if next_transition is None:
+            return max_sleep
+
+        # Wake just after the boundary so the event is strictly in the past
+        delay = (next_transition - timezone.now()).total_seconds() + 1
+        return min(max(delay, 1), max_sleep)
+
+    def sweep(self):
         start_time = timezone.now()
         self.stdout.write(f"Starting event status update at {start_time}")
-        
+
         try:
             # Use the classmethod we defined in the Event model
-            updated_count = Event.update_all_past_events()
-            
+            updated_count = Event.update_all_past_events(
+                batch_size=self.batch_size, dry_run=self.dry_run
+            )
+
             end_time = timezone.now()
             duration = (end_time - start_time).total_seconds()
-            
+
+            if self.dry_run:
+                self.stdout.write(f"Dry run: {updated_count} events would be updated from 'upcoming' to 'completed'")
+                return
+
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully updated {updated_count} events from 'upcoming' to 'completed' in {duration:.2f} seconds"
                 )
             )
-            
+
             logger.info(f"Updated {updated_count} event statuses from 'upcoming' to 'completed'")
-            
+
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f"Error updating event statuses: {str(e)}")
             )
-            logger.error(f"Error updating event statuses: {str(e)}") 
\ No newline at end of file
+            logger.error(f"Error updating event statuses: {str(e)}")
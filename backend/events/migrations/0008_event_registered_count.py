@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_registered_count(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventParticipant = apps.get_model('events', 'EventParticipant')
+
+    active_counts = EventParticipant.objects.filter(
+        event=OuterRef('pk'),
+        status__in=['registered', 'attended']
+    ).order_by().values('event').annotate(count=Count('id')).values('count')
+
+    Event.objects.update(
+        registered_count=Coalesce(Subquery(active_counts), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_event_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='registered_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_registered_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_daily_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventtag',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:22
+
+import re
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# A copy of events.search as of this migration, so later changes to the
+# live tokeniser cannot change what this backfill does
+FIELD_WEIGHTS = {
+    'event_name': 8,
+    'tags': 5,
+    'event_type': 4,
+    'venue': 3,
+    'audience': 2,
+    'description': 1,
+}
+MAX_TERM_LENGTH = 64
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in re.findall(r'\w+', text.lower())
+        if len(token) > 1
+    ]
+
+
+def event_terms(event, tag_names):
+    terms = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        text = ' '.join(tag_names) if field == 'tags' else getattr(event, field)
+        for term in set(tokenize(text)):
+            terms[term] += weight
+    return terms
+
+
+def build_search_index(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventSearchTerm = apps.get_model('events', 'EventSearchTerm')
+
+    for event in Event.objects.prefetch_related('tags').iterator(chunk_size=500):
+        EventSearchTerm.objects.bulk_create([
+            EventSearchTerm(event=event, term=term, weight=weight)
+            for term, weight in event_terms(event, [tag.name for tag in event.tags.all()]).items()
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_eventtag_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='events.event')),
+            ],
+            options={
+                'unique_together': {('term', 'event')},
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
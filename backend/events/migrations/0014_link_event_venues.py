@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:30
+
+from django.db import migrations
+
+
+def link_event_venues(apps, schema_editor):
+    Venue = apps.get_model('events', 'Venue')
+    Event = apps.get_model('events', 'Event')
+
+    # Match the free-text venue names of existing events to Venue records
+    for venue_id, name in Venue.objects.values_list('id', 'name'):
+        Event.objects.filter(
+            linked_venue__isnull=True, venue__iexact=name.strip()
+        ).update(linked_venue=venue_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_venue_location'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_event_venues, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:34
+
+from django.db import migrations, models
+
+
+def backfill_rating_stats(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventFeedback = apps.get_model('events', 'EventFeedback')
+
+    stats = {}
+    grouped = EventFeedback.objects.values('event_id', 'rating').annotate(count=models.Count('id')).order_by()
+    for row in grouped:
+        event_stats = stats.setdefault(row['event_id'], {'rating_count': 0, 'rating_sum': 0})
+        event_stats['rating_count'] += row['count']
+        event_stats['rating_sum'] += row['count'] * row['rating']
+        event_stats[f"rating_{row['rating']}"] = row['count']
+
+    for event_id, event_stats in stats.items():
+        Event.objects.filter(id=event_id).update(**event_stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_eventsimilarity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='rating_1',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_2',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_3',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_4',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_5',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0016_event_rating_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventfeedback',
+            index=models.Index(fields=['event', '-created_at'], name='feedback_event_time_idx'),
+        ),
+    ]
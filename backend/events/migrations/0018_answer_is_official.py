@@ -0,0 +1,33 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_is_official(apps, schema_editor):
+    EventAnswer = apps.get_model('events', 'EventAnswer')
+    EventAnswer.objects.filter(
+        models.Q(user__user_role='admin') | models.Q(user=models.F('question__event__created_by'))
+    ).update(is_official=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0017_feedback_event_time_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('users', '0007_user_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventanswer',
+            name='is_official',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='eventquestion',
+            index=models.Index(fields=['event', '-created_at'], name='question_event_time_idx'),
+        ),
+        migrations.RunPython(backfill_is_official, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,13 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import F, Prefetch, Q, Sum
+
+from .geo import encode_geohash
+from .signals import event_status_changed
+
+# Participant statuses that occupy a seat at an event
+ACTIVE_PARTICIPANT_STATUSES = ['registered', 'attended']
 
 class CoordinatorRequest(models.Model):
     STATUS_CHOICES = [
@@ -19,6 +25,7 @@ class CoordinatorRequest(models.Model):
 class EventTag(models.Model):
     name = models.CharField(max_length=50, unique=True)
     slug = models.SlugField(unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.name
@@ -32,15 +39,54 @@ class Venue(models.Model):
     description = models.TextField()
     image_url = models.URLField(max_length=1000)
     features = models.JSONField(default=list)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    # Derived from latitude/longitude on save; indexed for "near me" lookups
+    geohash = models.CharField(max_length=12, blank=True, default='', editable=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(float(self.latitude), float(self.longitude))
+        else:
+            self.geohash = ''
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'geohash'}
+        super().save(*args, **kwargs)
         
     class Meta:
         ordering = ['name']
 
+class EventQuerySet(models.QuerySet):
+    def with_revenue(self):
+        """
+        Annotate each event with the sum of its completed payments
+        """
+        return self.annotate(
+            revenue=Sum(
+                'payments__amount',
+                filter=Q(payments__payment_status='completed'),
+                default=0
+            )
+        )
+
+    def for_serializer(self, expand=('photos', 'participants', 'updates')):
+        """
+        Load everything the event serializers read in a fixed number of queries.
+        ``expand`` lists the nested relations to prefetch; card listings pass
+        only the ones the client asked for.
+        """
+        return self.select_related(
+            'created_by'
+        ).prefetch_related(
+            'tags', *expand
+        )
+
 class Event(models.Model):
     STATUS_CHOICES = [
         ('upcoming', 'Upcoming'),
@@ -58,11 +104,30 @@ class Event(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     event_time = models.DateTimeField()
     venue = models.CharField(max_length=255, null=True, blank=True)
+    # The Venue record behind the venue name, when there is one
+    linked_venue = models.ForeignKey(
+        Venue, on_delete=models.SET_NULL, null=True, blank=True, related_name='events'
+    )
     max_participants = models.IntegerField(null=True, blank=True)
     rsvp_required = models.BooleanField(default=False)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='upcoming')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    # Denormalised count of active (registered or attended) participants.
+    # Only change it through reserve_seat() and release_seat().
+    registered_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Denormalised statistics of the event's feedback ratings: how many,
+    # their sum and how many of each star. events.ratings keeps them in step
+    # with feedback saves and deletes through apply_rating().
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_1 = models.PositiveIntegerField(default=0, editable=False)
+    rating_2 = models.PositiveIntegerField(default=0, editable=False)
+    rating_3 = models.PositiveIntegerField(default=0, editable=False)
+    rating_4 = models.PositiveIntegerField(default=0, editable=False)
+    rating_5 = models.PositiveIntegerField(default=0, editable=False)
     
     # Organizer fields
     organizer_info = models.TextField(blank=True, null=True, help_text="Additional information about the event organizer")
@@ -73,42 +138,183 @@ class Event(models.Model):
 
     tags = models.ManyToManyField(EventTag, blank=True, related_name='events')
 
+    objects = EventQuerySet.as_manager()
+
     def __str__(self):
         return self.event_name
-        
-    def update_status_based_on_time(self):
+
+    def save(self, *args, **kwargs):
+        # Keep linked_venue in step with the venue name, clearing it when the
+        # name no longer names a Venue
+        if kwargs.get('update_fields') is None:
+            venue_id = None
+            if self.venue and self.venue.strip():
+                venue_id = Venue.objects.filter(name__iexact=self.venue.strip()).values_list('id', flat=True).first()
+            self.linked_venue_id = venue_id
+        super().save(*args, **kwargs)
+
+    @property
+    def spots_remaining(self):
+        """Seats left, or None when the event has no capacity limit"""
+        if not self.max_participants or self.max_participants <= 0:
+            return None
+        return max(self.max_participants - self.registered_count, 0)
+
+    @property
+    def is_full(self):
+        return self.spots_remaining == 0
+
+    @classmethod
+    def reserve_seat(cls, event_id):
         """
-        Check if event time has passed and update status to 'completed'
-        if the event was 'upcoming'
+        Take one seat with a single conditional UPDATE, so concurrent
+        registrations can never push registered_count past max_participants.
+        Returns True if a seat was taken.
         """
-        now = timezone.now()
-        
-        if self.status == 'upcoming' and self.event_time < now:
-            self.status = 'completed'
-            self.save(update_fields=['status'])
-            return True
-        return False
+        return cls.objects.filter(id=event_id).filter(
+            Q(max_participants__isnull=True) |
+            Q(max_participants__lte=0) |
+            Q(registered_count__lt=F('max_participants'))
+        ).update(registered_count=F('registered_count') + 1) == 1
+
+    @classmethod
+    def release_seat(cls, event_id):
+        """
+        Give back one seat taken with reserve_seat()
+        """
+        cls.objects.filter(id=event_id, registered_count__gt=0).update(
+            registered_count=F('registered_count') - 1
+        )
+
+    @classmethod
+    def apply_rating(cls, event_id, added=None, removed=None):
+        """
+        Fold one feedback change into the rating statistics with a single
+        UPDATE, so concurrent feedback cannot lose counts. Pass ``added`` for
+        a new rating, ``removed`` for a deleted one, and both for an edit.
+        """
+        changes = {}
+        for rating, step in ((added, 1), (removed, -1)):
+            if rating is None:
+                continue
+            changes[f'rating_{rating}'] = changes.get(f'rating_{rating}', 0) + step
+            changes['rating_count'] = changes.get('rating_count', 0) + step
+            changes['rating_sum'] = changes.get('rating_sum', 0) + step * rating
+
+        changes = {field: F(field) + step for field, step in changes.items() if step}
+        if changes:
+            cls.objects.filter(id=event_id).update(**changes)
+
+    @property
+    def rating_average(self):
+        """Mean feedback rating to one decimal, or None without feedback"""
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 1)
+
+    @property
+    def rating_histogram(self):
+        """Number of ratings of each star, keyed 1 to 5"""
+        return {stars: getattr(self, f'rating_{stars}') for stars in range(1, 6)}
+
+    @property
+    def rating_summary(self):
+        return {
+            'average': self.rating_average,
+            'count': self.rating_count,
+            'histogram': self.rating_histogram,
+        }
+
+    @property
+    def effective_status(self):
+        """
+        Status as seen by readers. An 'upcoming' event whose time has passed
+        reads as 'completed' even before the status sweeper has persisted it.
+        """
+        if self.status == 'upcoming' and self.event_time < timezone.now():
+            return 'completed'
+        return self.status
+
+    @staticmethod
+    def effective_status_q(status, now=None):
+        """
+        Q matching the events whose effective_status is ``status``, so
+        counts in queries agree with what the event cards show
+        """
+        now = now or timezone.now()
+        if status == 'upcoming':
+            return Q(status='upcoming', event_time__gte=now)
+        if status == 'completed':
+            return Q(status='completed') | Q(status='upcoming', event_time__lt=now)
+        return Q(status=status)
         
     @classmethod
-    def update_all_past_events(cls):
+    def update_all_past_events(cls, batch_size=1000, dry_run=False):
         """
-        Update status for all upcoming events that have passed
+        Update status for all upcoming events that have passed.
+
+        Events are moved to 'completed' with one UPDATE per batch of
+        ``batch_size`` ids, each in its own short transaction, and
+        ``event_status_changed`` is sent once per batch. Returns the number
+        of events updated, or that would be updated when ``dry_run`` is set.
         """
         now = timezone.now()
         past_events = cls.objects.filter(
             Q(status='upcoming') & Q(event_time__lt=now)
         )
-        
+
+        if dry_run:
+            return past_events.count()
+
         updated_count = 0
-        for event in past_events:
-            event.status = 'completed'
-            event.save(update_fields=['status'])
-            updated_count += 1
+        last_id = 0
+        while True:
+            batch_ids = list(
+                past_events.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not batch_ids:
+                break
+            last_id = batch_ids[-1]
+
+            with transaction.atomic():
+                # Lock the events still upcoming, so the signal names exactly
+                # the ones this run moved and not those a concurrent run or a
+                # manual change already did
+                changed_ids = list(cls.objects.select_for_update().filter(
+                    id__in=batch_ids, status='upcoming'
+                ).values_list('id', flat=True))
+                if changed_ids:
+                    cls.objects.filter(id__in=changed_ids).update(status='completed', updated_at=now)
+
+            if changed_ids:
+                event_status_changed.send(
+                    sender=cls,
+                    event_ids=changed_ids,
+                    old_status='upcoming',
+                    new_status='completed'
+                )
+            updated_count += len(changed_ids)
             
         return updated_count
 
+    @classmethod
+    def next_status_transition(cls):
+        """
+        Return the event_time of the next upcoming event to start, i.e. the
+        next moment update_all_past_events() will have work to do
+        """
+        return cls.objects.filter(
+            status='upcoming', event_time__gte=timezone.now()
+        ).order_by('event_time').values_list('event_time', flat=True).first()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'event_time'], name='event_status_time_idx'),
+            models.Index(fields=['created_by', 'event_time'], name='event_creator_time_idx'),
+            models.Index(fields=['event_type', 'status', 'event_time'], name='event_type_status_time_idx'),
+            models.Index(fields=['linked_venue', 'event_time'], name='event_venue_time_idx'),
+        ]
 
 def event_photo_path(instance, filename):
     # Generate file path: event_photos/event_id/filename
@@ -131,6 +337,34 @@ class EventParticipant(models.Model):
     registered_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='registered')
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['event', 'status'], name='participant_event_status_idx'),
+            models.Index(fields=['event', 'user'], name='participant_event_user_idx'),
+        ]
+
+class EventWaitlistEntry(models.Model):
+    STATUS_CHOICES = [
+        ('waiting', 'Waiting'),
+        ('promoted', 'Promoted'),
+        ('left', 'Left')
+    ]
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='waitlist')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='waiting')
+    # Not auto_now_add: rejoining after leaving moves the user to the back of the queue
+    joined_at = models.DateTimeField(default=timezone.now)
+    promoted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('event', 'user')
+        ordering = ['joined_at', 'id']
+        indexes = [
+            # FIFO scan of waiting users and position lookups
+            models.Index(fields=['event', 'status', 'joined_at', 'id'], name='waitlist_event_queue_idx'),
+        ]
+
 class EventUpdate(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='updates')
     sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -153,11 +387,26 @@ class EventFeedback(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_anonymous = models.BooleanField(default=False)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored rating, so a save can move the event's rating
+        # statistics from it (see events.ratings)
+        if 'rating' in field_names and 'event_id' in field_names:
+            instance._loaded_rating = (
+                values[field_names.index('event_id')], values[field_names.index('rating')]
+            )
+        return instance
     
     class Meta:
         # Ensure a user can only give one feedback per event
         unique_together = ('event', 'user')
         ordering = ['-created_at']
+        indexes = [
+            # An event's reviews, newest first
+            models.Index(fields=['event', '-created_at'], name='feedback_event_time_idx'),
+        ]
 
 class EventBookmark(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='bookmarks')
@@ -169,6 +418,16 @@ class EventBookmark(models.Model):
         unique_together = ('event', 'user')  # Prevent duplicate bookmarks
         ordering = ['-created_at']
 
+class EventQuestionQuerySet(models.QuerySet):
+    def with_thread(self):
+        """
+        Load the askers, answers and answerers the Q&A serializers read, in
+        three queries however many questions and answers there are
+        """
+        return self.select_related('user').prefetch_related(
+            Prefetch('answers', queryset=EventAnswer.objects.select_related('user'))
+        )
+
 class EventQuestion(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='questions')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -176,9 +435,15 @@ class EventQuestion(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_answered = models.BooleanField(default=False)
+
+    objects = EventQuestionQuerySet.as_manager()
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # An event's questions, newest first
+            models.Index(fields=['event', '-created_at'], name='question_event_time_idx'),
+        ]
 
 class EventAnswer(models.Model):
     question = models.ForeignKey(EventQuestion, on_delete=models.CASCADE, related_name='answers')
@@ -186,6 +451,70 @@ class EventAnswer(models.Model):
     answer = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Set when the answer is written: whether it speaks for the event
+    is_official = models.BooleanField(default=False, editable=False)
     
     class Meta:
         ordering = ['created_at']
+
+    @staticmethod
+    def answers_officially(user, event):
+        """Admins and the event's creator answer on the event's behalf"""
+        return user.user_role == 'admin' or user.id == event.created_by_id
+
+class DailyEventRollup(models.Model):
+    """
+    Daily fact table for the admin and coordinator analytics, one row per
+    day, coordinator, event type and venue. Rebuilt by the build_rollups
+    management command (see events.rollups).
+    """
+    date = models.DateField()
+    coordinator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='daily_rollups')
+    event_type = models.CharField(max_length=100)
+    venue = models.CharField(max_length=255, blank=True, default='')
+    events_created = models.PositiveIntegerField(default=0)
+    registrations = models.PositiveIntegerField(default=0)
+    payments_completed = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        unique_together = ('date', 'coordinator', 'event_type', 'venue')
+        indexes = [
+            models.Index(fields=['coordinator', 'date'], name='rollup_coordinator_date_idx'),
+        ]
+
+class DailySignupRollup(models.Model):
+    """
+    Number of users who signed up on each day
+    """
+    date = models.DateField(unique=True)
+    new_users = models.PositiveIntegerField(default=0)
+
+class EventSearchTerm(models.Model):
+    """
+    Inverted index for event search: one row per distinct term of an event
+    with the summed weight of the fields it appears in. Maintained on save
+    by events.search.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='search_terms')
+    term = models.CharField(max_length=64)
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        # Term first, so prefix lookups are a range scan of the unique index
+        unique_together = ('term', 'event')
+
+class EventSimilarity(models.Model):
+    """
+    Precomputed "related events" list: the most similar upcoming events for
+    each event, best first. Rebuilt by the build_recommendations command
+    (see events.recommendations).
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='similarities')
+    similar_event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ('event', 'rank')
+        ordering = ['event', 'rank']
@@ -0,0 +1,111 @@
+from django.db.models import F
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination for event listings.
+
+    The cursor encodes the position of the last row returned, so a deep page
+    costs the same as the first one and stays stable while events are added.
+    Clients may switch to chronological order with ?ordering=event_time.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+    ordering_param = 'ordering'
+
+    # Orderings a client is allowed to request, keyed by the ?ordering= value
+    orderings = {
+        'created_at': ('-created_at', '-id'),
+        'event_time': ('event_time', 'id'),
+    }
+
+    def get_ordering(self, request, queryset, view):
+        return self.orderings.get(
+            request.query_params.get(self.ordering_param), self.ordering
+        )
+
+
+class CoordinatorEventCursorPagination(EventCursorPagination):
+    """
+    Keyset pagination for a coordinator's own events, soonest first
+    """
+    ordering = ('event_time', 'id')
+
+
+class NearbyEventCursorPagination(EventCursorPagination):
+    """
+    Keyset pagination for nearby events, soonest first
+    """
+    ordering = ('event_time', 'id')
+    orderings = {}
+
+
+class SearchCursorPagination(EventCursorPagination):
+    """
+    Keyset pagination for search results, best match first
+    """
+    ordering = ('-search_rank', '-id')
+    orderings = {}
+
+
+class ParticipantCursorPagination(CursorPagination):
+    """
+    Keyset pagination for a user's registrations, newest first
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-registered_at', '-id')
+
+
+class FeedbackCursorPagination(CursorPagination):
+    """
+    Keyset pagination for an event's feedback. Clients pick the order with
+    ?sort=newest (default), highest or lowest; rating sorts show the newest
+    reviews first within each star.
+
+    A cursor keys on the first ordering field alone and steps over rows that
+    tie on it by offset, which stops working past offset_cutoff ties. The
+    rating sorts therefore key on a rank that folds the id in
+    (rating * RANK_SPAN +/- id), ordering exactly as ('-rating', '-id') but
+    never tying; that holds while ids stay below RANK_SPAN.
+    """
+    RANK_SPAN = 10 ** 12
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+    ordering_param = 'sort'
+
+    orderings = {
+        'newest': ('-created_at', '-id'),
+        'highest': ('-rating_rank_high',),
+        'lowest': ('rating_rank_low',),
+    }
+
+    def get_ordering(self, request, queryset, view):
+        return self.orderings.get(
+            request.query_params.get(self.ordering_param), self.ordering
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = queryset.annotate(
+            rating_rank_high=F('rating') * self.RANK_SPAN + F('id'),
+            rating_rank_low=F('rating') * self.RANK_SPAN - F('id'),
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+
+class QuestionCursorPagination(CursorPagination):
+    """
+    Keyset pagination for an event's Q&A, newest question first; each
+    question comes with all of its answers
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_save
+
+from .models import Event, EventFeedback
+
+def recompute_rating_stats(event_ids=None):
+    """
+    Rebuild the rating statistics of the given events (default: all) from
+    their feedback, for repairs after bulk writes that send no signals.
+
+    Returns:
+        int: Number of events that have feedback
+    """
+    events = Event.objects.all() if event_ids is None else Event.objects.filter(id__in=event_ids)
+    stats = {}
+    grouped = EventFeedback.objects.filter(event__in=events).values(
+        'event_id', 'rating'
+    ).annotate(count=Count('id')).order_by()
+    for row in grouped:
+        event_stats = stats.setdefault(row['event_id'], {'rating_count': 0, 'rating_sum': 0})
+        event_stats['rating_count'] += row['count']
+        event_stats['rating_sum'] += row['count'] * row['rating']
+        event_stats[f"rating_{row['rating']}"] = row['count']
+
+    with transaction.atomic():
+        events.update(rating_count=0, rating_sum=0, **{f'rating_{stars}': 0 for stars in range(1, 6)})
+        for event_id, event_stats in stats.items():
+            Event.objects.filter(id=event_id).update(**event_stats)
+    return len(stats)
+
+def _rate_saved_feedback(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_rating', None)
+    if created:
+        Event.apply_rating(instance.event_id, added=instance.rating)
+    elif loaded is None:
+        # Saved without being loaded, so the rating it replaced is unknown
+        recompute_rating_stats([instance.event_id])
+    elif loaded != (instance.event_id, instance.rating):
+        Event.apply_rating(loaded[0], removed=loaded[1])
+        Event.apply_rating(instance.event_id, added=instance.rating)
+    instance._loaded_rating = (instance.event_id, instance.rating)
+
+def _unrate_deleted_feedback(sender, instance, **kwargs):
+    event_id, rating = getattr(instance, '_loaded_rating', None) or (instance.event_id, instance.rating)
+    Event.apply_rating(event_id, removed=rating)
+
+def connect_signals():
+    # Every path that saves or deletes feedback one row at a time (the API,
+    # the admin, cascades from deleted users) keeps the statistics in step;
+    # bulk writes do not, and need recompute_rating_stats()
+    post_save.connect(_rate_saved_feedback, sender=EventFeedback, dispatch_uid='ratings-feedback-save')
+    post_delete.connect(_unrate_deleted_feedback, sender=EventFeedback, dispatch_uid='ratings-feedback-delete')
@@ -0,0 +1,175 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import ACTIVE_PARTICIPANT_STATUSES, Event, EventBookmark, EventParticipant, EventSimilarity
+
+logger = logging.getLogger(__name__)
+
+# How much each signal contributes to the similarity of two events. Each
+# signal is in [0, 1]: tag Jaccard, and cosine similarity of the sets of
+# users who registered for or bookmarked the events.
+SIGNAL_WEIGHTS = {
+    'tags': 0.5,
+    'registrations': 0.3,
+    'bookmarks': 0.2,
+}
+# Small enough that any shared tag or audience outranks a bare type match
+SAME_TYPE_BONUS = 0.05
+
+TOP_K = 20
+BATCH_SIZE = 256
+
+def _cooccurrence(model, reverse_name, batch_ids, **filters):
+    """
+    Users shared between each event of the batch and every other event,
+    counted by the database with a self-join through the user
+
+    Returns:
+        list: (event_id, other_event_id, shared_users) triplets
+    """
+    other_filters = {f'user__{reverse_name}__{name}': value for name, value in filters.items()}
+    return list(
+        model.objects.filter(event_id__in=batch_ids, **filters, **other_filters).annotate(
+            other_event_id=F(f'user__{reverse_name}__event_id')
+        ).exclude(
+            other_event_id=F('event_id')
+        ).values('event_id', 'other_event_id').annotate(
+            shared=Count('id')
+        ).order_by().values_list('event_id', 'other_event_id', 'shared')
+    )
+
+def build_recommendations(top_k=TOP_K, batch_size=BATCH_SIZE):
+    """
+    Recompute the EventSimilarity lists of every event.
+
+    For a batch of events at a time the scores against all upcoming events
+    are a dense NumPy block: tag Jaccard comes from a product of the binary
+    event x tag matrix, and the registration and bookmark co-occurrence
+    (sparse, as triplets from the database) is scattered into it. The top
+    ``top_k`` per row are kept with argpartition.
+
+    Returns:
+        int: Number of similarity rows written
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError("Building recommendations requires numpy (pip install numpy)")
+
+    now = timezone.now()
+    events = list(Event.objects.order_by('id').values_list(
+        'id', 'event_type', 'registered_count', 'status', 'event_time'
+    ))
+    if not events:
+        return 0
+
+    ids = np.array([event[0] for event in events])
+    position = {event_id: index for index, event_id in enumerate(ids.tolist())}
+    event_types = np.array([event[1] or '' for event in events], dtype=object)
+    registrations = np.array([event[2] for event in events], dtype=np.float32)
+    candidates = np.array([event[3] == 'upcoming' and event[4] >= now for event in events])
+
+    bookmark_counts = np.zeros(len(events), dtype=np.float32)
+    for event_id, count in EventBookmark.objects.values('event_id').annotate(count=Count('id')).values_list('event_id', 'count'):
+        bookmark_counts[position[event_id]] = count
+
+    # Binary event x tag matrix; the tag vocabulary is small
+    tag_links = list(Event.tags.through.objects.values_list('event_id', 'eventtag_id'))
+    tag_columns = {tag_id: index for index, tag_id in enumerate(sorted({tag_id for _, tag_id in tag_links}))}
+    tags = np.zeros((len(events), max(len(tag_columns), 1)), dtype=np.float32)
+    for event_id, tag_id in tag_links:
+        tags[position[event_id], tag_columns[tag_id]] = 1
+    tag_counts = tags.sum(axis=1)
+
+    def scatter(scores, triplets, counts, weight, offset):
+        if not triplets:
+            return
+        rows, columns, shared = (np.array(values) for values in zip(*triplets))
+        rows = np.array([position[event_id] for event_id in rows.tolist()]) - offset
+        columns = np.array([position[event_id] for event_id in columns.tolist()])
+        norms = np.sqrt(counts[rows + offset] * counts[columns])
+        np.add.at(scores, (rows, columns), weight * shared / np.maximum(norms, 1))
+
+    written = 0
+    for start in range(0, len(events), batch_size):
+        batch = slice(start, start + batch_size)
+        batch_ids = ids[batch].tolist()
+
+        # Tag Jaccard: |A & B| / (|A| + |B| - |A & B|)
+        shared_tags = tags[batch] @ tags.T
+        union = tag_counts[batch, None] + tag_counts[None, :] - shared_tags
+        scores = SIGNAL_WEIGHTS['tags'] * np.divide(
+            shared_tags, union, out=np.zeros_like(shared_tags), where=union > 0
+        )
+
+        scatter(
+            scores,
+            _cooccurrence(EventParticipant, 'eventparticipant', batch_ids, status__in=ACTIVE_PARTICIPANT_STATUSES),
+            registrations, SIGNAL_WEIGHTS['registrations'], start
+        )
+        scatter(
+            scores,
+            _cooccurrence(EventBookmark, 'eventbookmark', batch_ids),
+            bookmark_counts, SIGNAL_WEIGHTS['bookmarks'], start
+        )
+
+        scores += SAME_TYPE_BONUS * (event_types[batch, None] == event_types[None, :])
+        scores[:, ~candidates] = 0
+        rows = np.arange(scores.shape[0])
+        scores[rows, rows + start] = 0
+
+        k = min(top_k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        similarities = []
+        for row, event_id in enumerate(batch_ids):
+            best = top[row][np.argsort(-scores[row, top[row]], kind='stable')]
+            best = [column for column in best.tolist() if scores[row, column] > 0]
+            similarities.extend(
+                EventSimilarity(
+                    event_id=event_id,
+                    similar_event_id=int(ids[column]),
+                    rank=rank,
+                    score=float(scores[row, column])
+                )
+                for rank, column in enumerate(best, start=1)
+            )
+
+        with transaction.atomic():
+            EventSimilarity.objects.filter(event_id__in=batch_ids).delete()
+            EventSimilarity.objects.bulk_create(similarities, batch_size=1000)
+        written += len(similarities)
+
+    logger.info(f"Built {written} event similarities for {len(events)} events")
+    return written
+
+def related_events(event, queryset, limit=3):
+    """
+    Up to ``limit`` upcoming events related to ``event``, best first.
+
+    Reads the precomputed similarity list (one indexed lookup). Events
+    without one yet, such as ones created since the last build, fall back
+    to upcoming events ranked by shared tags, then same type.
+    """
+    now = timezone.now()
+    similar_ids = list(EventSimilarity.objects.filter(
+        event=event,
+        similar_event__status='upcoming',
+        similar_event__event_time__gte=now
+    ).order_by('rank').values_list('similar_event_id', flat=True)[:limit])
+
+    if similar_ids:
+        by_id = {related.id: related for related in queryset.filter(id__in=similar_ids)}
+        return [by_id[event_id] for event_id in similar_ids if event_id in by_id]
+
+    tag_ids = list(event.tags.values_list('id', flat=True))
+    return list(queryset.filter(
+        Q(tags__in=tag_ids) | Q(event_type=event.event_type),
+        status='upcoming',
+        event_time__gte=now
+    ).exclude(id=event.id).annotate(
+        shared_tags=Count('tags', filter=Q(tags__in=tag_ids), distinct=True)
+    ).order_by('-shared_tags', 'event_time')[:limit])
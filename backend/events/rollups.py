@@ -0,0 +1,122 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from payments.models import Payment
+from .models import DailyEventRollup, DailySignupRollup, Event, EventParticipant
+
+logger = logging.getLogger(__name__)
+
+def day_bounds(start_date, end_date):
+    """Aware datetimes covering start_date 00:00 up to (not including) the day after end_date"""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(start_date, time.min), tz) if start_date else None
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    return start, end
+
+def _daily_rows(queryset, time_field, event_path, **aggregates):
+    """
+    Group a queryset by day and the rollup dimensions of its event
+    """
+    prefix = f'{event_path}__' if event_path else ''
+    return queryset.annotate(
+        day=TruncDate(time_field),
+        dim_coordinator=F(f'{prefix}created_by'),
+        dim_event_type=F(f'{prefix}event_type'),
+        dim_venue=F(f'{prefix}venue'),
+    ).values('day', 'dim_coordinator', 'dim_event_type', 'dim_venue').annotate(**aggregates).order_by()
+
+def rebuild_daily_rollups(start_date=None, end_date=None):
+    """
+    Recompute the rollup rows for every day from start_date to end_date
+    (inclusive) from the raw Event, EventParticipant, Payment and User rows.
+
+    Days in the range are replaced in one transaction, so the command can be
+    re-run over the same days safely. With no start_date everything is
+    rebuilt.
+
+    Returns:
+        int: Number of DailyEventRollup rows written
+    """
+    end_date = end_date or timezone.localdate()
+    start, end = day_bounds(start_date, end_date)
+
+    def in_range(queryset, field):
+        queryset = queryset.filter(**{f'{field}__lt': end})
+        if start:
+            queryset = queryset.filter(**{f'{field}__gte': start})
+        return queryset
+
+    facts = defaultdict(lambda: {
+        'events_created': 0, 'registrations': 0, 'payments_completed': 0, 'revenue': Decimal('0')
+    })
+
+    def add(rows, measures):
+        for row in rows:
+            key = (row['day'], row['dim_coordinator'], row['dim_event_type'], row['dim_venue'] or '')
+            for measure, column in measures.items():
+                facts[key][measure] += row[column] or 0
+
+    add(
+        _daily_rows(in_range(Event.objects.all(), 'created_at'), 'created_at', None, count=Count('id')),
+        {'events_created': 'count'}
+    )
+    add(
+        _daily_rows(in_range(EventParticipant.objects.all(), 'registered_at'), 'registered_at', 'event', count=Count('id')),
+        {'registrations': 'count'}
+    )
+    add(
+        _daily_rows(
+            in_range(Payment.objects.filter(payment_status='completed'), 'created_at'),
+            'created_at', 'event', count=Count('id'), amount=Sum('amount')
+        ),
+        {'payments_completed': 'count', 'revenue': 'amount'}
+    )
+
+    signups = in_range(get_user_model().objects.all(), 'created_at').annotate(
+        day=TruncDate('created_at')
+    ).values('day').annotate(count=Count('id')).order_by()
+
+    with transaction.atomic():
+        event_rollups = DailyEventRollup.objects.filter(date__lte=end_date)
+        signup_rollups = DailySignupRollup.objects.filter(date__lte=end_date)
+        if start_date:
+            event_rollups = event_rollups.filter(date__gte=start_date)
+            signup_rollups = signup_rollups.filter(date__gte=start_date)
+        event_rollups.delete()
+        signup_rollups.delete()
+
+        DailyEventRollup.objects.bulk_create([
+            DailyEventRollup(
+                date=day, coordinator_id=coordinator_id, event_type=event_type, venue=venue, **measures
+            )
+            for (day, coordinator_id, event_type, venue), measures in facts.items()
+        ], batch_size=1000)
+        DailySignupRollup.objects.bulk_create([
+            DailySignupRollup(date=row['day'], new_users=row['count']) for row in signups
+        ], batch_size=1000)
+
+    logger.info(f"Rebuilt {len(facts)} daily rollup rows from {start_date or 'the beginning'} to {end_date}")
+    return len(facts)
+
+def rebuild_recent_rollups(lookback_days=7):
+    """
+    Incremental run: recompute from the last day already rolled up (which
+    may have been partial) through today, or everything on the first run.
+
+    The last ``lookback_days`` days are always recomputed as well, because a
+    payment is counted on the day it was created and may only complete later.
+    """
+    last_day = DailyEventRollup.objects.aggregate(last=Max('date'))['last']
+    if last_day is None:
+        return rebuild_daily_rollups()
+
+    start_date = min(last_day, timezone.localdate() - timedelta(days=lookback_days))
+    return rebuild_daily_rollups(start_date=start_date)
@@ -0,0 +1,155 @@
+import logging
+import re
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_save
+
+from .models import Event, EventSearchTerm, EventTag
+
+logger = logging.getLogger(__name__)
+
+# How much a match in each field counts towards an event's rank
+FIELD_WEIGHTS = {
+    'event_name': 8,
+    'tags': 5,
+    'event_type': 4,
+    'venue': 3,
+    'audience': 2,
+    'description': 1,
+}
+
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+
+def tokenize(text):
+    """Lower-case word tokens of at least two characters"""
+    if not text:
+        return []
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in re.findall(r'\w+', text.lower())
+        if len(token) > 1
+    ]
+
+def event_terms(event, tag_names):
+    """
+    Weighted terms of an event
+
+    Args:
+        event: Event (or historical Event model instance)
+        tag_names: Names of the event's tags
+
+    Returns:
+        Counter: term -> summed weight of the fields it appears in
+    """
+    terms = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        text = ' '.join(tag_names) if field == 'tags' else getattr(event, field)
+        for term in set(tokenize(text)):
+            terms[term] += weight
+    return terms
+
+def index_event(event):
+    """Replace an event's rows in the search index"""
+    terms = event_terms(event, event.tags.values_list('name', flat=True))
+    with transaction.atomic():
+        EventSearchTerm.objects.filter(event=event).delete()
+        EventSearchTerm.objects.bulk_create([
+            EventSearchTerm(event=event, term=term, weight=weight)
+            for term, weight in terms.items()
+        ])
+
+def rebuild_search_index(batch_size=500):
+    """
+    Reindex every event
+
+    Returns:
+        int: Number of events indexed
+    """
+    indexed = 0
+    last_id = 0
+    while True:
+        events = list(
+            Event.objects.filter(id__gt=last_id).prefetch_related('tags').order_by('id')[:batch_size]
+        )
+        if not events:
+            break
+        last_id = events[-1].id
+
+        with transaction.atomic():
+            EventSearchTerm.objects.filter(event__in=events).delete()
+            EventSearchTerm.objects.bulk_create([
+                EventSearchTerm(event=event, term=term, weight=weight)
+                for event in events
+                for term, weight in event_terms(event, [tag.name for tag in event.tags.all()]).items()
+            ], batch_size=1000)
+        indexed += len(events)
+
+    logger.info(f"Rebuilt the search index for {indexed} events")
+    return indexed
+
+def _prefix(term):
+    """
+    Terms starting with ``term``. LIKE 'conf%' is still a range scan of the
+    (term, event) index, and unlike a hand-built upper bound it follows the
+    column's collation.
+    """
+    return Q(term__startswith=term)
+
+def search_events(queryset, query):
+    """
+    Filter an Event queryset to the events matching every word of ``query``
+    and annotate each with its ``search_rank``.
+
+    Every query word is a prefix match, so "conf" finds "conference". The
+    rank is the summed field weight of the index rows matched, so hits in
+    the event name outrank hits in the description.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return queryset.none()
+
+    any_term = Q()
+    for term in terms:
+        any_term |= _prefix(term)
+        # IN lets the database start from the term index rather than
+        # probing the index once per event
+        queryset = queryset.filter(
+            id__in=EventSearchTerm.objects.filter(_prefix(term)).values('event_id')
+        )
+
+    rank = EventSearchTerm.objects.filter(any_term, event=OuterRef('pk')).order_by().values(
+        'event'
+    ).annotate(total=Sum('weight')).values('total')
+
+    return queryset.annotate(search_rank=Coalesce(Subquery(rank), 0))
+
+def _index_saved_event(sender, instance, update_fields=None, **kwargs):
+    # Saves such as the status sweep touch no indexed field
+    if update_fields and not set(update_fields) & set(FIELD_WEIGHTS):
+        return
+    index_event(instance)
+
+def _index_tagged_events(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        index_event(instance)
+    else:
+        # Tags edited from the tag side: instance is the tag
+        events = Event.objects.filter(id__in=pk_set) if pk_set else instance.events.all()
+        for event in events:
+            index_event(event)
+
+def _index_renamed_tag(sender, instance, created, **kwargs):
+    if not created:
+        for event in instance.events.all():
+            index_event(event)
+
+def connect_signals():
+    post_save.connect(_index_saved_event, sender=Event, dispatch_uid='search-index-event')
+    m2m_changed.connect(_index_tagged_events, sender=Event.tags.through, dispatch_uid='search-index-tags')
+    post_save.connect(_index_renamed_tag, sender=EventTag, dispatch_uid='search-index-tag-rename')
@@ -17,7 +17,25 @@ class VenueSerializer(serializers.ModelSerializer):
     class Meta:
         model = Venue
         fields = ['id', 'name', 'address', 'capacity', 'price_per_hour', 
-                 'description', 'image_url', 'features']
+                 'description', 'image_url', 'features', 'latitude', 'longitude', 'geohash']
+        read_only_fields = ['geohash']
+
+    def validate_latitude(self, value):
+        if value is not None and not -90 <= value <= 90:
+            raise serializers.ValidationError("Latitude must be between -90 and 90.")
+        return value
+
+    def validate_longitude(self, value):
+        if value is not None and not -180 <= value <= 180:
+            raise serializers.ValidationError("Longitude must be between -180 and 180.")
+        return value
+
+    def validate(self, data):
+        latitude = data.get('latitude', getattr(self.instance, 'latitude', None))
+        longitude = data.get('longitude', getattr(self.instance, 'longitude', None))
+        if (latitude is None) != (longitude is None):
+            raise serializers.ValidationError("Latitude and longitude must be set together.")
+        return data
 
 class CoordinatorRequestSerializer(serializers.ModelSerializer):
     class Meta:
@@ -46,7 +64,114 @@ class EventTagSerializer(serializers.ModelSerializer):
         model = EventTag
         fields = ['id', 'name', 'slug']
 
-class EventSerializer(serializers.ModelSerializer):
+def query_param_list(request, name):
+    """Split a comma separated query parameter such as ?fields=a,b into a list"""
+    if request is None:
+        return []
+    value = request.query_params.get(name, '')
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+class SparseFieldsetMixin:
+    """
+    Let clients shape a representation with ?fields= and ?expand=.
+
+    ``expandable_fields`` maps a name to a factory for a nested field that is
+    left out unless requested with ?expand=, and ?fields= limits the output
+    to the listed names (expanded fields are always kept).
+    """
+    expandable_fields = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+
+        expand = [name for name in query_param_list(request, 'expand') if name in self.expandable_fields]
+        for name in expand:
+            self.fields[name] = self.expandable_fields[name]()
+
+        requested = query_param_list(request, 'fields')
+        if requested:
+            for name in set(self.fields) - set(requested) - set(expand):
+                self.fields.pop(name)
+
+    @classmethod
+    def requested_expansions(cls, request):
+        """Names from ?expand= that this serializer knows how to nest"""
+        return [name for name in query_param_list(request, 'expand') if name in cls.expandable_fields]
+
+class EventSummaryMixin:
+    """Computed fields shared by the card and full event representations"""
+
+    def get_organizer_name(self, obj):
+        return obj.created_by.get_full_name() or obj.created_by.username
+        
+    def get_participant_count(self, obj):
+        """Get the number of active participants for this event"""
+        return obj.registered_count
+        
+    def get_is_full(self, obj):
+        """Determine if event has reached its capacity"""
+        return obj.is_full
+
+    def get_rating(self, obj):
+        """Feedback rating summary, from the event's denormalised statistics"""
+        return obj.rating_summary
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Report the time-based status without writing it on a read
+        if 'status' in data:
+            data['status'] = instance.effective_status
+        return data
+
+class EventCardSerializer(SparseFieldsetMixin, EventSummaryMixin, serializers.ModelSerializer):
+    """
+    Slim event representation for lists and cards. Nested photos,
+    participants and updates are only included when asked for with ?expand=.
+    """
+    organizer_name = serializers.SerializerMethodField()
+    tags_details = EventTagSerializer(source='tags', many=True, read_only=True)
+    participant_count = serializers.SerializerMethodField(read_only=True)
+    is_full = serializers.SerializerMethodField(read_only=True)
+    rating = serializers.SerializerMethodField(read_only=True)
+
+    expandable_fields = {
+        'photos': lambda: EventPhotoSerializer(many=True, read_only=True),
+        'participants': lambda: EventParticipantSerializer(many=True, read_only=True),
+        'updates': lambda: EventUpdateSerializer(many=True, read_only=True),
+    }
+
+    class Meta:
+        model = Event
+        fields = [
+            'id', 'created_by', 'event_name', 'event_type', 'is_paid', 'price',
+            'event_time', 'venue', 'linked_venue', 'max_participants', 'rsvp_required', 'status',
+            'organizer_name', 'tags', 'tags_details', 'participant_count', 'is_full', 'rating'
+        ]
+        read_only_fields = fields
+
+class CoordinatorEventSerializer(EventCardSerializer):
+    """
+    Event card plus the figures a coordinator tracks for their own events.
+    Expects querysets annotated by Event.objects.with_revenue().
+    """
+    attendee_count = serializers.IntegerField(source='registered_count', read_only=True)
+    spots_remaining = serializers.IntegerField(read_only=True)
+    revenue = serializers.SerializerMethodField()
+
+    class Meta(EventCardSerializer.Meta):
+        fields = EventCardSerializer.Meta.fields + [
+            'description', 'created_at', 'updated_at',
+            'attendee_count', 'spots_remaining', 'revenue'
+        ]
+        read_only_fields = fields
+
+    def get_revenue(self, obj):
+        return float(getattr(obj, 'revenue', 0) or 0)
+
+class EventSerializer(EventSummaryMixin, serializers.ModelSerializer):
     photos = EventPhotoSerializer(many=True, read_only=True)
     participants = EventParticipantSerializer(many=True, read_only=True)
     updates = EventUpdateSerializer(many=True, read_only=True)
@@ -54,33 +179,21 @@ class EventSerializer(serializers.ModelSerializer):
     tags_details = EventTagSerializer(source='tags', many=True, read_only=True)
     participant_count = serializers.SerializerMethodField(read_only=True)
     is_full = serializers.SerializerMethodField(read_only=True)
+    rating = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Event
         fields = [
             'id', 'created_by', 'event_name', 'event_type', 'description',
-            'audience', 'is_paid', 'price', 'event_time', 'venue',
+            'audience', 'is_paid', 'price', 'event_time', 'venue', 'linked_venue',
             'max_participants', 'rsvp_required', 'status', 'created_at',
             'updated_at', 'photos', 'participants', 'updates',
             'organizer_info', 'organizer_website', 'organizer_email',
             'organizer_phone', 'organizer_social', 'organizer_name',
-            'tags', 'tags_details', 'participant_count', 'is_full'
+            'tags', 'tags_details', 'participant_count', 'is_full', 'rating'
         ]
-        read_only_fields = ('created_by', 'created_at', 'updated_at')
+        read_only_fields = ('created_by', 'linked_venue', 'created_at', 'updated_at')
 
-    def get_organizer_name(self, obj):
-        return obj.created_by.get_full_name() or obj.created_by.username
-        
-    def get_participant_count(self, obj):
-        """Get the number of active participants for this event"""
-        return obj.participants.filter(status__in=['registered', 'attended']).count()
-        
-    def get_is_full(self, obj):
-        """Determine if event has reached its capacity"""
-        if not obj.max_participants:
-            return False
-        return self.get_participant_count(obj) >= obj.max_participants
-        
     def validate_max_participants(self, value):
         """Validate that max_participants is a positive number when provided"""
         if value is not None and value <= 0:
@@ -112,8 +225,8 @@ class EventAnswerSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = EventAnswer
-        fields = ['id', 'question', 'user', 'user_name', 'answer', 'created_at']
-        read_only_fields = ['user']
+        fields = ['id', 'question', 'user', 'user_name', 'answer', 'created_at', 'is_official']
+        read_only_fields = ['user', 'is_official']
     
     def get_user_name(self, obj):
         return obj.user.get_full_name() or obj.user.username
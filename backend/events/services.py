@@ -0,0 +1,147 @@
+import logging
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from dashboard.activity_log import activity_log
+from .cache import INVALIDATED_BY, invalidate
+from .models import ACTIVE_PARTICIPANT_STATUSES, Event, EventParticipant, EventWaitlistEntry
+
+logger = logging.getLogger(__name__)
+
+class WaitlistService:
+    """FIFO waitlist for events that have reached max_participants"""
+
+    def join(self, event, user):
+        """
+        Put a user at the back of an event's waitlist
+
+        Args:
+            event: Event object
+            user: User joining the waitlist
+
+        Returns:
+            EventWaitlistEntry: The user's waiting entry
+        """
+        entry, created = EventWaitlistEntry.objects.get_or_create(event=event, user=user)
+        if not created and entry.status != 'waiting':
+            entry.status = 'waiting'
+            entry.joined_at = timezone.now()
+            entry.promoted_at = None
+            entry.save(update_fields=['status', 'joined_at', 'promoted_at'])
+        return entry
+
+    def leave(self, event, user):
+        """
+        Take a user off an event's waitlist
+
+        Returns:
+            bool: True if the user was waiting
+        """
+        return EventWaitlistEntry.objects.filter(
+            event=event, user=user, status='waiting'
+        ).update(status='left') > 0
+
+    def position(self, event, user):
+        """
+        Get a user's place in the queue
+
+        Returns:
+            int: 1-based position, or None if the user is not waiting
+        """
+        entry = EventWaitlistEntry.objects.filter(
+            event=event, user=user, status='waiting'
+        ).only('id', 'joined_at').first()
+        if not entry:
+            return None
+
+        ahead = EventWaitlistEntry.objects.filter(
+            event=event, status='waiting'
+        ).filter(
+            Q(joined_at__lt=entry.joined_at) | Q(joined_at=entry.joined_at, id__lt=entry.id)
+        ).count()
+        return ahead + 1
+
+    def waiting_count(self, event):
+        return EventWaitlistEntry.objects.filter(event=event, status='waiting').count()
+
+    def promote(self, event_id, limit=None):
+        """
+        Register the longest-waiting users into the event's free seats.
+
+        The event row is locked for the whole promotion, so seats freed by a
+        cancellation or a capacity increase go to the head of the queue and
+        cannot be taken twice by concurrent registrations.
+
+        Args:
+            event_id: ID of the event with free seats
+            limit: Promote at most this many users (optional)
+
+        Returns:
+            list: IDs of the users newly registered, in queue order. Waiting
+            users who had already registered leave the queue but are not
+            included, and do not use up a seat.
+        """
+        with transaction.atomic():
+            event = Event.objects.select_for_update().only(
+                'id', 'event_name', 'created_by', 'max_participants', 'registered_count'
+            ).get(id=event_id)
+
+            seats = event.spots_remaining
+            if seats is None or (limit is not None and limit < seats):
+                seats = limit
+            if seats is not None and seats <= 0:
+                return []
+
+            promoted = []
+            while seats is None or seats > 0:
+                queue = EventWaitlistEntry.objects.select_for_update().filter(
+                    event_id=event_id, status='waiting'
+                ).order_by('joined_at', 'id')
+                if seats is not None:
+                    queue = queue[:seats]
+
+                entries = list(queue.values_list('id', 'user_id'))
+                if not entries:
+                    break
+
+                entry_ids = [entry_id for entry_id, _ in entries]
+                user_ids = [user_id for _, user_id in entries]
+
+                # Users who registered some other way while waiting keep their
+                # seat and leave the queue without taking another one, so the
+                # next round fills theirs from further down the queue
+                already_registered = set(EventParticipant.objects.filter(
+                    event_id=event_id,
+                    user_id__in=user_ids,
+                    status__in=ACTIVE_PARTICIPANT_STATUSES
+                ).values_list('user_id', flat=True))
+
+                new_user_ids = [user_id for user_id in user_ids if user_id not in already_registered]
+                EventParticipant.objects.bulk_create([
+                    EventParticipant(event_id=event_id, user_id=user_id) for user_id in new_user_ids
+                ])
+                EventWaitlistEntry.objects.filter(id__in=entry_ids).update(
+                    status='promoted', promoted_at=timezone.now()
+                )
+
+                promoted.extend(new_user_ids)
+                if seats is None:
+                    # No limit: the whole queue was taken in one round
+                    break
+                seats -= len(new_user_ids)
+
+            if promoted:
+                Event.objects.filter(id=event_id).update(
+                    registered_count=F('registered_count') + len(promoted)
+                )
+                # bulk_create sends no post_save, so drop cached event reads here
+                invalidate(*INVALIDATED_BY[EventParticipant])
+                for user_id in promoted:
+                    activity_log.record(
+                        'event_registration', f"New registration for {event.event_name}",
+                        user_id, event=event_id, coordinator=event.created_by_id
+                    )
+
+        logger.info(f"Promoted {len(promoted)} waitlisted users for event {event_id}")
+        return promoted
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent once per batch after events change status in bulk, for example by
+# Event.update_all_past_events(). Receivers get ``event_ids``, ``old_status``
+# and ``new_status``; per-row post_save is not sent for these updates.
+event_status_changed = Signal()
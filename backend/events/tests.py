@@ -1,3 +1,634 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from dashboard.activity_log import activity_log
+from events.models import Event, EventFeedback, EventParticipant, EventTag, EventUpdate, Venue
+from events.geo import prefix_filter
+from events.search import search_events
+from events.services import WaitlistService
+from events.signals import event_status_changed
+from events.serializers import EventParticipantSerializer
+from events.views import EventFeedbackViewSet, EventParticipantViewSet
+from payments.models import Payment
+from users.models import User
+
+
+@skipUnless(connection.vendor in ('sqlite', 'mysql'), 'EXPLAIN output is only checked on SQLite and MySQL')
+class HotQueryIndexTests(TestCase):
+    """
+    The hot query shapes should be answered from their composite indexes
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='coordinator', email='coordinator@example.com')
+        cls.event = Event.objects.create(
+            created_by=cls.user,
+            event_name='Launch',
+            event_type='conference',
+            is_paid=False,
+            event_time=timezone.now() + timedelta(days=1),
+        )
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f"Expected {index_name} in plan:\n{plan}")
+
+    def test_event_status_time(self):
+        self.assertUsesIndex(
+            Event.objects.filter(status='upcoming', event_time__lt=timezone.now()),
+            'event_status_time_idx'
+        )
+
+    def test_event_creator_time(self):
+        self.assertUsesIndex(
+            Event.objects.filter(created_by=self.user, event_time__gte=timezone.now()),
+            'event_creator_time_idx'
+        )
+
+    def test_event_type_status_time(self):
+        self.assertUsesIndex(
+            Event.objects.filter(event_type='conference', status='upcoming', event_time__gte=timezone.now()),
+            'event_type_status_time_idx'
+        )
+
+    def test_participant_event_status(self):
+        self.assertUsesIndex(
+            EventParticipant.objects.filter(event=self.event, status__in=['registered', 'attended']),
+            'participant_event_status_idx'
+        )
+
+    def test_participant_event_user(self):
+        self.assertUsesIndex(
+            EventParticipant.objects.filter(event=self.event, user=self.user),
+            'participant_event_user_idx'
+        )
+
+    def test_payment_event_status_created(self):
+        self.assertUsesIndex(
+            Payment.objects.filter(event=self.event, payment_status='completed', created_at__gte=timezone.now()),
+            'payment_event_status_idx'
+        )
+
+    def test_payment_razorpay_order(self):
+        self.assertUsesIndex(
+            Payment.objects.filter(razorpay_order_id='order_123'),
+            'payment_rzp_order_idx'
+        )
+
+    def test_user_created_at(self):
+        self.assertUsesIndex(
+            User.objects.filter(created_at__gte=timezone.now()),
+            'user_created_at_idx'
+        )
+
+
+@override_settings(RESPONSE_CACHE_SINGLE_PROCESS=True)
+class ResponseCacheTests(TestCase):
+    """
+    Cached catalogue reads are dropped when the underlying rows change
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.venue = Venue.objects.create(
+            name='Hall', address='1 Main St', capacity=100, price_per_hour=50,
+            description='', image_url='https://example.com/hall.jpg'
+        )
+
+    def test_repeat_read_is_served_from_cache(self):
+        self.client.get('/events/venues/')
+        # Only the ETag aggregate runs; the body comes from the cache
+        with self.assertNumQueries(1):
+            response = self.client.get('/events/venues/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_save_invalidates_namespace(self):
+        self.client.get('/events/venues/')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.venue.name = 'Grand Hall'
+            self.venue.save()
+        response = self.client.get('/events/venues/')
+        self.assertEqual(response.data[0]['name'], 'Grand Hall')
+
+    @override_settings(RESPONSE_CACHE_SINGLE_PROCESS=False)
+    def test_per_process_cache_is_not_used_by_default(self):
+        # locmem would leave other workers serving stale responses
+        self.client.get('/events/venues/')
+        with self.assertNumQueries(2):
+            self.client.get('/events/venues/')
+
+    def test_matching_etag_gets_not_modified(self):
+        etag = self.client.get('/events/venues/')['ETag']
+        response = self.client.get('/events/venues/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class EventSearchTests(TestCase):
+    """
+    The search index follows event and tag edits, and ranks name matches first
+    """
+
+    def setUp(self):
+        user = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.tag = EventTag.objects.create(name='Music', slug='music')
+        self.concert = Event.objects.create(
+            created_by=user, event_name='Summer Concert', event_type='concert',
+            is_paid=False, event_time=timezone.now() + timedelta(days=1),
+        )
+        self.talk = Event.objects.create(
+            created_by=user, event_name='Tech Talk', event_type='seminar',
+            description='Followed by a small concert', is_paid=False,
+            event_time=timezone.now() + timedelta(days=2),
+        )
+
+    def search(self, query):
+        return list(search_events(Event.objects.all(), query).order_by('-search_rank', '-id'))
+
+    def test_prefix_match_ranks_name_hits_first(self):
+        self.assertEqual(self.search('conc'), [self.concert, self.talk])
+        self.assertEqual(self.search('conc tal'), [self.talk])
+
+    def test_prefixes_ending_in_z_9_or_accents(self):
+        self.concert.event_name = 'Jazz Café 2029'
+        self.concert.save()
+        for query in ('jaz', '2029', 'café'):
+            self.assertEqual(self.search(query), [self.concert], query)
+
+    def test_tag_changes_are_indexed(self):
+        self.talk.tags.add(self.tag)
+        self.assertEqual(self.search('music'), [self.talk])
+        self.tag.name = 'Jazz'
+        self.tag.save()
+        self.assertEqual(self.search('jazz'), [self.talk])
+
+
+class RatingStatsTests(TestCase):
+    """
+    Feedback writes keep the event's rating statistics in step
+    """
+
+    def setUp(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.event = Event.objects.create(
+            created_by=coordinator, event_name='Launch', event_type='conference',
+            is_paid=False, event_time=timezone.now() - timedelta(days=1),
+        )
+        self.clients = []
+        for index in range(2):
+            user = User.objects.create(username=f'user{index}', email=f'user{index}@example.com')
+            EventParticipant.objects.create(event=self.event, user=user)
+            client = APIClient()
+            client.force_authenticate(user)
+            self.clients.append(client)
+        self.url = f'/events/events/{self.event.id}/feedback/'
+
+    def test_create_edit_and_delete_move_the_statistics(self):
+        first = self.clients[0].post(self.url, {'event': self.event.id, 'rating': 5}).data['id']
+        self.clients[1].post(self.url, {'event': self.event.id, 'rating': 2})
+        self.clients[0].patch(f'{self.url}{first}/', {'rating': 4})
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.rating_average, 3.0)
+        self.assertEqual(self.event.rating_histogram, {1: 0, 2: 1, 3: 0, 4: 1, 5: 0})
+
+        self.clients[0].delete(f'{self.url}{first}/')
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.rating_count, self.event.rating_sum), (1, 2))
+
+    def test_racing_deletes_remove_the_rating_once(self):
+        feedback_id = self.clients[0].post(self.url, {'event': self.event.id, 'rating': 5}).data['id']
+        self.clients[1].post(self.url, {'event': self.event.id, 'rating': 2})
+        # Both requests loaded the row before either deleted it
+        stale = [EventFeedback.objects.get(pk=feedback_id) for _ in range(2)]
+        view = EventFeedbackViewSet()
+        view.request = SimpleNamespace(user=stale[0].user)
+        for instance in stale:
+            view.perform_destroy(instance)
+
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.rating_count, self.event.rating_sum, self.event.rating_5), (1, 2, 0))
+
+    def test_edits_and_cascades_outside_the_api_move_the_statistics(self):
+        first = self.clients[0].post(self.url, {'event': self.event.id, 'rating': 5}).data['id']
+        self.clients[1].post(self.url, {'event': self.event.id, 'rating': 2})
+        # As the admin would: load, change, save
+        feedback = EventFeedback.objects.get(pk=first)
+        feedback.rating = 3
+        feedback.save()
+        feedback.save()
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.rating_count, self.event.rating_sum, self.event.rating_5), (2, 5, 0))
+
+        feedback.user.delete()
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.rating_count, self.event.rating_sum, self.event.rating_3), (1, 2, 0))
+
+    def test_rebuild_repairs_bulk_writes(self):
+        self.clients[0].post(self.url, {'event': self.event.id, 'rating': 5})
+        EventFeedback.objects.update(rating=1)
+        call_command('rebuild_rating_stats', stdout=StringIO())
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.rating_summary['histogram'], {1: 1, 2: 0, 3: 0, 4: 0, 5: 0})
+        self.assertEqual(self.event.rating_sum, 1)
+
+    def test_only_the_author_edits_feedback(self):
+        feedback = self.clients[0].post(self.url, {'event': self.event.id, 'rating': 5}).data['id']
+        response = self.clients[1].patch(f'{self.url}{feedback}/', {'rating': 1})
+        self.assertEqual(response.status_code, 403)
+
+
+
+class FeedbackPaginationTests(TestCase):
+    """
+    Feedback pages in each sort order visit every review exactly once
+    """
+
+    def setUp(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.event = Event.objects.create(
+            created_by=coordinator, event_name='Launch', event_type='conference',
+            is_paid=False, event_time=timezone.now() - timedelta(days=1),
+        )
+        # Long runs of equal ratings, so pages break in the middle of ties
+        self.users = []
+        for index in range(12):
+            user = User.objects.create(username=f'user{index}', email=f'user{index}@example.com')
+            EventFeedback.objects.create(event=self.event, user=user, rating=5 if index % 3 else 2)
+            self.users.append(user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[0])
+        self.url = f'/events/events/{self.event.id}/feedback/'
+
+    def walk(self, sort):
+        ids = []
+        url = f'{self.url}?sort={sort}&page_size=5'
+        while url:
+            response = self.client.get(url)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_rating_sorts_break_ties_by_newest_across_pages(self):
+        feedback = list(EventFeedback.objects.values_list('rating', 'id'))
+        highest = [pk for _, pk in sorted(feedback, key=lambda row: (-row[0], -row[1]))]
+        lowest = [pk for _, pk in sorted(feedback, key=lambda row: (row[0], -row[1]))]
+        self.assertEqual(self.walk('highest'), highest)
+        self.assertEqual(self.walk('lowest'), lowest)
+
+    def test_own_feedback_is_found_on_any_page(self):
+        response = self.client.get(f'{self.url}?user=me')
+        self.assertEqual([item['user'] for item in response.data['results']], [self.users[0].id])
+
+class BookmarkBatchTests(TestCase):
+    """
+    Bookmarks can be changed and looked up for many events per request
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='visitor', email='visitor@example.com')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.event_ids = [
+            Event.objects.create(
+                created_by=self.user, event_name=f'Event {index}', event_type='meetup',
+                is_paid=False, event_time=timezone.now() + timedelta(days=1),
+            ).id
+            for index in range(4)
+        ]
+
+    def test_batch_changes_then_lookup(self):
+        response = self.client.post('/api/events/bookmarks/', {'add': self.event_ids[:3]}, format='json')
+        self.assertEqual(response.data['added'], self.event_ids[:3])
+        response = self.client.post(
+            '/api/events/bookmarks/', {'add': self.event_ids[1:], 'remove': self.event_ids[:1]}, format='json'
+        )
+        self.assertEqual(response.data['added'], self.event_ids[3:])
+        self.assertEqual(response.data['removed'], 1)
+
+        ids = ','.join(map(str, self.event_ids))
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/events/bookmarks/lookup/?ids={ids}')
+        self.assertEqual(response.data['bookmarked'], self.event_ids[1:])
+
+
+class SeatCounterTests(TestCase):
+    """
+    registered_count follows registrations and never exceeds capacity
+    """
+
+    def setUp(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.event = Event.objects.create(
+            created_by=coordinator, event_name='Workshop', event_type='workshop',
+            is_paid=False, event_time=timezone.now() + timedelta(days=1), max_participants=1,
+        )
+        self.clients = []
+        for index in range(2):
+            user = User.objects.create(username=f'user{index}', email=f'user{index}@example.com')
+            client = APIClient()
+            client.force_authenticate(user)
+            self.clients.append(client)
+
+    def register(self, client):
+        return client.post('/events/participants/', {'event': self.event.id})
+
+    def assertCountMatchesRegistrations(self):
+        self.event.refresh_from_db()
+        active = EventParticipant.objects.filter(event=self.event, status__in=['registered', 'attended']).count()
+        self.assertEqual(self.event.registered_count, active)
+
+    def test_reserve_seat_stops_at_capacity(self):
+        self.assertTrue(Event.reserve_seat(self.event.id))
+        self.assertFalse(Event.reserve_seat(self.event.id))
+        Event.release_seat(self.event.id)
+        Event.release_seat(self.event.id)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registered_count, 0)
+
+    def test_unlimited_events_always_have_a_seat(self):
+        for max_participants in (None, 0):
+            Event.objects.filter(id=self.event.id).update(max_participants=max_participants, registered_count=5)
+            self.assertTrue(Event.reserve_seat(self.event.id))
+
+    def test_full_event_rejects_registration(self):
+        self.assertEqual(self.register(self.clients[0]).status_code, 201)
+        response = self.register(self.clients[1])
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.data['waitlist_available'])
+        self.assertCountMatchesRegistrations()
+
+    def test_cancel_frees_the_seat(self):
+        participant = self.register(self.clients[0]).data['id']
+        self.clients[0].patch(f'/events/participants/{participant}/', {'status': 'canceled'})
+        self.assertCountMatchesRegistrations()
+        self.assertEqual(self.register(self.clients[1]).status_code, 201)
+        self.assertCountMatchesRegistrations()
+
+    def test_counter_follows_register_cancel_and_delete(self):
+        participant = self.register(self.clients[0]).data['id']
+        self.clients[0].patch(f'/events/participants/{participant}/', {'status': 'canceled'})
+        self.clients[0].patch(f'/events/participants/{participant}/', {'status': 'registered'})
+        self.assertCountMatchesRegistrations()
+        self.clients[0].delete(f'/events/participants/{participant}/')
+        self.clients[0].delete(f'/events/participants/{participant}/')
+        self.assertCountMatchesRegistrations()
+        self.assertEqual(self.event.registered_count, 0)
+
+    def test_racing_cancels_release_the_seat_once(self):
+        Event.objects.filter(id=self.event.id).update(max_participants=2)
+        participant = self.register(self.clients[0]).data['id']
+        self.register(self.clients[1])
+        # Both requests loaded the registration before either canceled it
+        stale = [EventParticipant.objects.get(pk=participant) for _ in range(2)]
+        view = EventParticipantViewSet()
+        for instance in stale:
+            serializer = EventParticipantSerializer(instance, data={'status': 'canceled'}, partial=True)
+            serializer.is_valid(raise_exception=True)
+            view.perform_update(serializer)
+
+        self.assertCountMatchesRegistrations()
+        self.assertEqual(self.event.registered_count, 1)
+
+
+class WaitlistPromotionTests(TestCase):
+    """
+    Freed seats go to the longest-waiting users who are not registered yet
+    """
+
+    def setUp(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.event = Event.objects.create(
+            created_by=coordinator, event_name='Workshop', event_type='workshop',
+            is_paid=False, event_time=timezone.now() + timedelta(days=1), max_participants=2,
+        )
+        self.users = [
+            User.objects.create(username=f'user{index}', email=f'user{index}@example.com')
+            for index in range(4)
+        ]
+        self.service = WaitlistService()
+        for user in self.users:
+            self.service.join(self.event, user)
+
+    def test_promotes_in_queue_order(self):
+        self.assertEqual(self.service.promote(self.event.id), [user.id for user in self.users[:2]])
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registered_count, 2)
+        self.assertEqual(self.service.waiting_count(self.event), 2)
+
+    def test_limit_caps_promotions(self):
+        self.assertEqual(self.service.promote(self.event.id, limit=1), [self.users[0].id])
+        self.assertEqual(self.service.waiting_count(self.event), 3)
+
+    def test_registered_users_leave_the_queue_without_taking_a_seat(self):
+        EventParticipant.objects.create(event=self.event, user=self.users[0])
+        Event.reserve_seat(self.event.id)
+
+        self.assertEqual(self.service.promote(self.event.id), [self.users[1].id])
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.registered_count, 2)
+        self.assertEqual(self.service.waiting_count(self.event), 2)
+
+    def test_refills_seats_left_by_registered_users(self):
+        EventParticipant.objects.create(event=self.event, user=self.users[0])
+
+        # The head of the queue is registered without holding a counted seat,
+        # so both free seats still go to the next users in line
+        self.assertEqual(self.service.promote(self.event.id), [user.id for user in self.users[1:3]])
+        self.assertEqual(self.service.waiting_count(self.event), 1)
+
+
+
+class StatusSweepTests(TestCase):
+    """
+    The status sweep reports only the events it actually moved
+    """
+
+    def test_signal_skips_events_changed_mid_run(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        events = [
+            Event.objects.create(
+                created_by=coordinator, event_name=f'Event {index}', event_type='meetup',
+                is_paid=False, event_time=timezone.now() - timedelta(days=1), status='upcoming',
+            )
+            for index in range(3)
+        ]
+        received = []
+        def receiver(sender, event_ids, **kwargs):
+            received.extend(event_ids)
+        event_status_changed.connect(receiver, dispatch_uid='test-status-sweep')
+        self.addCleanup(event_status_changed.disconnect, dispatch_uid='test-status-sweep')
+
+        # Cancel one event after the batch is chosen but before it is updated
+        select_for_update = QuerySet.select_for_update
+        def cancel_first(queryset, *args, **kwargs):
+            Event.objects.filter(pk=events[0].pk).update(status='canceled')
+            return select_for_update(queryset, *args, **kwargs)
+        with mock.patch.object(QuerySet, 'select_for_update', cancel_first):
+            updated = Event.update_all_past_events()
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(sorted(received), [events[1].id, events[2].id])
+        self.assertEqual(Event.objects.get(pk=events[0].pk).status, 'canceled')
+
+class EffectiveStatusCountTests(TestCase):
+    """
+    Dashboard counts treat past, not yet swept events as completed, like the cards do
+    """
+
+    def setUp(self):
+        self.coordinator = User.objects.create(
+            username='coordinator', email='coordinator@example.com', user_role='coordinator'
+        )
+        for days in (-2, 3):
+            Event.objects.create(
+                created_by=self.coordinator, event_name=f'Event {days}', event_type='meetup',
+                is_paid=False, event_time=timezone.now() + timedelta(days=days), status='upcoming',
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.coordinator)
+
+    def test_counts_match_card_status(self):
+        statuses = [event.effective_status for event in Event.objects.all()]
+        for url in ('/events/coordinator-stats/', '/events/coordinator-dashboard/'):
+            response = self.client.get(url)
+            stats = response.data.get('stats', response.data)
+            self.assertEqual(stats['upcoming_events'], statuses.count('upcoming'))
+            self.assertEqual(stats['completion_rate'], 50)
+
+    def test_stats_and_dashboard_report_the_same_totals(self):
+        event = Event.objects.filter(created_by=self.coordinator).first()
+        for index, participant_status in enumerate(('registered', 'canceled')):
+            user = User.objects.create(username=f'user{index}', email=f'user{index}@example.com')
+            EventParticipant.objects.create(event=event, user=user, status=participant_status)
+        Event.reserve_seat(event.id)
+        Payment.objects.create(
+            event=event, coordinator=self.coordinator, amount=25, payment_status='completed'
+        )
+
+        stats = self.client.get('/events/coordinator-stats/').data
+        dashboard = self.client.get('/events/coordinator-dashboard/').data['stats']
+        for name in ('managed_events', 'upcoming_events', 'total_attendees', 'completion_rate',
+                     'average_rating', 'revenue'):
+            self.assertEqual(stats[name], dashboard[name], name)
+        self.assertEqual(stats['total_attendees'], 1)
+        self.assertEqual(stats['revenue'], 25.0)
+
+
+class EventListETagTests(TestCase):
+    """
+    The event list ETag changes with whatever the requested cards embed
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.event = Event.objects.create(
+            created_by=self.user, event_name='Launch', event_type='conference',
+            is_paid=False, event_time=timezone.now() + timedelta(days=1),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tearDown(self):
+        # Write the activities these saves logged while the test database
+        # still exists
+        activity_log.flush()
+
+    def test_expanded_updates_change_the_etag(self):
+        url = '/api/events/?expand=updates'
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            EventUpdate.objects.create(event=self.event, sender=self.user, message='Doors open at 9')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results'][0]['updates']), 1)
+
+    def test_organizer_rename_changes_the_etag(self):
+        etag = self.client.get('/api/events/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Ada'
+            self.user.save()
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['organizer_name'], 'Ada')
+
+
+class CatalogueFilterTests(TestCase):
+    """
+    The catalogue filters validate their input and agree with the seat logic
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(username='coordinator', email='coordinator@example.com')
+        self.unlimited = Event.objects.create(
+            created_by=self.user, event_name='Open Day', event_type='meetup', is_paid=False,
+            event_time=timezone.now() + timedelta(days=1), max_participants=0, registered_count=5,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_invalid_date_is_a_bad_request(self):
+        response = self.client.get('/api/events/?starts_after=2024-02-30')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('starts_after', response.data)
+
+    def test_zero_capacity_counts_as_available(self):
+        response = self.client.get('/api/events/?available=true')
+        self.assertEqual([event['id'] for event in response.data['results']], [self.unlimited.id])
+
+    def test_filters_do_not_apply_to_detail_requests(self):
+        response = self.client.get(f'/api/events/{self.unlimited.id}/?available=false')
+        self.assertEqual(response.status_code, 200)
+
+
+class GeohashPrefixTests(TestCase):
+    """
+    Venue lookups by geohash cell find cells whatever their last character
+    """
+
+    def test_cells_ending_in_z_or_9(self):
+        venue = Venue.objects.create(
+            name='Harbour Hall', address='1 Quay St', capacity=100, price_per_hour=50,
+            description='', image_url='https://example.com/hall.jpg',
+        )
+        for geohash in ('u4pruydqqz', 'u4pruydqq9'):
+            Venue.objects.filter(id=venue.id).update(geohash=geohash)
+            for length in (len(geohash), 6):
+                prefix = geohash[:length]
+                self.assertTrue(Venue.objects.filter(prefix_filter('geohash', [prefix])).exists(), prefix)
+
+
+class LinkedVenueTests(TestCase):
+    """
+    linked_venue always follows the venue name
+    """
+
+    def test_link_is_cleared_when_the_name_stops_matching(self):
+        coordinator = User.objects.create(username='coordinator', email='coordinator@example.com')
+        venue = Venue.objects.create(
+            name='Harbour Hall', address='1 Quay St', capacity=100, price_per_hour=50,
+            description='', image_url='https://example.com/hall.jpg',
+        )
+        event = Event.objects.create(
+            created_by=coordinator, event_name='Gig', event_type='concert', is_paid=False,
+            event_time=timezone.now() + timedelta(days=1), venue='harbour hall ',
+        )
+        self.assertEqual(event.linked_venue_id, venue.id)
+
+        for name in ('Somewhere else', '', None):
+            event.linked_venue = venue
+            event.venue = name
+            event.save()
+            event.refresh_from_db()
+            self.assertIsNone(event.linked_venue_id, name)
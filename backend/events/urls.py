@@ -24,6 +24,9 @@ router.register(r'venues', VenueViewSet)
 urlpatterns = [
     path('', include(router.urls)),
     path('events/<int:event_id>/feedback/', EventFeedbackViewSet.as_view({'get': 'list', 'post': 'create'})),
+    path('events/<int:event_id>/feedback/<int:pk>/', EventFeedbackViewSet.as_view({
+        'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'
+    })),
     
     # Add explicit coordinator dashboard endpoints
     path('coordinator-stats/', EventViewSet.as_view({'get': 'coordinator_stats'})),
@@ -32,4 +35,5 @@ urlpatterns = [
     path('coordinator-attendance/', EventViewSet.as_view({'get': 'coordinator_attendance'})),
     path('coordinator-revenue/', EventViewSet.as_view({'get': 'coordinator_revenue'})),
     path('coordinator-activity/', EventViewSet.as_view({'get': 'coordinator_activity'})),
+    path('coordinator-dashboard/', EventViewSet.as_view({'get': 'coordinator_dashboard'})),
 ]
\ No newline at end of file
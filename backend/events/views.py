@@ -5,21 +5,42 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.shortcuts import get_object_or_404
-from rest_framework.exceptions import ValidationError
-from django.db.models import Count, Sum, Avg, F, Q
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from django.db.models import Count, Sum, F, Max, Q
 from django.db.models.functions import TruncMonth, TruncDay
 from datetime import datetime, timedelta
+from decimal import Decimal
 import random  # For demo data
 import logging
 from django.conf import settings
+from django.db import transaction
 
-from .models import CoordinatorRequest, Event, EventParticipant, EventPhoto, EventUpdate, EventFeedback, EventBookmark, EventQuestion, EventAnswer, EventTag, Venue
+from .pagination import (
+    CoordinatorEventCursorPagination,
+    EventCursorPagination,
+    FeedbackCursorPagination,
+    NearbyEventCursorPagination,
+    ParticipantCursorPagination,
+    QuestionCursorPagination,
+    SearchCursorPagination,
+)
+from .cache import cached_response, conditional_response, rows_state
+from .activity import coordinator_activity_feed
+from .filters import event_facets, filter_events, parse_moment
+from .geo import covering_cells, haversine_km, prefix_filter
+from .recommendations import related_events
+from .search import search_events
+from .services import WaitlistService
+from .models import ACTIVE_PARTICIPANT_STATUSES, DailyEventRollup, CoordinatorRequest, Event, EventParticipant, EventPhoto, EventUpdate, EventFeedback, EventBookmark, EventQuestion, EventAnswer, EventTag, Venue
 from payments.models import Payment
+from payments.services import VenueCalendarService
 from .serializers import (
     CoordinatorRequestSerializer,
     EventParticipantSerializer,
     EventPhotoSerializer,
     EventSerializer,
+    EventCardSerializer,
+    CoordinatorEventSerializer,
     EventUpdateSerializer,
     EventFeedbackSerializer,
     EventBookmarkSerializer,
@@ -27,10 +48,68 @@ from .serializers import (
     EventAnswerSerializer,
     EventTagSerializer,
     VenueSerializer,
+    query_param_list,
 )
 
 logger = logging.getLogger(__name__)
 
+def month_starts(start_date, end_date):
+    """First day of every month from start_date's month through end_date"""
+    months = []
+    current_date = start_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    while current_date <= end_date:
+        months.append(current_date)
+        current_date = (current_date + timedelta(days=32)).replace(day=1)
+    return months
+
+def monthly_series(rows, start_date, end_date):
+    """
+    Turn rows of {'month': datetime, 'value': number} into a chart series
+    with one entry per month, filling months without rows with zero
+    """
+    values = {}
+    for row in rows:
+        if row['month']:
+            value = row['value'] or 0
+            # Money sums come back as Decimal
+            values[(row['month'].year, row['month'].month)] = float(value) if isinstance(value, Decimal) else value
+    return [
+        {'name': month.strftime('%b'), 'value': values.get((month.year, month.month), 0)}
+        for month in month_starts(start_date, end_date)
+    ]
+
+def coordinator_headline_stats(coordinator, now=None):
+    """
+    The headline numbers of a coordinator's dashboard, shared by
+    coordinator_stats and coordinator_dashboard so the two always agree.
+    total_attendees counts active registrations (registered or attended),
+    as registered_count does; revenue sums completed payments.
+    """
+    now = now or timezone.now()
+    totals = Event.objects.filter(created_by=coordinator).aggregate(
+        managed=Count('id'),
+        upcoming=Count('id', filter=Event.effective_status_q('upcoming', now)),
+        completed=Count('id', filter=Event.effective_status_q('completed', now)),
+        attendees=Sum('registered_count'),
+        rating_count=Sum('rating_count'),
+        rating_sum=Sum('rating_sum')
+    )
+    revenue = Payment.objects.filter(
+        event__created_by=coordinator,
+        payment_status='completed'
+    ).aggregate(total=Sum('amount'))['total'] or 0
+    
+    managed = totals['managed']
+    return {
+        'managed_events': managed,
+        'upcoming_events': totals['upcoming'],
+        'total_attendees': totals['attendees'] or 0,
+        'completion_rate': round((totals['completed'] / managed) * 100) if managed else 0,
+        # Rolled up from the events' rating statistics
+        'average_rating': round(totals['rating_sum'] / totals['rating_count'], 1) if totals['rating_count'] else 0,
+        'revenue': float(revenue),
+    }
+
 class CoordinatorRequestViewSet(viewsets.ModelViewSet):
     queryset = CoordinatorRequest.objects.all()
     serializer_class = CoordinatorRequestSerializer
@@ -57,49 +136,95 @@ class EventViewSet(viewsets.ModelViewSet):
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
     authentication_classes = [JWTAuthentication]
+    pagination_class = EventCursorPagination
+    waitlist_service = WaitlistService()
+    max_nearby_radius_km = 100
+    max_bulk_bookmarks = 100
+    cache_namespace = 'events'
+    cache_timeout = 60
+
+    # Collection actions answer with slim cards; retrieve and writes use the full form
+    card_actions = ('list', 'bookmarked', 'related', 'search', 'nearby')
+    # Actions that apply the catalogue filters (events.filters) to their listing
+    filtered_actions = ('list', 'search', 'nearby', 'facets')
+
+    # Per ?expand= relation: its model, the timestamp of a row, and the
+    # aggregates whose change means an expanded card changed
+    expansion_state = {
+        'photos': (EventPhoto, 'uploaded_at', {}),
+        'updates': (EventUpdate, 'created_at', {}),
+        'participants': (EventParticipant, 'registered_at', {
+            'attended': Count('id', filter=Q(status='attended')),
+            'canceled': Count('id', filter=Q(status='canceled')),
+        }),
+    }
+
+    # Reads never write event statuses: the serializers report
+    # Event.effective_status and the update_event_statuses command persists
+    # the upcoming -> completed transition in the background.
+
+    def get_serializer_class(self):
+        if self.action == 'coordinator_events':
+            return CoordinatorEventSerializer
+        if self.action in self.card_actions:
+            return EventCardSerializer
+        return EventSerializer
+
+    def _event_queryset(self):
+        """
+        Annotated and prefetched for the serializer this action uses, so
+        serializing a page costs a fixed number of queries
+        """
+        if issubclass(self.get_serializer_class(), EventCardSerializer):
+            return Event.objects.for_serializer(
+                expand=EventCardSerializer.requested_expansions(self.request)
+            )
+        return Event.objects.for_serializer()
 
     def get_queryset(self):
-        queryset = Event.objects.all()
-        
-        # Filter by tag
-        tag = self.request.query_params.get('tag', None)
-        if tag:
-            queryset = queryset.filter(tags__slug=tag)
-            
+        queryset = self._event_queryset()
+        # Only listings are filtered, so stray query params cannot make a
+        # detail or write request 404
+        if self.action in self.filtered_actions:
+            queryset = filter_events(queryset, self.request.query_params)
         return queryset.order_by('-created_at')
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        
-        # Update event statuses before returning the list
-        self._update_event_statuses(queryset)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-        
-    def retrieve(self, request, *args, **kwargs):
-        # Get the event and update its status if needed
-        instance = self.get_object()
-        instance.update_status_based_on_time()
-        
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
-        
-    def _update_event_statuses(self, queryset):
+    def get_conditional_state(self):
         """
-        Helper method to efficiently update event statuses
+        Everything an event card shows beyond the event row's updated_at:
+        seat counts and rating statistics (moved by UPDATEs that leave
+        updated_at alone), events whose time has passed but whose status is
+        not yet persisted, organizer and tag renames, and the rows of every
+        relation expanded with ?expand=
         """
-        now = timezone.now()
-        # Find events that need status update (upcoming but time has passed)
-        past_events = queryset.filter(
-            status='upcoming',
-            event_time__lt=now
+        queryset = self.filter_queryset(self.get_queryset())
+        state = rows_state(
+            queryset,
+            seats=Sum('registered_count'),
+            ratings=Sum('rating_count'),
+            rating_total=Sum('rating_sum'),
+            lapsed=Count('id', filter=Q(status='upcoming', event_time__lt=timezone.now())),
+            organizers_modified=Max('created_by__updated_at')
         )
-        
-        # Update statuses in bulk if there are any events to update
-        if past_events.exists():
-            updated_count = past_events.update(status='completed')
-            logger.info(f"Updated {updated_count} events from upcoming to completed")
+        state['tags_modified'] = EventTag.objects.aggregate(last=Max('updated_at'))['last']
+
+        event_ids = queryset.order_by().values('id')
+        for name in EventCardSerializer.requested_expansions(self.request):
+            model, time_field, aggregates = self.expansion_state[name]
+            # Deleting one row and adding another keeps the count but moves max(id)
+            state[name] = sorted(model.objects.filter(event_id__in=event_ids).aggregate(
+                count=Count('id'), last_id=Max('id'), last=Max(time_field), **aggregates
+            ).items())
+        return state
+
+    @conditional_response
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         """
@@ -127,6 +252,13 @@ class EventViewSet(viewsets.ModelViewSet):
                 
         return event
         
+    def perform_update(self, serializer):
+        event = serializer.save()
+        
+        # Seats added by a capacity increase go to the waitlist first
+        if 'max_participants' in serializer.validated_data:
+            self.waitlist_service.promote(event.id)
+
     def create(self, request, *args, **kwargs):
         """
         Override create to handle coordinator event creation with payment
@@ -150,55 +282,11 @@ class EventViewSet(viewsets.ModelViewSet):
     def coordinator_stats(self, request):
         """Get dashboard statistics for coordinator"""
         try:
-            # Get events created by this coordinator
-            coordinator_events = Event.objects.filter(created_by=request.user)
-            
-            # Calculate stats
-            managed_events_count = coordinator_events.count()
-            upcoming_events_count = coordinator_events.filter(
-                status='upcoming',
-                event_time__gt=timezone.now()
-            ).count()
-            
-            # Get total attendees across all coordinator's events
-            total_attendees = EventParticipant.objects.filter(
-                event__in=coordinator_events
-            ).count()
-            
-            # Calculate completion rate (% of events that were completed as planned)
-            completed_events = coordinator_events.filter(status='completed').count()
-            completion_rate = 0
-            if managed_events_count > 0:
-                completion_rate = round((completed_events / managed_events_count) * 100)
-            
-            # Calculate average rating from feedback
-            avg_rating = EventFeedback.objects.filter(
-                event__in=coordinator_events
-            ).aggregate(avg=Avg('rating'))
-            average_rating = round(avg_rating['avg'], 1) if avg_rating['avg'] else 0
-            
-            # Calculate total revenue from payments
-            try:
-                revenue_data = Payment.objects.filter(
-                    event__in=coordinator_events, 
-                    payment_status='completed'
-                ).aggregate(total=Sum('amount'))
-                revenue = revenue_data['total'] if revenue_data['total'] else 0
-            except Exception as e:
-                logger.warning(f"Could not fetch payment data: {str(e)}")
-                revenue = 0
-            
-            # Check if we have real data or no events yet
-            has_real_data = managed_events_count > 0
-            
+            stats = coordinator_headline_stats(request.user)
             return Response({
-                'managed_events': managed_events_count,
-                'upcoming_events': upcoming_events_count,
-                'total_attendees': total_attendees,
-                'completion_rate': completion_rate,
-                'average_rating': average_rating,
-                'revenue': float(revenue),
-                'has_real_data': has_real_data
+                **stats,
+                # Check if we have real data or no events yet
+                'has_real_data': stats['managed_events'] > 0
             })
             
         except Exception as e:
@@ -210,20 +298,20 @@ class EventViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def coordinator_events(self, request):
-        """Get all events managed by the logged-in coordinator"""
+        """Get the events managed by the logged-in coordinator, a page at a time"""
         try:
-            events = Event.objects.filter(
+            events = self._event_queryset().with_revenue().filter(
                 created_by=request.user
-            ).order_by('event_time')
-            
-            # Enhance with attendee counts
-            for event in events:
-                event.attendee_count = EventParticipant.objects.filter(event=event).count()
+            )
             
-            serializer = self.get_serializer(events, many=True)
+            paginator = CoordinatorEventCursorPagination()
+            page = paginator.paginate_queryset(events, request, view=self)
+            serializer = self.get_serializer(page, many=True)
             return Response({
                 'events': serializer.data,
-                'has_real_data': events.exists()
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'has_real_data': bool(page) or paginator.get_previous_link() is not None
             })
         except Exception as e:
             logger.error(f"Error fetching coordinator events: {str(e)}")
@@ -291,15 +379,16 @@ class EventViewSet(viewsets.ModelViewSet):
                     'has_real_data': False
                 })
             
-            # Get monthly attendance counts
-            monthly_attendance = EventParticipant.objects.filter(
-                event__in=coordinator_events,
-                registered_at__gte=start_date,
-                registered_at__lte=end_date
+            # Get monthly attendance counts from the daily rollups
+            monthly_attendance = DailyEventRollup.objects.filter(
+                coordinator=request.user,
+                date__gte=start_date.date(),
+                date__lte=end_date.date(),
+                registrations__gt=0
             ).annotate(
-                month=TruncMonth('registered_at')
+                month=TruncMonth('date')
             ).values('month').annotate(
-                value=Count('id')
+                value=Sum('registrations')
             ).order_by('month')
             
             # Format data for chart
@@ -321,11 +410,7 @@ class EventViewSet(viewsets.ModelViewSet):
             
             # No registration data, but events exist - return zeros for each month
             if coordinator_events.exists():
-                months = []
-                current_date = start_date
-                while current_date <= end_date:
-                    months.append(current_date.strftime('%b'))
-                    current_date = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+                months = [month.strftime('%b') for month in month_starts(start_date, end_date)]
                 
                 attendance_data = [
                     {'name': month, 'value': 0} 
@@ -372,16 +457,16 @@ class EventViewSet(viewsets.ModelViewSet):
             
             # Get payment data if available
             try:
-                # Get monthly revenue data
-                monthly_revenue = Payment.objects.filter(
-                    event__in=coordinator_events,
-                    payment_status='completed',
-                    created_at__gte=start_date,
-                    created_at__lte=end_date
+                # Get monthly revenue data from the daily rollups
+                monthly_revenue = DailyEventRollup.objects.filter(
+                    coordinator=request.user,
+                    date__gte=start_date.date(),
+                    date__lte=end_date.date(),
+                    payments_completed__gt=0
                 ).annotate(
-                    month=TruncMonth('created_at')
+                    month=TruncMonth('date')
                 ).values('month').annotate(
-                    value=Sum('amount')
+                    value=Sum('revenue')
                 ).order_by('month')
                 
                 # Format data for chart
@@ -402,11 +487,7 @@ class EventViewSet(viewsets.ModelViewSet):
                     })
                 
                 # No payment data, but events exist - return zeros for each month
-                months = []
-                current_date = start_date
-                while current_date <= end_date:
-                    months.append(current_date.strftime('%b'))
-                    current_date = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+                months = [month.strftime('%b') for month in month_starts(start_date, end_date)]
                 
                 revenue_data = [
                     {'name': month, 'value': 0} 
@@ -422,11 +503,7 @@ class EventViewSet(viewsets.ModelViewSet):
             except Exception as e:
                 logger.warning(f"Payment data not available: {str(e)}")
                 # Payment model may not be accessible, return zeros
-                months = []
-                current_date = start_date
-                while current_date <= end_date:
-                    months.append(current_date.strftime('%b'))
-                    current_date = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+                months = [month.strftime('%b') for month in month_starts(start_date, end_date)]
                 
                 revenue_data = [
                     {'name': month, 'value': 0} 
@@ -479,131 +556,34 @@ class EventViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def coordinator_activity(self, request):
-        """Get recent activity for coordinator's events"""
+        """
+        Get recent activity for coordinator's events, newest first. Pass the
+        returned next_cursor as ?cursor= to load more.
+        """
         try:
-            # Get events by this coordinator
-            coordinator_events = Event.objects.filter(created_by=request.user)
-            
-            # No events yet
-            if not coordinator_events.exists():
-                return Response({
-                    'data': [],
-                    'has_real_data': False
-                })
-            
-            # Initialize activity array
-            activity = []
-            
-            # Get recent registrations
-            recent_registrations = EventParticipant.objects.filter(
-                event__in=coordinator_events
-            ).order_by('-registered_at')[:5]
-            
-            for registration in recent_registrations:
-                # Format time (e.g., "2 hours ago", "3 days ago")
-                time_diff = timezone.now() - registration.registered_at
-                if time_diff.days > 0:
-                    time_str = f"{time_diff.days} days ago"
-                else:
-                    hours = time_diff.seconds // 3600
-                    if hours > 0:
-                        time_str = f"{hours} hours ago"
-                    else:
-                        minutes = (time_diff.seconds % 3600) // 60
-                        time_str = f"{minutes} minutes ago"
-                
-                activity.append({
-                    'type': 'registration',
-                    'event': registration.event.event_name,
-                    'time': time_str
-                })
-            
-            # Get recent feedback
-            recent_feedback = EventFeedback.objects.filter(
-                event__in=coordinator_events
-            ).order_by('-created_at')[:5]
-            
-            for feedback in recent_feedback:
-                time_diff = timezone.now() - feedback.created_at
-                if time_diff.days > 0:
-                    time_str = f"{time_diff.days} days ago"
-                else:
-                    hours = time_diff.seconds // 3600
-                    if hours > 0:
-                        time_str = f"{hours} hours ago"
-                    else:
-                        minutes = (time_diff.seconds % 3600) // 60
-                        time_str = f"{minutes} minutes ago"
-                        
-                activity.append({
-                    'type': 'feedback',
-                    'event': feedback.event.event_name,
-                    'time': time_str
-                })
-                
-            # Try to get recent payments
             try:
-                recent_payments = Payment.objects.filter(
-                    event__in=coordinator_events
-                ).order_by('-created_at')[:5]
-                
-                for payment in recent_payments:
-                    time_diff = timezone.now() - payment.created_at
-                    if time_diff.days > 0:
-                        time_str = f"{time_diff.days} days ago"
-                    else:
-                        hours = time_diff.seconds // 3600
-                        if hours > 0:
-                            time_str = f"{hours} hours ago"
-                        else:
-                            minutes = (time_diff.seconds % 3600) // 60
-                            time_str = f"{minutes} minutes ago"
-                            
-                    activity.append({
-                        'type': 'payment',
-                        'event': payment.event.event_name,
-                        'time': time_str
-                    })
-            except Exception as e:
-                logger.warning(f"Payment data not available for activity: {str(e)}")
-            
-            # Get recent event updates
-            recent_updates = EventUpdate.objects.filter(
-                event__in=coordinator_events
-            ).order_by('-created_at')[:5]
-            
-            for update in recent_updates:
-                time_diff = timezone.now() - update.created_at
-                if time_diff.days > 0:
-                    time_str = f"{time_diff.days} days ago"
-                else:
-                    hours = time_diff.seconds // 3600
-                    if hours > 0:
-                        time_str = f"{hours} hours ago"
-                    else:
-                        minutes = (time_diff.seconds % 3600) // 60
-                        time_str = f"{minutes} minutes ago"
-                        
-                activity.append({
-                    'type': 'update',
-                    'event': update.event.event_name,
-                    'time': time_str
-                })
+                limit = min(max(int(request.query_params.get('limit', 5)), 1), 50)
+            except ValueError:
+                limit = 5
             
-            # Sort by most recent
-            activity = sorted(activity, key=lambda x: x['time'])
+            activity, next_cursor = coordinator_activity_feed(
+                request.user,
+                cursor=request.query_params.get('cursor'),
+                limit=limit
+            )
             
-            # If we have activity data, return it
             if activity:
                 return Response({
-                    'data': activity[:5],  # Limit to 5 most recent
+                    'data': activity,
+                    'next_cursor': next_cursor,
                     'has_real_data': True
                 })
             
             # No activity data yet
             return Response({
                 'data': [],
-                'has_real_data': True,
+                'next_cursor': None,
+                'has_real_data': Event.objects.filter(created_by=request.user).exists(),
                 'note': 'No activity yet'
             })
                 
@@ -615,55 +595,284 @@ class EventViewSet(viewsets.ModelViewSet):
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @action(detail=False, methods=['get'])
+    def coordinator_dashboard(self, request):
+        """
+        Get every coordinator dashboard panel in one response: stats, event
+        types, attendance, revenue, upcoming events and recent activity
+        """
+        try:
+            now = timezone.now()
+            start_date = now - timedelta(days=180)
+            coordinator_events = Event.objects.filter(created_by=request.user)
+            
+            events_by_type = list(coordinator_events.values('event_type').annotate(
+                count=Count('id')
+            ).order_by('-count'))
+            
+            # The revenue and attendance charts come from the daily rollups
+            monthly_rollups = list(DailyEventRollup.objects.filter(
+                coordinator=request.user
+            ).annotate(
+                month=TruncMonth('date')
+            ).values('month').annotate(
+                revenue=Sum('revenue'),
+                registrations=Sum('registrations')
+            ).order_by('month'))
+            monthly_revenue = [{'month': row['month'], 'value': row['revenue']} for row in monthly_rollups]
+            monthly_attendance = [{'month': row['month'], 'value': row['registrations']} for row in monthly_rollups]
+            
+            activity, _ = coordinator_activity_feed(request.user)
+            
+            upcoming_events = Event.objects.for_serializer(
+                expand=CoordinatorEventSerializer.requested_expansions(request)
+            ).with_revenue().filter(
+                Event.effective_status_q('upcoming', now),
+                created_by=request.user
+            ).order_by('event_time')[:5]
+            
+            stats = coordinator_headline_stats(request.user, now)
+            return Response({
+                'stats': stats,
+                'event_types': [
+                    {'name': row['event_type'] or 'Other', 'value': row['count']}
+                    for row in events_by_type
+                ],
+                'attendance': monthly_series(monthly_attendance, start_date, now),
+                'revenue': monthly_series(monthly_revenue, start_date, now),
+                'upcoming_events': CoordinatorEventSerializer(
+                    upcoming_events, many=True, context={'request': request}
+                ).data,
+                'activity': activity,
+                'has_real_data': stats['managed_events'] > 0
+            })
+            
+        except Exception as e:
+            logger.error(f"Error fetching coordinator dashboard: {str(e)}")
+            return Response({
+                "error": str(e),
+                "has_real_data": False
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     @action(detail=True, methods=['get'])
+    @cached_response
     def related(self, request, pk=None):
-        """Get related events based on event type and tags"""
+        """
+        Get up to 3 upcoming events related by tags, co-registrations,
+        bookmarks and type, from the precomputed similarity lists
+        """
         event = self.get_object()
+        related = related_events(event, self._event_queryset(), limit=3)
         
-        # Get events of the same type, excluding the current event
-        related_events = Event.objects.filter(
-            event_type=event.event_type,
-            status='upcoming'  # Only show upcoming events
-        ).exclude(
-            id=event.id
-        ).order_by(
-            'event_time'
-        )[:3]  # Limit to 3 related events
-        
-        serializer = self.get_serializer(related_events, many=True)
+        serializer = self.get_serializer(related, many=True)
         return Response(serializer.data)
 
     @action(detail=True, methods=['post', 'delete'])
     def bookmark(self, request, pk=None):
         """Toggle bookmark status for an event"""
-        event = self.get_object()
-        bookmark = EventBookmark.objects.filter(event=event, user=request.user).first()
+        event = get_object_or_404(Event.objects.only('id'), pk=pk)
         
-        if request.method == 'DELETE' and bookmark:
-            bookmark.delete()
-            return Response({"status": "removed"}, status=200)
-        elif request.method == 'POST' and not bookmark:
-            EventBookmark.objects.create(event=event, user=request.user)
-            return Response({"status": "bookmarked"}, status=201)
+        if request.method == 'DELETE':
+            removed, _ = EventBookmark.objects.filter(event=event, user=request.user).delete()
+            if removed:
+                return Response({"status": "removed"}, status=200)
+        else:
+            _, created = EventBookmark.objects.get_or_create(event=event, user=request.user)
+            if created:
+                return Response({"status": "bookmarked"}, status=201)
         
         return Response({"status": "no change"}, status=200)
 
+    def _event_ids(self, values, name):
+        """Validate a list of event IDs from a request, at most max_bulk_bookmarks"""
+        if not isinstance(values, list):
+            raise ValidationError({name: "Must be a list of event IDs."})
+        if len(values) > self.max_bulk_bookmarks:
+            raise ValidationError({name: f"At most {self.max_bulk_bookmarks} event IDs are allowed."})
+        try:
+            return {int(value) for value in values}
+        except (TypeError, ValueError):
+            raise ValidationError({name: "Must be a list of event IDs."})
+
+    @action(detail=False, methods=['post'], url_path='bookmarks')
+    def bulk_bookmark(self, request):
+        """
+        Add and remove many bookmarks at once. Send {"add": [event IDs],
+        "remove": [event IDs]}; either may be left out. Adding an event that
+        is already bookmarked, or removing one that is not, is not an error.
+        Answers with the IDs newly bookmarked and the number removed.
+        """
+        add_ids = self._event_ids(request.data.get('add', []), 'add')
+        remove_ids = self._event_ids(request.data.get('remove', []), 'remove')
+        if add_ids & remove_ids:
+            return Response(
+                {"error": "An event cannot be both added and removed"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        with transaction.atomic():
+            added = []
+            if add_ids:
+                # Unknown and already bookmarked events are skipped rather
+                # than failing the batch
+                existing = EventBookmark.objects.filter(
+                    user=request.user, event_id__in=add_ids
+                ).values_list('event_id', flat=True)
+                added = sorted(
+                    Event.objects.filter(id__in=add_ids).exclude(id__in=existing).values_list('id', flat=True)
+                )
+                EventBookmark.objects.bulk_create(
+                    [EventBookmark(event_id=event_id, user=request.user) for event_id in added],
+                    ignore_conflicts=True
+                )
+            removed = 0
+            if remove_ids:
+                removed, _ = EventBookmark.objects.filter(user=request.user, event_id__in=remove_ids).delete()
+
+        return Response({"added": added, "removed": removed})
+
+    @action(detail=False, methods=['get'], url_path='bookmarks/lookup')
+    def bookmark_lookup(self, request):
+        """
+        Which of the events in ?ids= (comma separated, e.g. the events on a
+        catalogue page) the current user has bookmarked
+        """
+        event_ids = self._event_ids(query_param_list(request, 'ids'), 'ids')
+        bookmarked = EventBookmark.objects.filter(
+            user=request.user, event_id__in=event_ids
+        ).values_list('event_id', flat=True) if event_ids else []
+        return Response({"bookmarked": sorted(bookmarked)})
+
+    @action(detail=True, methods=['get', 'post', 'delete'])
+    def waitlist(self, request, pk=None):
+        """Get your waitlist position, join the waitlist or leave it"""
+        event = get_object_or_404(Event.objects.only('id', 'max_participants', 'registered_count'), pk=pk)
+        
+        if request.method == 'POST':
+            if EventParticipant.objects.filter(
+                event=event, user=request.user, status__in=ACTIVE_PARTICIPANT_STATUSES
+            ).exists():
+                return Response(
+                    {"error": "You are already registered for this event"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not event.is_full:
+                return Response(
+                    {"error": "This event still has spots available"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            self.waitlist_service.join(event, request.user)
+            # A seat may have been freed between the capacity check and joining
+            self.waitlist_service.promote(event.id)
+            
+        elif request.method == 'DELETE':
+            if not self.waitlist_service.leave(event, request.user):
+                return Response({"status": "no change"}, status=200)
+            return Response({"status": "removed"}, status=200)
+        
+        position = self.waitlist_service.position(event, request.user)
+        return Response({
+            'event': event.id,
+            'on_waitlist': position is not None,
+            'position': position,
+            'waiting_count': self.waitlist_service.waiting_count(event),
+        }, status=201 if request.method == 'POST' else 200)
+
     @action(detail=False, methods=['get'])
     def bookmarked(self, request):
         """Get all bookmarked events for the current user"""
-        bookmarked_events = Event.objects.filter(bookmarks__user=request.user)
-        serializer = self.get_serializer(bookmarked_events, many=True)
-        return Response(serializer.data)
+        bookmarked_events = self._event_queryset().filter(bookmarks__user=request.user)
+        page = self.paginate_queryset(bookmarked_events)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'], pagination_class=SearchCursorPagination)
+    @cached_response
+    def search(self, request):
+        """
+        Search events by name, description, audience, type, venue and tag
+        names, best match first. Each word of ?q= matches as a prefix.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {"error": "Query parameter 'q' is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        events = search_events(self.get_queryset(), query)
+        page = self.paginate_queryset(events)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'], pagination_class=NearbyEventCursorPagination)
+    @cached_response
+    def nearby(self, request):
+        """
+        Events at venues within ?radius_km= (default 10) of ?lat=&lng=,
+        soonest first. The list filters apply as well, so starts_after and
+        starts_before set the time window; without starts_after, events that
+        have already started are left out.
+        """
+        try:
+            latitude = float(request.query_params['lat'])
+            longitude = float(request.query_params['lng'])
+            radius_km = float(request.query_params.get('radius_km', 10))
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "lat and lng are required and must be numbers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            return Response(
+                {"error": "lat must be within ±90 and lng within ±180"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not 0 < radius_km <= self.max_nearby_radius_km:
+            return Response(
+                {"error": f"radius_km must be greater than 0 and at most {self.max_nearby_radius_km}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # The geohash cells around the point give a handful of candidate
+        # venues from the index; the exact distance check runs on those only
+        candidates = Venue.objects.filter(
+            prefix_filter('geohash', covering_cells(latitude, longitude, radius_km))
+        ).values_list('id', 'latitude', 'longitude')
+        venue_ids = [
+            venue_id for venue_id, venue_latitude, venue_longitude in candidates
+            if haversine_km(latitude, longitude, float(venue_latitude), float(venue_longitude)) <= radius_km
+        ]
+
+        events = self.get_queryset().filter(linked_venue_id__in=venue_ids)
+        if 'starts_after' not in request.query_params:
+            events = events.filter(event_time__gte=timezone.now())
+
+        page = self.paginate_queryset(events)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    @cached_response
+    def facets(self, request):
+        """
+        Counts per event type, venue, tag and paid/free over the events
+        matching the same filters as the list (see events.filters)
+        """
+        return Response(event_facets(self.get_queryset()))
 
     @action(detail=True, methods=['get', 'post'])
     def questions(self, request, pk=None):
-        """Get or create questions for an event"""
-        event = self.get_object()
+        """Get or create questions for an event; questions are paginated"""
+        # Only the id is needed, so skip the serializer prefetches of get_object()
+        event = get_object_or_404(Event.objects.only('id'), pk=pk)
         
         if request.method == 'GET':
-            questions = EventQuestion.objects.filter(event=event)
-            serializer = EventQuestionSerializer(questions, many=True)
-            return Response(serializer.data)
+            questions = EventQuestion.objects.with_thread().filter(event=event)
+            paginator = QuestionCursorPagination()
+            page = paginator.paginate_queryset(questions, request, view=self)
+            serializer = EventQuestionSerializer(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
         
         elif request.method == 'POST':
             serializer = EventQuestionSerializer(data={
@@ -685,6 +894,7 @@ class EventParticipantViewSet(viewsets.ModelViewSet):
     queryset = EventParticipant.objects.all()
     serializer_class = EventParticipantSerializer
     permission_classes = [IsAuthenticated]
+    waitlist_service = WaitlistService()
 
     def create(self, request, *args, **kwargs):
         """
@@ -708,40 +918,36 @@ class EventParticipantViewSet(viewsets.ModelViewSet):
                     {"error": "You are already registered for this event"},
                     status=status.HTTP_400_BAD_REQUEST
                 )
-                
-            # Check if the event has reached its capacity
-            if event.max_participants and event.max_participants > 0:
-                current_participants = EventParticipant.objects.filter(
-                    event=event, 
-                    status__in=['registered', 'attended']
-                ).count()
-                
-                if current_participants >= event.max_participants:
-                    return Response(
-                        {"error": "This event has reached its maximum capacity"},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
             
             # Create serializer with event ID and user
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
             
-            # Get updated participant count
-            updated_count = EventParticipant.objects.filter(
-                event=event, 
-                status__in=['registered', 'attended']
-            ).count()
+            # Take the seat and create the registration together, so a failed
+            # insert gives the seat back
+            with transaction.atomic():
+                takes_seat = serializer.validated_data.get('status', 'registered') in ACTIVE_PARTICIPANT_STATUSES
+                if takes_seat and not Event.reserve_seat(event.id):
+                    if request.data.get('join_waitlist'):
+                        self.waitlist_service.join(event, request.user)
+                        return Response({
+                            "status": "waitlisted",
+                            "position": self.waitlist_service.position(event, request.user)
+                        }, status=status.HTTP_202_ACCEPTED)
+                    return Response(
+                        {
+                            "error": "This event has reached its maximum capacity",
+                            "waitlist_available": True
+                        },
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                self.perform_create(serializer)
             
             # Include capacity information in response
+            event.refresh_from_db(fields=['registered_count'])
             response_data = serializer.data
             response_data.update({
-                'event_capacity': {
-                    'max_participants': event.max_participants,
-                    'current_participants': updated_count,
-                    'spots_remaining': event.max_participants - updated_count if event.max_participants else None,
-                    'is_full': event.max_participants and updated_count >= event.max_participants
-                }
+                'event_capacity': self._capacity_data(event)
             })
             
             headers = self.get_success_headers(serializer.data)
@@ -756,11 +962,62 @@ class EventParticipantViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def perform_update(self, serializer):
+        """
+        Keep Event.registered_count in step when a registration is canceled,
+        reinstated or moved to another event, and hand freed seats to the
+        waitlist
+        """
+        with transaction.atomic():
+            # Judge the change against the locked row, not the instance
+            # loaded before the transaction, so concurrent cancels of one
+            # registration release its seat only once
+            current = EventParticipant.objects.select_for_update().only(
+                'event_id', 'status'
+            ).get(pk=serializer.instance.pk)
+            old_event_id = current.event_id
+            was_active = current.status in ACTIVE_PARTICIPANT_STATUSES
+            
+            participant = serializer.save()
+            is_active = participant.status in ACTIVE_PARTICIPANT_STATUSES
+            
+            if was_active and (not is_active or participant.event_id != old_event_id):
+                Event.release_seat(old_event_id)
+                self.waitlist_service.promote(old_event_id)
+            if is_active and (not was_active or participant.event_id != old_event_id):
+                if not Event.reserve_seat(participant.event_id):
+                    raise ValidationError("This event has reached its maximum capacity")
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            # Only the request that actually deleted the row gives its seat
+            # back, so concurrent deletes cannot release it twice
+            deleted, _ = EventParticipant.objects.filter(
+                pk=instance.pk, status__in=ACTIVE_PARTICIPANT_STATUSES
+            ).delete()
+            if deleted:
+                Event.release_seat(instance.event_id)
+                self.waitlist_service.promote(instance.event_id)
+            else:
+                EventParticipant.objects.filter(pk=instance.pk).delete()
+
+    def _capacity_data(self, event):
+        return {
+            'max_participants': event.max_participants,
+            'current_participants': event.registered_count,
+            'spots_remaining': event.spots_remaining,
+            'is_full': event.is_full
+        }
+
     @action(detail=False, methods=["get"])
     def my_participations(self, request):
         participations = self.queryset.filter(user=request.user)
-        serializer = self.get_serializer(participations, many=True)
-        return Response(serializer.data)
+        
+        # Only this action is paginated; the participant list keeps its plain shape
+        paginator = ParticipantCursorPagination()
+        page = paginator.paginate_queryset(participations, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
         
     @action(detail=False, methods=["get"])
     def event_capacity(self, request):
@@ -775,18 +1032,10 @@ class EventParticipantViewSet(viewsets.ModelViewSet):
             )
             
         try:
-            event = Event.objects.get(id=event_id)
-            current_participants = EventParticipant.objects.filter(
-                event=event, 
-                status__in=['registered', 'attended']
-            ).count()
-            
-            return Response({
-                'max_participants': event.max_participants,
-                'current_participants': current_participants,
-                'spots_remaining': event.max_participants - current_participants if event.max_participants else None,
-                'is_full': event.max_participants and current_participants >= event.max_participants
-            })
+            event = Event.objects.only(
+                'id', 'max_participants', 'registered_count'
+            ).get(id=event_id)
+            return Response(self._capacity_data(event))
             
         except Event.DoesNotExist:
             return Response(
@@ -806,9 +1055,27 @@ class EventUpdateViewSet(viewsets.ModelViewSet):
 class EventFeedbackViewSet(viewsets.ModelViewSet):
     serializer_class = EventFeedbackSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = FeedbackCursorPagination
     
     def get_queryset(self):
-        return EventFeedback.objects.filter(event_id=self.kwargs.get('event_id'))
+        queryset = EventFeedback.objects.filter(event_id=self.kwargs.get('event_id')).select_related('user')
+        if self.action == 'list' and self.request.query_params.get('user') == 'me':
+            queryset = queryset.filter(user=self.request.user)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        An event's feedback, a page at a time. Pass ?summary=true to add the
+        event's rating average and histogram, and ?user=me for just your own
+        feedback.
+        """
+        response = super().list(request, *args, **kwargs)
+        if request.query_params.get('summary', '').lower() in ('true', '1'):
+            event = get_object_or_404(Event.objects.only(
+                'id', 'rating_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5'
+            ), id=self.kwargs.get('event_id'))
+            response.data['summary'] = event.rating_summary
+        return response
     
     def perform_create(self, serializer):
         event_id = self.kwargs.get('event_id')
@@ -822,13 +1089,48 @@ class EventFeedbackViewSet(viewsets.ModelViewSet):
         if EventFeedback.objects.filter(event=event, user=self.request.user).exists():
             raise ValidationError("You have already left feedback for this event")
             
-        serializer.save(user=self.request.user, event=event)
+        # events.ratings adds the rating to the event's statistics
+        with transaction.atomic():
+            serializer.save(user=self.request.user, event=event)
+
+    def perform_update(self, serializer):
+        if serializer.instance.user_id != self.request.user.id:
+            raise PermissionDenied("You can only edit your own feedback")
+
+        with transaction.atomic():
+            # Read the rating being replaced under a lock, so concurrent edits
+            # each move the statistics (in events.ratings) from the value
+            # they overwrite
+            serializer.instance._loaded_rating = EventFeedback.objects.select_for_update().values_list(
+                'event_id', 'rating'
+            ).get(id=serializer.instance.id)
+            serializer.save(event=serializer.instance.event)
+
+    def perform_destroy(self, instance):
+        if instance.user_id != self.request.user.id and self.request.user.user_role != 'admin':
+            raise PermissionDenied("You can only delete your own feedback")
+
+        # Delete the row as locked, so only the request that finds it still
+        # there deletes it and takes its rating out (in events.ratings);
+        # concurrent deletes cannot count it twice
+        with transaction.atomic():
+            feedback = EventFeedback.objects.select_for_update().filter(pk=instance.pk).first()
+            if feedback is not None:
+                feedback.delete()
 
 
 class EventQuestionViewSet(viewsets.ModelViewSet):
     queryset = EventQuestion.objects.all()
     serializer_class = EventQuestionSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = QuestionCursorPagination
+
+    def get_queryset(self):
+        queryset = EventQuestion.objects.with_thread()
+        event_id = self.request.query_params.get('event')
+        if event_id and event_id.isdigit():
+            queryset = queryset.filter(event_id=event_id)
+        return queryset
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -836,8 +1138,7 @@ class EventQuestionViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def answers(self, request, pk=None):
         """Add an answer to a question"""
-        question = self.get_object()
-        event = question.event
+        question = get_object_or_404(EventQuestion.objects.select_related('event'), pk=pk)
         
         serializer = EventAnswerSerializer(data={
             'question': question.id,
@@ -845,51 +1146,118 @@ class EventQuestionViewSet(viewsets.ModelViewSet):
         })
         
         if serializer.is_valid():
-            # Save answer with the current user
-            answer = serializer.save(user=request.user)
+            # Save answer with the current user. Whether it is official is
+            # decided once here and stored, so reading a thread needs no
+            # per-answer permission checks.
+            serializer.save(
+                user=request.user,
+                is_official=EventAnswer.answers_officially(request.user, question.event)
+            )
             
             # Mark the question as answered
             if not question.is_answered:
                 question.is_answered = True
-                question.save()
-                
-            # Include whether this is an official response in the response data
-            # This should be true only if:
-            # 1. The user is the event creator (organizer)
-            # 2. The user is an admin
-            # 3. The user is a coordinator assigned to this event
-            is_admin = request.user.user_role == 'admin'
-            is_event_creator = request.user == event.created_by
-            is_event_coordinator = request.user.user_role == 'coordinator' and hasattr(event, 'coordinators') and request.user in event.coordinators.all()
-            
-            data = serializer.data
-            data['is_official'] = is_admin or is_event_creator or is_event_coordinator
-            
-            return Response(data, status=201)
+                question.save(update_fields=['is_answered', 'updated_at'])
+            
+            return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
 
 
 class EventTagViewSet(viewsets.ModelViewSet):
     queryset = EventTag.objects.all()
     serializer_class = EventTagSerializer
+    cache_namespace = 'tags'
+    cache_timeout = 300
+
+    def get_conditional_state(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.lookup_field in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
+        return rows_state(queryset)
+
+    @conditional_response
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
     
     @action(detail=True)
+    @cached_response
     def events(self, request, pk=None):
         """Get all events with this tag"""
         tag = self.get_object()
-        events = Event.objects.filter(tags=tag)
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data)
+        events = Event.objects.for_serializer(
+            expand=EventCardSerializer.requested_expansions(request)
+        ).filter(tags=tag)
+        
+        paginator = EventCursorPagination()
+        page = paginator.paginate_queryset(events, request, view=self)
+        serializer = EventCardSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
 
 
 class VenueViewSet(viewsets.ModelViewSet):
     queryset = Venue.objects.all()
     serializer_class = VenueSerializer
+    cache_namespace = 'venues'
+    cache_timeout = 600
+    venue_calendar = VenueCalendarService()
+    max_availability_days = 90
     
     def get_permissions(self):
         """
         Allow anyone to view venues, but only admin to modify them.
         """
-        if self.action in ['list', 'retrieve']:
+        if self.action in ['list', 'retrieve', 'availability']:
             return []
         return [IsAuthenticated()]
+
+    @action(detail=True, methods=['get'])
+    def availability(self, request, pk=None):
+        """
+        Bookings and free intervals of a venue between ?from= and ?to=
+        (dates or datetimes; by default the next 7 days)
+        """
+        venue = self.get_object()
+        starts_at = parse_moment(request.query_params, 'from') or timezone.now()
+        ends_at = parse_moment(request.query_params, 'to', end_of_day=True) or starts_at + timedelta(days=7)
+
+        if ends_at <= starts_at:
+            return Response(
+                {"error": "'to' must be after 'from'"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if ends_at - starts_at > timedelta(days=self.max_availability_days):
+            return Response(
+                {"error": f"The window can be at most {self.max_availability_days} days"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        calendar = self.venue_calendar.availability(venue, starts_at, ends_at)
+        return Response({
+            'venue': venue.id,
+            'from': starts_at,
+            'to': ends_at,
+            'available': not calendar['bookings'],
+            **calendar
+        })
+
+    def get_conditional_state(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.lookup_field in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
+        return rows_state(queryset)
+
+    @conditional_response
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
@@ -108,6 +108,7 @@ INSTALLED_APPS = [
     "allauth.socialaccount.providers.google",
     "events",
     "payments",
+    "dashboard",
 ]
 
 MIDDLEWARE = [
@@ -161,6 +162,39 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# CACHE_BACKEND picks the backend: locmem (default, per process), file
+# (shared by the processes on one host) or redis (needs the redis package).
+# Use redis in production: response caching needs a cache every worker
+# shares, since a write only invalidates the cache of the worker handling it.
+
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "eventsphere",
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", str(BASE_DIR / "cache")),
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/1"),
+    },
+}
+
+CACHES = {
+    "default": CACHE_BACKENDS[os.environ.get("CACHE_BACKEND", "locmem")],
+}
+
+# With the per-process locmem backend, API responses are only cached when
+# the server runs as a single process (like runserver) and says so here
+RESPONSE_CACHE_SINGLE_PROCESS = os.environ.get(
+    "RESPONSE_CACHE_SINGLE_PROCESS", str(DEBUG)
+).lower() == "true"
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
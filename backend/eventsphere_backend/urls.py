@@ -36,6 +36,7 @@ urlpatterns = [
     path("users/", include("users.urls")),
     path("events/", include("events.urls")),
     path("payments/", include("payments.urls")),
+    path("dashboard/", include("dashboard.urls")),
     
     # Direct API endpoints at root level
     path("", include(api_router.urls)),
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_event_indexes'),
+        ('payments', '0002_alter_payment_options_payment_booking_hours_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['event', 'payment_status', 'created_at'], name='payment_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['razorpay_order_id'], name='payment_rzp_order_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:26
+
+from django.conf import settings
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_booking_intervals(apps, schema_editor):
+    Payment = apps.get_model('payments', 'Payment')
+
+    payments = []
+    for payment in Payment.objects.filter(venue__isnull=False).select_related('event').iterator(chunk_size=500):
+        payment.booked_from = payment.event.event_time
+        payment.booked_until = payment.booked_from + timedelta(hours=payment.booking_hours)
+        payments.append(payment)
+    Payment.objects.bulk_update(payments, ['booked_from', 'booked_until'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_venue_location'),
+        ('payments', '0003_payment_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='booked_from',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='booked_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['venue', 'booked_from'], name='payment_venue_booking_idx'),
+        ),
+        migrations.RunPython(backfill_booking_intervals, migrations.RunPython.noop),
+    ]
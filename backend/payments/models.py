@@ -47,8 +47,26 @@ class Payment(models.Model):
     # Number of hours the venue is booked for
     booking_hours = models.PositiveIntegerField(default=3)
 
+    # The interval the venue is held for, from the event time for
+    # booking_hours. Set only on payments that book a venue.
+    booked_from = models.DateTimeField(null=True, blank=True)
+    booked_until = models.DateTimeField(null=True, blank=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status, so a save can tell that it changed it
+        if 'payment_status' in field_names:
+            instance._loaded_status = values[field_names.index('payment_status')]
+        return instance
+
     def __str__(self):
         return f"Payment {self.id} - {self.event.event_name} - {self.payment_status}"
         
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['event', 'payment_status', 'created_at'], name='payment_event_status_idx'),
+            models.Index(fields=['razorpay_order_id'], name='payment_rzp_order_idx'),
+            models.Index(fields=['venue', 'booked_from'], name='payment_venue_booking_idx'),
+        ]
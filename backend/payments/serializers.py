@@ -16,9 +16,11 @@ class PaymentSerializer(serializers.ModelSerializer):
             'venue', 'venue_details', 'amount', 'payment_method', 'payment_status',
             'payment_type', 'transaction_id', 'created_at', 'updated_at',
             'razorpay_order_id', 'razorpay_payment_id', 'razorpay_signature',
-            'payment_details', 'booking_hours', 'razorpay_order_details'
+            'payment_details', 'booking_hours', 'razorpay_order_details',
+            'booked_from', 'booked_until'
         ]
         read_only_fields = [
+            'booked_from', 'booked_until',
             'razorpay_order_id', 'razorpay_payment_id', 'razorpay_signature',
             'transaction_id', 'payment_details', 'razorpay_order_details',
             'coordinator_name', 'event_name', 'venue_details'
@@ -2,8 +2,14 @@ import razorpay
 import json
 import logging
 from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from datetime import timedelta
 from decimal import Decimal
 
+from events.models import Venue
+from .models import Payment
+
 logger = logging.getLogger(__name__)
 
 class RazorpayService:
@@ -137,4 +143,135 @@ class RazorpayService:
         if venue.capacity > 200:
             base_price += Decimal('500.00')
         
-        return base_price 
\ No newline at end of file
+        return base_price 
+
+
+class VenueCalendarService:
+    """
+    Venue bookings, read from the payments that hold a venue.
+
+    A payment holds its venue from booked_from to booked_until while it is
+    completed, or pending for less than PENDING_HOLD (an abandoned checkout
+    stops blocking the venue). Bookings last at most MAX_BOOKING_HOURS, so
+    every booking overlapping a window starts less than that before the
+    window: each lookup is one bounded range scan of the (venue,
+    booked_from) index, O(log n) in the number of bookings plus the
+    bookings returned.
+    """
+    MAX_BOOKING_HOURS = 24
+    PENDING_HOLD = timedelta(minutes=30)
+
+    def bookings(self, venue, starts_at, ends_at):
+        """
+        Bookings of a venue that overlap [starts_at, ends_at)
+
+        Args:
+            venue: Venue object or ID
+            starts_at: Start of the window
+            ends_at: End of the window
+
+        Returns:
+            QuerySet: Holding payments ordered by booked_from
+        """
+        holding = Q(payment_status='completed') | Q(
+            payment_status='pending',
+            created_at__gte=timezone.now() - self.PENDING_HOLD
+        )
+        return Payment.objects.filter(
+            holding,
+            venue=venue,
+            booked_from__gt=starts_at - timedelta(hours=self.MAX_BOOKING_HOURS),
+            booked_from__lt=ends_at,
+            booked_until__gt=starts_at
+        ).order_by('booked_from', 'id')
+
+    def lock_venue(self, venue):
+        """
+        Lock a venue's row until the current transaction ends, so two
+        requests cannot both pass the conflict check for the same slot
+        """
+        Venue.objects.select_for_update().filter(pk=getattr(venue, 'pk', venue)).exists()
+
+    def conflicts(self, venue, starts_at, ends_at, exclude_payment=None, exclude_event=None):
+        """
+        Bookings that a new booking of [starts_at, ends_at) would overlap
+
+        Args:
+            venue: Venue object or ID
+            starts_at: Start of the new booking
+            ends_at: End of the new booking
+            exclude_payment: Payment to leave out, e.g. the one being completed
+            exclude_event: Event (or ID) whose own bookings never conflict, so
+                a retried checkout is not refused because of the first attempt
+
+        Returns:
+            list: Conflicting Payment objects (empty if the venue is free)
+        """
+        bookings = self.bookings(venue, starts_at, ends_at)
+        if exclude_payment is not None:
+            bookings = bookings.exclude(pk=exclude_payment.pk)
+        if exclude_event is not None:
+            bookings = bookings.exclude(event_id=getattr(exclude_event, 'pk', exclude_event))
+        return list(bookings.only('id', 'event_id', 'booked_from', 'booked_until', 'payment_status'))
+
+    def completion_conflicts(self, payment):
+        """
+        Bookings that stop a pending payment from completing. Its hold lapses
+        after PENDING_HOLD, so a slow checkout may find the slot taken by then.
+        Call inside a transaction: the venue stays locked until it ends.
+
+        Returns:
+            list: Conflicting Payment objects (empty if the payment may complete)
+        """
+        if not payment.venue_id or not payment.booked_from:
+            return []
+        self.lock_venue(payment.venue_id)
+        return self.conflicts(
+            payment.venue_id, payment.booked_from, payment.booked_until,
+            exclude_payment=payment, exclude_event=payment.event_id
+        )
+
+    @staticmethod
+    def describe_conflicts(conflicts):
+        return [
+            {
+                'event_id': booking.event_id,
+                'starts_at': booking.booked_from,
+                'ends_at': booking.booked_until,
+            }
+            for booking in conflicts
+        ]
+
+    def availability(self, venue, starts_at, ends_at):
+        """
+        Booked and free intervals of a venue within [starts_at, ends_at)
+
+        Returns:
+            dict: 'bookings' and 'free' lists of intervals
+        """
+        bookings = list(self.bookings(venue, starts_at, ends_at).values(
+            'id', 'event_id', 'booked_from', 'booked_until', 'payment_status'
+        ))
+
+        free = []
+        cursor = starts_at
+        for booking in bookings:
+            if booking['booked_from'] > cursor:
+                free.append({'starts_at': cursor, 'ends_at': booking['booked_from']})
+            cursor = max(cursor, booking['booked_until'])
+        if cursor < ends_at:
+            free.append({'starts_at': cursor, 'ends_at': ends_at})
+
+        return {
+            'bookings': [
+                {
+                    'payment_id': booking['id'],
+                    'event_id': booking['event_id'],
+                    'starts_at': booking['booked_from'],
+                    'ends_at': booking['booked_until'],
+                    'status': booking['payment_status'],
+                }
+                for booking in bookings
+            ],
+            'free': free,
+        }
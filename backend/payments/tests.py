@@ -1,3 +1,91 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from events.models import Event, Venue
+from payments.models import Payment
+from payments.services import RazorpayService, VenueCalendarService
+from users.models import User
+
+
+class VenueBookingTests(TestCase):
+    """
+    A venue slot is held by one event, and a lapsed hold cannot complete
+    over a booking made in the meantime
+    """
+
+    def setUp(self):
+        self.coordinator = User.objects.create(
+            username='coordinator', email='coordinator@example.com', user_role='coordinator'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.coordinator)
+        self.venue = Venue.objects.create(
+            name='Hall', address='Main street', capacity=100, price_per_hour=Decimal('10.00'),
+            description='', image_url='https://example.com/hall.png',
+        )
+        self.starts_at = timezone.now() + timedelta(days=7)
+        self.events = [
+            Event.objects.create(
+                created_by=self.coordinator, event_name=f'Event {index}', event_type='workshop',
+                is_paid=False, event_time=self.starts_at,
+            )
+            for index in range(2)
+        ]
+        self.calendar = VenueCalendarService()
+
+    def book(self, event, payment_status='pending', **fields):
+        return Payment.objects.create(
+            event=event, coordinator=self.coordinator, venue=self.venue, amount=Decimal('30.00'),
+            payment_status=payment_status, booked_from=self.starts_at,
+            booked_until=self.starts_at + timedelta(hours=3), **fields
+        )
+
+    def test_event_does_not_conflict_with_its_own_hold(self):
+        self.book(self.events[0])
+        ends_at = self.starts_at + timedelta(hours=3)
+
+        self.assertEqual(
+            self.calendar.conflicts(self.venue, self.starts_at, ends_at, exclude_event=self.events[0]), []
+        )
+        self.assertEqual(
+            len(self.calendar.conflicts(self.venue, self.starts_at, ends_at, exclude_event=self.events[1])), 1
+        )
+
+    def test_lapsed_hold_fails_verification_when_the_slot_was_taken(self):
+        lapsed = self.book(self.events[0], razorpay_order_id='order_1')
+        Payment.objects.filter(pk=lapsed.pk).update(
+            created_at=timezone.now() - self.calendar.PENDING_HOLD - timedelta(minutes=1)
+        )
+        taken = self.book(self.events[1], payment_status='completed')
+
+        with mock.patch.object(RazorpayService, 'verify_payment_signature', return_value=True):
+            response = self.client.post(f'/api/payments/{lapsed.id}/verify_payment/', {
+                'razorpay_payment_id': 'pay_1',
+                'razorpay_order_id': 'order_1',
+                'razorpay_signature': 'signature',
+            })
+
+        self.assertEqual(response.status_code, 409)
+        lapsed.refresh_from_db()
+        self.assertEqual(lapsed.payment_status, 'failed')
+        self.assertEqual(lapsed.payment_details['venue_conflicts'], [taken.id])
+
+    def test_verification_completes_a_free_slot(self):
+        payment = self.book(self.events[0], razorpay_order_id='order_1')
+
+        with mock.patch.object(RazorpayService, 'verify_payment_signature', return_value=True), \
+                mock.patch.object(RazorpayService, 'get_payment_details', return_value=None):
+            response = self.client.post(f'/api/payments/{payment.id}/verify_payment/', {
+                'razorpay_payment_id': 'pay_1',
+                'razorpay_order_id': 'order_1',
+                'razorpay_signature': 'signature',
+            })
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 200)
+        payment.refresh_from_db()
+        self.assertEqual(payment.payment_status, 'completed')
@@ -11,10 +11,11 @@ from rest_framework.permissions import IsAuthenticated
 
 from .models import Payment
 from .serializers import PaymentSerializer
-from .services import RazorpayService
+from .services import RazorpayService, VenueCalendarService
 
 import logging
 import json
+from datetime import timedelta
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class PaymentViewSet(viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
     permission_classes = [permissions.IsAuthenticated]
     razorpay_service = RazorpayService()
+    venue_calendar = VenueCalendarService()
 
     def get_queryset(self):
         """Filter payments based on user role"""
@@ -37,6 +39,8 @@ class PaymentViewSet(viewsets.ModelViewSet):
         """
         Create a payment for event creation if user is a coordinator.
         For admins, the payment is automatically marked as completed.
+        A payment with a venue books it from the event time for
+        booking_hours, and is refused with 409 if that overlaps a booking.
         """
         # Extract data from request
         event_id = request.data.get("event")
@@ -52,6 +56,12 @@ class PaymentViewSet(viewsets.ModelViewSet):
                 {"error": "Event ID is required"}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+
+        if not 1 <= booking_hours <= self.venue_calendar.MAX_BOOKING_HOURS:
+            return Response(
+                {"error": f"Booking hours must be between 1 and {self.venue_calendar.MAX_BOOKING_HOURS}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         try:
             # Get related objects
@@ -72,33 +82,58 @@ class PaymentViewSet(viewsets.ModelViewSet):
             
             logger.info(f"Final amount for payment: {final_amount}")
             
-            # Check if user is admin or coordinator
-            if request.user.user_role == 'admin':
-                # Admins don't need to pay
+            booked_from = booked_until = None
+            if venue:
+                booked_from = event.event_time
+                booked_until = booked_from + timedelta(hours=booking_hours)
+            
+            with transaction.atomic():
+                if venue:
+                    self.venue_calendar.lock_venue(venue)
+                    # The event's own bookings, such as an earlier attempt at
+                    # this checkout, do not conflict
+                    conflicts = self.venue_calendar.conflicts(
+                        venue, booked_from, booked_until, exclude_event=event
+                    )
+                    if conflicts:
+                        logger.info(f"Refused booking of venue {venue.id} for event {event.id}: {len(conflicts)} conflicts")
+                        return Response({
+                            "error": "The venue is already booked at this time",
+                            "conflicts": self.venue_calendar.describe_conflicts(conflicts)
+                        }, status=status.HTTP_409_CONFLICT)
+                
+                # Check if user is admin or coordinator
+                if request.user.user_role == 'admin':
+                    # Admins don't need to pay
+                    payment = Payment.objects.create(
+                        event=event,
+                        coordinator=request.user,
+                        venue=venue,
+                        amount=final_amount,
+                        payment_status='completed',
+                        payment_type='event_creation',
+                        booking_hours=booking_hours,
+                        booked_from=booked_from,
+                        booked_until=booked_until,
+                        transaction_id=f"ADMIN_FREE_{event.id}"
+                    )
+                    serializer = self.get_serializer(payment)
+                    return Response(serializer.data, status=status.HTTP_201_CREATED)
+                
+                # For coordinators, create Razorpay order
+                # Create a pending payment first; it holds the venue while
+                # the checkout completes
                 payment = Payment.objects.create(
                     event=event,
                     coordinator=request.user,
                     venue=venue,
                     amount=final_amount,
-                    payment_status='completed',
+                    payment_status='pending',
                     payment_type='event_creation',
                     booking_hours=booking_hours,
-                    transaction_id=f"ADMIN_FREE_{event.id}"
+                    booked_from=booked_from,
+                    booked_until=booked_until
                 )
-                serializer = self.get_serializer(payment)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            
-            # For coordinators, create Razorpay order
-            # Create a pending payment first
-            payment = Payment.objects.create(
-                event=event,
-                coordinator=request.user,
-                venue=venue,
-                amount=final_amount,
-                payment_status='pending',
-                payment_type='event_creation',
-                booking_hours=booking_hours
-            )
             
             # Create Razorpay order
             notes = {
@@ -188,6 +223,16 @@ class PaymentViewSet(viewsets.ModelViewSet):
         
         try:
             with transaction.atomic():
+                # The venue hold may have lapsed during checkout; recheck it
+                # under the venue lock before the booking becomes final
+                conflicts = self.venue_calendar.completion_conflicts(payment)
+                if conflicts:
+                    self._refuse_completion(payment, conflicts, razorpay_payment_id=razorpay_payment_id)
+                    return Response({
+                        "error": "The venue was booked by someone else before the payment completed; it will be refunded",
+                        "conflicts": self.venue_calendar.describe_conflicts(conflicts)
+                    }, status=status.HTTP_409_CONFLICT)
+
                 # Update payment with verification details
                 payment.razorpay_payment_id = razorpay_payment_id
                 payment.razorpay_signature = razorpay_signature
@@ -221,6 +266,23 @@ class PaymentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def _refuse_completion(self, payment, conflicts, **details):
+        """
+        Fail a paid checkout whose venue slot was taken in the meantime,
+        recording the conflicts so the payment can be refunded
+        """
+        logger.warning(
+            f"Payment {payment.id} for event {payment.event_id} lost venue {payment.venue_id} "
+            f"to {len(conflicts)} bookings; refund needed"
+        )
+        payment.payment_status = 'failed'
+        payment.payment_details = payment.payment_details or {}
+        payment.payment_details.update(details)
+        payment.payment_details['venue_conflicts'] = [
+            booking.id for booking in conflicts
+        ]
+        payment.save()
+
     @action(detail=False, methods=["post"])
     def razorpay_webhook(self, request):
         """
@@ -240,16 +302,22 @@ class PaymentViewSet(viewsets.ModelViewSet):
                 payment_id = webhook_data.get('payload', {}).get('payment', {}).get('entity', {}).get('order_id')
                 if payment_id:
                     try:
-                        payment = Payment.objects.get(razorpay_order_id=payment_id)
-                        payment.payment_status = 'completed'
-                        payment.payment_details.update({'webhook_data': webhook_data})
-                        payment.save()
-                        
-                        # Update event status if needed
-                        event = payment.event
-                        if event.status == 'draft':
-                            event.status = 'upcoming'
-                            event.save()
+                        with transaction.atomic():
+                            payment = Payment.objects.get(razorpay_order_id=payment_id)
+                            conflicts = self.venue_calendar.completion_conflicts(payment)
+                            if conflicts:
+                                self._refuse_completion(payment, conflicts, webhook_data=webhook_data)
+                                return HttpResponse(status=200)
+
+                            payment.payment_status = 'completed'
+                            payment.payment_details.update({'webhook_data': webhook_data})
+                            payment.save()
+                            
+                            # Update event status if needed
+                            event = payment.event
+                            if event.status == 'draft':
+                                event.status = 'upcoming'
+                                event.save()
                             
                     except Payment.DoesNotExist:
                         logger.error(f"Payment not found for order: {payment_id}")
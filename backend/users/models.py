@@ -79,5 +79,10 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name', 'username', 'phone']
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['created_at'], name='user_created_at_idx'),
+        ]
+
     def __str__(self):
         return self.username
\ No newline at end of file
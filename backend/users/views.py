@@ -7,9 +7,10 @@ from django.conf import settings
 from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail, EmailMessage
-from django.db.models import Q, Count, Sum
+from django.db.models import Q, Count, OuterRef, Subquery, Sum
 from django.db.models.functions import TruncMonth
 from rest_framework.decorators import action
+from django.utils import timezone
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import generics, status, viewsets, permissions
@@ -21,13 +22,16 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from .models import User
 from .serializers import LoginSerializer, UserSerializer, UserProfileSerializer
-from events.models import Event
+from events.models import DailyEventRollup, DailySignupRollup, Event, Venue
 from payments.models import Payment
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
 
+# Venue utilisation on the admin dashboard is over this many past days
+VENUE_UTILISATION_DAYS = 30
+
 # Combined user profile view for GET, PATCH, and PUT methods
 class ProfileView(APIView):
     permission_classes = [IsAuthenticated]
@@ -145,150 +149,105 @@ class UserStatsView(APIView):
         # Get basic counts
         total_users = User.objects.count()
         total_events = Event.objects.count()
-        active_events = Event.objects.filter(status='upcoming').count()
+        active_events = Event.objects.filter(Event.effective_status_q('upcoming')).count()
         pending_requests = User.objects.filter(coordinator_request=True).count()
         
-        # Get total revenue
-        total_revenue = Payment.objects.filter(payment_status='completed').aggregate(Sum('amount'))
-        total_revenue = total_revenue['amount__sum'] or 0
-        
-        # Get monthly revenue data
-        current_year = datetime.now().year
-        monthly_revenue = Payment.objects.filter(
-            payment_status='completed',
-            created_at__year=current_year
-        ).annotate(
-            month=TruncMonth('created_at')
-        ).values('month').annotate(
-            revenue=Sum('amount')
-        ).order_by('month')
+        # Revenue, monthly series, growth and distributions are read from the
+        # daily rollup tables built by the build_rollups command
+        rollups = DailyEventRollup.objects.all()
+        total_revenue = rollups.aggregate(total=Sum('revenue'))['total'] or 0
         
-        # Process monthly data into format dashboard expects
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        revenue_data = [0] * 12
+        # One pass over the months from the start of the year (or of the
+        # previous month, in January) feeds both the charts and the growth rates
+        today = timezone.localdate()
+        current_year = today.year
+        current_month_start = today.replace(day=1)
+        prev_month_start = (current_month_start - timedelta(days=1)).replace(day=1)
+        range_start = min(current_month_start.replace(month=1), prev_month_start)
         
-        for item in monthly_revenue:
-            if item['month']:
-                month_index = item['month'].month - 1  # 0-based index
-                revenue_data[month_index] = int(item['revenue'] or 0)
-        
-        # Get monthly events data
-        monthly_events = Event.objects.filter(
-            created_at__year=current_year
-        ).annotate(
-            month=TruncMonth('created_at')
+        monthly_rollups = rollups.filter(date__gte=range_start).annotate(
+            month=TruncMonth('date')
         ).values('month').annotate(
-            count=Count('id')
+            revenue=Sum('revenue'),
+            events=Sum('events_created')
         ).order_by('month')
         
-        events_data = [0] * 12
-        for item in monthly_events:
-            if item['month']:
-                month_index = item['month'].month - 1  # 0-based index
-                events_data[month_index] = item['count']
-        
-        # Get monthly user signups
-        monthly_users = User.objects.filter(
-            created_at__year=current_year
-        ).annotate(
-            month=TruncMonth('created_at')
+        monthly_signups = DailySignupRollup.objects.filter(date__gte=range_start).annotate(
+            month=TruncMonth('date')
         ).values('month').annotate(
-            count=Count('id')
+            count=Sum('new_users')
         ).order_by('month')
         
+        # Process monthly data into format dashboard expects
+        revenue_data = [0] * 12
+        events_data = [0] * 12
         users_data = [0] * 12
-        for item in monthly_users:
+        by_month = {}
+        
+        for item in monthly_rollups:
             if item['month']:
-                month_index = item['month'].month - 1  # 0-based index
-                users_data[month_index] = item['count']
+                by_month[item['month']] = item
+                if item['month'].year == current_year:
+                    month_index = item['month'].month - 1  # 0-based index
+                    revenue_data[month_index] = int(item['revenue'] or 0)
+                    events_data[month_index] = item['events'] or 0
+        
+        signups_by_month = {}
+        for item in monthly_signups:
+            if item['month']:
+                signups_by_month[item['month']] = item['count'] or 0
+                if item['month'].year == current_year:
+                    users_data[item['month'].month - 1] = item['count'] or 0
         
         # Calculate growth rates
         # Current month vs. previous month
-        now = datetime.now()
-        current_month_start = datetime(now.year, now.month, 1)
-        prev_month_start = (current_month_start - timedelta(days=1)).replace(day=1)
-        
-        current_month_users = User.objects.filter(created_at__gte=current_month_start).count()
-        prev_month_users = User.objects.filter(
-            created_at__gte=prev_month_start,
-            created_at__lt=current_month_start
-        ).count()
-        
-        current_month_events = Event.objects.filter(created_at__gte=current_month_start).count()
-        prev_month_events = Event.objects.filter(
-            created_at__gte=prev_month_start,
-            created_at__lt=current_month_start
-        ).count()
-        
-        current_month_revenue = Payment.objects.filter(
-            created_at__gte=current_month_start,
-            payment_status='completed'
-        ).aggregate(Sum('amount'))['amount__sum'] or 0
-        
-        prev_month_revenue = Payment.objects.filter(
-            created_at__gte=prev_month_start,
-            created_at__lt=current_month_start,
-            payment_status='completed'
-        ).aggregate(Sum('amount'))['amount__sum'] or 0
+        current_month = by_month.get(current_month_start, {})
+        prev_month = by_month.get(prev_month_start, {})
         
         # Calculate growth percentages with safe division
-        user_growth = calculate_growth(prev_month_users, current_month_users)
-        event_growth = calculate_growth(prev_month_events, current_month_events)
-        revenue_growth = calculate_growth(prev_month_revenue, current_month_revenue)
+        user_growth = calculate_growth(
+            signups_by_month.get(prev_month_start, 0), signups_by_month.get(current_month_start, 0)
+        )
+        event_growth = calculate_growth(prev_month.get('events') or 0, current_month.get('events') or 0)
+        revenue_growth = calculate_growth(prev_month.get('revenue') or 0, current_month.get('revenue') or 0)
         
         # Get event types distribution
-        event_types = Event.objects.values('event_type').annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]  # Top 5 event types
-        
-        # Get popular venues
-        popular_venues = []
-        try:
-            # First try to get from Venue model if it exists
-            from events.models import Venue
-            venue_events = Event.objects.filter(venue__isnull=False).values('venue').annotate(
-                count=Count('id')
-            ).order_by('-count')[:6]
-            
-            popular_venues = list(venue_events)
-            
-            # Add venue model details if available
-            for venue_data in popular_venues:
-                if venue_data.get('venue'):
-                    try:
-                        venue_obj = Venue.objects.filter(name=venue_data['venue']).first()
-                        if venue_obj:
-                            venue_data['name'] = venue_obj.name
-                            venue_data['address'] = venue_obj.address
-                    except:
-                        # If can't get detailed venue info, just use the name
-                        venue_data['name'] = venue_data['venue']
-        except ImportError:
-            # If Venue model not available, just count by venue string
-            venue_events = Event.objects.exclude(venue__isnull=True).exclude(venue='').values('venue').annotate(
-                count=Count('id')
-            ).order_by('-count')[:6]
-            
-            popular_venues = [
-                {'name': item['venue'], 'venue': item['venue'], 'count': item['count']}
-                for item in venue_events
-            ]
-            
-        # If still no data, provide sample data matching event creation page
-        if not popular_venues:
-            # Sample venues that match the ones in event creation
-            sample_venues = [
-                {'name': 'Corporate Executive Center', 'count': 5},
-                {'name': 'Workshop Studio', 'count': 4},
-                {'name': 'Grand Ballroom', 'count': 4},
-                {'name': 'Rooftop Concert Space', 'count': 3},
-                {'name': 'Kids Party Palace', 'count': 2},
-                {'name': 'Garden Terrace', 'count': 2}
-            ]
-            
-            # Only use sample data if we have events
-            if total_events > 0:
-                popular_venues = sample_venues
+        event_types = rollups.values('event_type').annotate(
+            count=Sum('events_created')
+        ).filter(count__gt=0).order_by('-count')[:5]  # Top 5 event types
+        
+        # Get popular venues, with their revenue and utilisation, in one
+        # joined aggregate. Payments are summed in subqueries so the join to
+        # events does not multiply them.
+        window_end = timezone.now()
+        window_start = window_end - timedelta(days=VENUE_UTILISATION_DAYS)
+        venue_payments = Payment.objects.filter(
+            venue=OuterRef('pk'), payment_status='completed'
+        ).order_by().values('venue')
+        
+        venues = Venue.objects.annotate(
+            count=Count('events'),
+            revenue=Subquery(venue_payments.annotate(total=Sum('amount')).values('total')),
+            booked_hours=Subquery(venue_payments.filter(
+                booked_from__gte=window_start,
+                booked_from__lt=window_end
+            ).annotate(total=Sum('booking_hours')).values('total'))
+        ).filter(count__gt=0).order_by('-count', 'name')[:6]
+        
+        window_hours = VENUE_UTILISATION_DAYS * 24
+        popular_venues = [
+            {
+                'id': venue.id,
+                'name': venue.name,
+                'venue': venue.name,
+                'address': venue.address,
+                'count': venue.count,
+                'revenue': float(venue.revenue or 0),
+                'booked_hours': venue.booked_hours or 0,
+                'utilisation': round((venue.booked_hours or 0) * 100 / window_hours, 1),
+            }
+            for venue in venues
+        ]
         
         return Response({
             'total_users': total_users,
@@ -17,7 +17,7 @@ const BookmarkedEvents = () => {
   const fetchBookmarkedEvents = async () => {
     try {
       const response = await api.get('/events/bookmarked/');
-      setEvents(response.data);
+      setEvents(response.data.results || response.data);
     } catch (error) {
       toast.error('Failed to load bookmarked events');
     } finally {
@@ -44,7 +44,7 @@ const EventQA = ({ event, isOrganizer }) => {
       console.log("Fetching questions for event:", event.id);
       // The correct endpoint for questions in the backend
       const response = await api.get(`/events/questions/?event=${event.id}`);
-      setQuestions(response.data);
+      setQuestions(response.data.results || response.data);
     } catch (error) {
       console.error("Error fetching questions:", error);
       // Set empty array on error to avoid undefined errors
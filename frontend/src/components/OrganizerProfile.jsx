@@ -50,7 +50,7 @@ const OrganizerProfile = ({ event }) => {
         try {
           // Try nested endpoint format
           const response = await api.get(`/events/events/?created_by=${event.created_by}`);
-          eventsData = response.data;
+          eventsData = response.data.results || response.data;
         } catch (err2) {
           error = err2;
           try {
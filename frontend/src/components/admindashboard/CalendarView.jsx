@@ -68,42 +68,22 @@ const CalendarView = () => {
       
       console.log(`Fetching events from ${formattedStartDate} to ${formattedEndDate}`);
       
-      // Try multiple endpoints
-      const endpoints = [
-        'events/',
-        'api/events/',
-        'events/events/',
-        `events/?start_date=${formattedStartDate}&end_date=${formattedEndDate}`,
-        `api/events/?start_date=${formattedStartDate}&end_date=${formattedEndDate}`,
-        `events/events/?start_date=${formattedStartDate}&end_date=${formattedEndDate}`
-      ];
+      // The catalogue filters by date and is cursor paginated, so walk
+      // every page of the range rather than stopping at the first
+      const endpoints = ['events/events/', 'api/events/'];
+      const params = {
+        starts_after: formattedStartDate,
+        starts_before: formattedEndDate,
+        ordering: 'event_time',
+      };
       
       let fetchedEvents = [];
       
       for (const endpoint of endpoints) {
         try {
           console.log(`Trying endpoint: ${endpoint}`);
-          const response = await api.get(endpoint);
-          console.log(`Response from ${endpoint}:`, response.data);
-          
-          if (response.data) {
-            if (Array.isArray(response.data)) {
-              fetchedEvents = response.data;
-              break;
-            } else if (response.data.results && Array.isArray(response.data.results)) {
-              fetchedEvents = response.data.results;
-              break;
-            } else if (typeof response.data === 'object') {
-              // Try to find an array in the response
-              for (const key in response.data) {
-                if (Array.isArray(response.data[key])) {
-                  fetchedEvents = response.data[key];
-                  break;
-                }
-              }
-              if (fetchedEvents.length > 0) break;
-            }
-          }
+          fetchedEvents = await api.getAll(endpoint, { params });
+          break;
         } catch (error) {
           console.warn(`Failed to fetch events from ${endpoint}`, error);
         }
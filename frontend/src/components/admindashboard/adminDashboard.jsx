@@ -323,51 +323,42 @@ const Dashboard = () => {
       // Get event count, active events, and monthly distribution
       let events = [];
       try {
-        const response = await api.get("/events/events/");
-        if (response.data) {
-          if (Array.isArray(response.data)) {
-            events = response.data;
-          } else if (response.data.results && Array.isArray(response.data.results)) {
-            events = response.data.results;
-          }
+        // The list is cursor paginated; totals need every page
+        events = await api.getAll("/events/events/");
+        if (events.length > 0) {
+          eventCount = events.length;
           
-          if (events.length > 0) {
-            eventCount = events.length;
-            
-            // Count active events (upcoming or ongoing)
-            activeCount = events.filter(event => {
-              const eventDate = new Date(event.event_time || event.event_date);
-              return eventDate >= now || event.status === 'upcoming' || event.status === 'ongoing';
-            }).length;
-            
-            // Collect venue data for popular venues chart
-            events.forEach(event => {
-              if (event.venue) {
-                popularVenues[event.venue] = (popularVenues[event.venue] || 0) + 1;
-              }
-            });
-            
-            // Calculate monthly event creation
-            events.forEach(event => {
-              const creationDate = new Date(event.created_at || event.event_time);
-              if (!isNaN(creationDate.getTime())) {
-                const month = creationDate.getMonth();
-                monthlyEvents[month]++;
-                
-                // Check if event was created this month or previous month
-                if (creationDate.getMonth() === currentMonth && 
-                    creationDate.getFullYear() === now.getFullYear()) {
-                  currentMonthEvents++;
-                } else if (creationDate.getMonth() === prevMonth && 
-                          ((creationDate.getFullYear() === now.getFullYear()) || 
-                          (prevMonth === 11 && creationDate.getFullYear() === now.getFullYear() - 1))) {
-                  prevMonthEvents++;
-                }
+          // Count active events (upcoming or ongoing)
+          activeCount = events.filter(event => {
+            const eventDate = new Date(event.event_time || event.event_date);
+            return eventDate >= now || event.status === 'upcoming' || event.status === 'ongoing';
+          }).length;
+          
+          // Collect venue data for popular venues chart
+          events.forEach(event => {
+            if (event.venue) {
+              popularVenues[event.venue] = (popularVenues[event.venue] || 0) + 1;
+            }
+          });
+          
+          // Calculate monthly event creation
+          events.forEach(event => {
+            const creationDate = new Date(event.created_at || event.event_time);
+            if (!isNaN(creationDate.getTime())) {
+              const month = creationDate.getMonth();
+              monthlyEvents[month]++;
+              
+              // Check if event was created this month or previous month
+              if (creationDate.getMonth() === currentMonth && 
+                  creationDate.getFullYear() === now.getFullYear()) {
+                currentMonthEvents++;
+              } else if (creationDate.getMonth() === prevMonth && 
+                        ((creationDate.getFullYear() === now.getFullYear()) || 
+                        (prevMonth === 11 && creationDate.getFullYear() === now.getFullYear() - 1))) {
+                prevMonthEvents++;
               }
-            });
-          } else if (response.data.count) {
-            eventCount = response.data.count;
-          }
+            }
+          });
         }
       } catch (error) {
         console.warn("Could not fetch event count", error);
@@ -511,37 +502,15 @@ const Dashboard = () => {
         console.warn("Could not fetch participant data", error);
       }
       
-      // Get feedback data for event ratings
+      // Get feedback data for event ratings; each event in the list carries
+      // its rating histogram, so no per-event feedback requests are needed
       try {
-        const response = await api.get("/events/events/");
-        let feedbackData = [];
-        
-        // Loop through events to get feedback for each one
-        for (const event of events) {
-          try {
-            const feedbackResponse = await api.get(`/events/events/${event.id}/feedback/`);
-            if (feedbackResponse.data) {
-              if (Array.isArray(feedbackResponse.data)) {
-                feedbackData = [...feedbackData, ...feedbackResponse.data];
-              } else if (feedbackResponse.data.results && Array.isArray(feedbackResponse.data.results)) {
-                feedbackData = [...feedbackData, ...feedbackResponse.data.results];
-              }
-            }
-          } catch (error) {
-            // Skip if can't get feedback for this event
-            continue;
+        events.forEach(event => {
+          const histogram = event.rating?.histogram || {};
+          for (let rating = 1; rating <= 5; rating++) {
+            eventRatings[rating - 1] += histogram[rating] || 0;
           }
-        }
-        
-        // Process feedback data for ratings chart
-        if (feedbackData.length > 0) {
-          feedbackData.forEach(feedback => {
-            const rating = parseInt(feedback.rating);
-            if (rating >= 1 && rating <= 5) {
-              eventRatings[rating - 1]++;
-            }
-          });
-        }
+        });
       } catch (error) {
         console.warn("Could not fetch feedback data", error);
       }
@@ -606,17 +575,11 @@ const Dashboard = () => {
 
   const fetchUpcomingEvents = async () => {
     try {
-      // Get upcoming events from the events endpoint
-      const response = await api.get("/events/events/");
-      let events = [];
-      
-      if (response.data) {
-        if (Array.isArray(response.data)) {
-          events = response.data;
-        } else if (response.data.results && Array.isArray(response.data.results)) {
-          events = response.data.results;
-        }
-      }
+      // Get upcoming events from the events endpoint, soonest first across
+      // every page
+      let events = await api.getAll("/events/events/", {
+        params: { ordering: "event_time" },
+      });
       
       // Filter for upcoming events
       const now = new Date();
@@ -109,26 +109,16 @@ const EventsManagement = () => {
       setLoading(true);
       setError(null);
       
-      // Use the correct endpoint matching your backend URL structure
-      const response = await api.get("/events/events/");
+      // The list is cursor paginated; management needs every page
+      const eventsData = await api.getAll("/events/events/");
       
-      if (response.data) {
-        // Assume response is either array of events or has a results property
-        const eventsData = Array.isArray(response.data) 
-          ? response.data 
-          : (response.data.results || []);
-        
-        if (eventsData.length > 0) {
-          const normalizedEvents = eventsData.map(normalizeEventData);
-          setEvents(normalizedEvents);
-          setError(null);
-        } else {
-          setEvents([]);
-          setError("No events found");
-        }
+      if (eventsData.length > 0) {
+        const normalizedEvents = eventsData.map(normalizeEventData);
+        setEvents(normalizedEvents);
+        setError(null);
       } else {
         setEvents([]);
-        setError("Empty response from backend");
+        setError("No events found");
       }
     } catch (error) {
       console.error("Error fetching events:", error);
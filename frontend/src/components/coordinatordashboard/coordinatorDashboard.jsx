@@ -196,55 +196,9 @@ const CoordinatorDashboard = () => {
       if (activeTab === "events") {
         setIsLoadingEvents(true);
         try {
-          // Try different endpoints to get coordinator events
-          let eventsData = [];
-          
-          // Define all possible endpoints for coordinator events
-          const endpoints = [
-            "events/coordinator-events",
-            "api/events/coordinator-events",
-            "events/events/",
-            "api/events/",
-            "events/"
-          ];
-          
-          // Try each endpoint until successful
-          let response = null;
-          for (const endpoint of endpoints) {
-            try {
-              response = await api.get(endpoint);
-              
-              // Check if we got valid data
-              if (response.data) {
-                // Handle different response formats
-                if (Array.isArray(response.data)) {
-                  eventsData = response.data;
-                  break;
-                } else if (response.data.events && Array.isArray(response.data.events)) {
-              eventsData = response.data.events;
-                  break;
-                } else if (response.data.results && Array.isArray(response.data.results)) {
-                  eventsData = response.data.results;
-                  break;
-                } else if (typeof response.data === 'object') {
-                  // Look for any array property that might contain events
-                  for (const key in response.data) {
-                    if (Array.isArray(response.data[key])) {
-                      const firstItem = response.data[key][0];
-                      if (firstItem && (firstItem.event_name || firstItem.id)) {
-                        eventsData = response.data[key];
-                        break;
-                      }
-                    }
-                  }
-                  
-                  if (eventsData.length > 0) break;
-                }
-              }
-            } catch (error) {
-              // Continue to next endpoint
-            }
-          }
+          // Only the coordinator's own events, every page of them, so the
+          // statistics below cover them all
+          const eventsData = await api.getAll("events/coordinator-events/", {}, "events");
           
           // Process events data
           setEvents(eventsData);
@@ -793,10 +747,8 @@ const CoordinatorDashboard = () => {
         
         // First get the coordinator's events to ensure we only show payments for their events
         // This will help us filter payments more accurately
-        const myEventsResponse = await api.get("/api/events/?created_by=me");
-        console.log("My events response:", myEventsResponse.status, myEventsResponse.data);
-        
-        const myEventIds = myEventsResponse.data.map(event => event.id);
+        const myEvents = await api.getAll("events/coordinator-events/", {}, "events");
+        const myEventIds = myEvents.map(event => event.id);
         
         // Get all payments that are event_registration type (not event_creation)
         const paymentsResponse = await api.get("payments/payments/?payment_type=event_registration");
@@ -2097,18 +2049,9 @@ const CoordinatorDashboard = () => {
           setPaymentsLoading(true);
           
           // First get the coordinator's events to ensure we only show payments for their events
-          const myEventsResponse = await api.get("/api/events/?created_by=me");
-          console.log("My events response:", myEventsResponse.status, myEventsResponse.data);
-          
-          if (!Array.isArray(myEventsResponse.data)) {
-            console.error("Events response is not an array:", myEventsResponse.data);
-            setPayments([]);
-            setFilteredPayments([]);
-            setPaymentsLoading(false);
-            return;
-          }
+          const myEvents = await api.getAll("events/coordinator-events/", {}, "events");
           
-          const myEventIds = myEventsResponse.data.map(event => event.id);
+          const myEventIds = myEvents.map(event => event.id);
           console.log("My event IDs:", myEventIds);
           
           // Get all payments that are event_registration type (not event_creation)
@@ -16,7 +16,7 @@ const Dashboard = () => {
     try {
       const response = await api.get('/events/events/?status=draft');
       if (response.data) {
-        setDraftEvents(response.data);
+        setDraftEvents(response.data.results || response.data);
       }
     } catch (error) {
       console.error("Error fetching draft events:", error);
@@ -47,6 +47,11 @@ const EventDetails = () => {
   const [userRole, setUserRole] = useState(null);
   const [selectedImage, setSelectedImage] = useState(0);
   const [feedback, setFeedback] = useState([]);
+  // Cursor for the next page of reviews, null on the last page
+  const [feedbackCursor, setFeedbackCursor] = useState(null);
+  const [loadingMoreFeedback, setLoadingMoreFeedback] = useState(false);
+  // Rating average and count over every review, not just the loaded ones
+  const [ratingSummary, setRatingSummary] = useState(null);
   const [userFeedback, setUserFeedback] = useState(null);
   const [feedbackForm, setFeedbackForm] = useState({
     rating: 5,
@@ -377,61 +382,65 @@ const EventDetails = () => {
     }
   };
 
-  const fetchFeedback = async () => {
+  const fetchFeedback = async (cursor = null) => {
     try {
       console.log(`Fetching feedback for event ${id}`);
       
-      // First, try the correct endpoint pattern for feedback
-      const response = await api.get(`/events/events/${id}/feedback/`);
+      // Reviews are cursor paginated; the first page also brings the rating
+      // summary, later pages are reached through the previous page's cursor
+      const params = cursor ? { cursor } : { summary: true };
+      if (cursor) {
+        setLoadingMoreFeedback(true);
+      }
+      const response = await api.get(`/events/events/${id}/feedback/`, { params });
       console.log("Feedback response:", response.data);
       
-      // Set the feedback data
-      const feedbackData = response.data.results || response.data;
-      setFeedback(Array.isArray(feedbackData) ? feedbackData : []);
-      
-      // Check if the current user has already left feedback
-      if (isUserLoggedIn && userId) {
-        console.log("Checking if user has already submitted feedback");
-        const userFeedbackItem = feedbackData.find(item => {
-          return parseInt(item.user) === parseInt(userId);
-        });
-        
-        console.log("User feedback found:", userFeedbackItem);
-        setUserFeedback(userFeedbackItem || null);
-        
-        // Update canLeaveFeedback based on this info and event status
-        setCanLeaveFeedback(
-          isRegistered && 
-          !userFeedbackItem && 
-          (event?.status === "completed" || event?.clientSideStatus === "completed")
-        );
+      const page = response.data.results || [];
+      setFeedback(prevFeedback => cursor ? [...prevFeedback, ...page] : page);
+      setFeedbackCursor(api.cursorFrom(response.data.next));
+      if (response.data.summary) {
+        setRatingSummary(response.data.summary);
       }
     } catch (error) {
       console.error("Error fetching feedback:", error);
+      if (!cursor) {
+        setFeedback([]);
+        setFeedbackCursor(null);
+        setRatingSummary(null);
+      }
+    } finally {
+      setLoadingMoreFeedback(false);
+    }
+    
+    if (!cursor) {
+      fetchUserFeedback();
+    }
+  };
+
+  // Whether the current user already left feedback, looked up directly so
+  // it does not depend on which page of reviews their feedback is on
+  const fetchUserFeedback = async () => {
+    if (!isUserLoggedIn || !userId) {
+      return;
+    }
+    try {
+      const response = await api.get(`/events/events/${id}/feedback/`, {
+        params: { user: "me" },
+      });
+      const userFeedbackItem = (response.data.results || [])[0] || null;
       
-      // Try alternative endpoint
-      try {
-        const altResponse = await api.get(`/events/feedback/?event=${id}`);
-        const feedbackData = altResponse.data.results || altResponse.data;
-        setFeedback(Array.isArray(feedbackData) ? feedbackData : []);
-        
-        if (isUserLoggedIn && userId) {
-          const userFeedbackItem = feedbackData.find(item => 
-            parseInt(item.user) === parseInt(userId)
-          );
-          setUserFeedback(userFeedbackItem || null);
-          
-          setCanLeaveFeedback(
-            isRegistered && 
-            !userFeedbackItem && 
-            (event?.status === "completed" || event?.clientSideStatus === "completed")
-          );
-        }
-      } catch (altError) {
-        console.error("Error fetching feedback with alternate endpoint:", altError);
-      setFeedback([]);
+      console.log("User feedback found:", userFeedbackItem);
+      setUserFeedback(userFeedbackItem);
+      
+      // Update canLeaveFeedback based on this info and event status
+      setCanLeaveFeedback(
+        isRegistered && 
+        !userFeedbackItem && 
+        (event?.status === "completed" || event?.clientSideStatus === "completed")
+      );
+    } catch (error) {
+      console.error("Error checking for your feedback:", error);
       setUserFeedback(null);
-      }
     }
   };
 
@@ -604,7 +613,10 @@ const EventDetails = () => {
     return <div className={styles.starRating}>{stars}</div>;
   };
   
+  const reviewCount = ratingSummary ? ratingSummary.count : feedback.length;
+
   const calculateAverageRating = () => {
+    if (ratingSummary) return Number(ratingSummary.average || 0).toFixed(1);
     if (!feedback || feedback.length === 0) return 0;
     const sum = feedback.reduce((total, item) => total + item.rating, 0);
     return (sum / feedback.length).toFixed(1);
@@ -661,8 +673,9 @@ const EventDetails = () => {
       try {
         const response = await api.get(`/api/events/bookmarked/`);
         if (response && response.data) {
-          if (Array.isArray(response.data)) {
-            const isCurrentEventBookmarked = response.data.some(
+          const bookmarks = response.data.results || response.data;
+          if (Array.isArray(bookmarks)) {
+            const isCurrentEventBookmarked = bookmarks.some(
               bookmark => bookmark.id === parseInt(eventId || id)
             );
             setIsBookmarked(isCurrentEventBookmarked);
@@ -904,11 +917,11 @@ const EventDetails = () => {
             <span>₹{event.price}</span>
           </div>
         )}
-        {feedback.length > 0 && (
+        {reviewCount > 0 && (
           <div className={styles.infoItem}>
             <FaStar className={styles.infoIcon} />
             <span>
-              {calculateAverageRating()} ({feedback.length} reviews)
+              {calculateAverageRating()} ({reviewCount} reviews)
             </span>
           </div>
         )}
@@ -1025,7 +1038,7 @@ const EventDetails = () => {
       <div className={styles.feedbackSection}>
         <h2>
           <FaComments /> Reviews & Feedback 
-          {feedback.length > 0 && <span className={styles.reviewCount}>({feedback.length})</span>}
+          {reviewCount > 0 && <span className={styles.reviewCount}>({reviewCount})</span>}
         </h2>
         
         {event.status === "completed" && (
@@ -1153,6 +1166,15 @@ const EventDetails = () => {
                 )}
               </div>
             ))}
+            {feedbackCursor && (
+              <button
+                className={styles.feedbackButton}
+                onClick={() => fetchFeedback(feedbackCursor)}
+                disabled={loadingMoreFeedback}
+              >
+                {loadingMoreFeedback ? "Loading..." : "Show more reviews"}
+              </button>
+            )}
           </div>
         ) : (
           <div className={styles.noFeedback}>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { toast } from "react-toastify";
 import Modal from "react-bootstrap/Modal";
@@ -25,7 +25,11 @@ const EventList = () => {
   const [requestSubmitted, setRequestSubmitted] = useState(false);
   const [userParticipations, setUserParticipations] = useState([]);
   const [refreshing, setRefreshing] = useState(false);
-  const [totalPages, setTotalPages] = useState(1);
+  // Cursor for the next page of the catalogue, null on the last page
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  // Background refreshes reload as many events as are on screen
+  const loadedCount = useRef(0);
   const navigate = useNavigate();
 
   // Setup a regular refresh interval for events
@@ -49,22 +53,27 @@ const EventList = () => {
     return () => clearInterval(intervalId);
   }, [navigate]);
 
-  const fetchEvents = async (showLoadingState = true) => {
+  const fetchEvents = async (showLoadingState = true, cursor = null) => {
     try {
-      if (showLoadingState) {
+      if (cursor) {
+        setLoadingMore(true);
+      } else if (showLoadingState) {
         setLoading(true);
       } else {
         setRefreshing(true);
       }
       
-      // Params for filtering and pagination
+      // Params for filtering; the catalogue is cursor paginated, so later
+      // pages are reached through the cursor from the previous response
       const params = {
         search: searchTerm,
         category: filter,
         sort_by: "event_time",
-        page: 1,
-        page_size: 10
+        page_size: cursor ? 20 : Math.min(Math.max(loadedCount.current, 20), 100),
       };
+      if (cursor) {
+        params.cursor = cursor;
+      }
       
       // List of endpoints to try in order of preference
       const eventEndpoints = [
@@ -82,21 +91,26 @@ const EventList = () => {
       if (response.data) {
         if (response.data.results) {
           // Paginated response
-          setEvents(response.data.results);
-          setTotalPages(Math.ceil(response.data.count / 10) || 1);
+          const page = response.data.results;
+          setEvents(prevEvents => {
+            const loaded = cursor ? [...prevEvents, ...page] : page;
+            loadedCount.current = loaded.length;
+            return loaded;
+          });
+          setNextCursor(api.cursorFrom(response.data.next));
         } else if (Array.isArray(response.data)) {
           // Array response
           setEvents(response.data);
-          setTotalPages(1);
+          setNextCursor(null);
         } else {
           // Try to find events in nested data
           let eventData = findEventsInResponse(response.data);
           setEvents(eventData || []);
-          setTotalPages(1);
+          setNextCursor(null);
         }
       } else {
         setEvents([]);
-        setTotalPages(1);
+        setNextCursor(null);
       }
       
       if (!showLoadingState && refreshing) {
@@ -104,20 +118,31 @@ const EventList = () => {
       }
     } catch (error) {
       console.error("Error fetching events:", error);
-      setEvents([]); 
-      setTotalPages(1);
       
       if (error?.response?.status === 401) {
         toast.error("Session expired. Please login again.");
         navigate("/login_reg");
+      } else if (cursor) {
+        // Keep what is already loaded; the next click retries the page
+        toast.error("Failed to load more events. Please try again.");
+        return;
       } else if (showLoadingState) {
         toast.error("Failed to fetch events. Please try again.");
       }
+      setEvents([]); 
+      setNextCursor(null);
     } finally {
       if (showLoadingState) {
         setLoading(false);
       }
       setRefreshing(false);
+      setLoadingMore(false);
+    }
+  };
+
+  const handleLoadMore = () => {
+    if (nextCursor && !loadingMore) {
+      fetchEvents(false, nextCursor);
     }
   };
   
@@ -528,6 +553,14 @@ const EventList = () => {
             )}
           </div>
 
+          {nextCursor && (
+            <div className={styles.loadMore}>
+              <button onClick={handleLoadMore} disabled={loadingMore}>
+                {loadingMore ? "Loading..." : "Load more events"}
+              </button>
+            </div>
+          )}
+
           {filteredEvents.length === 0 && (
             <div className={styles.noEvents}>
               <h3>No events found</h3>
@@ -608,9 +608,10 @@ const UserDashboard = () => {
           response = await api.get(endpoint);
           
           if (response?.data) {
-            console.log(`Successfully fetched ${response.data.length} bookmarked events from ${endpoint}`);
-            setBookmarkedEvents(response.data);
-            return response.data;
+            const bookmarkedData = response.data.results || response.data;
+            console.log(`Successfully fetched ${bookmarkedData.length} bookmarked events from ${endpoint}`);
+            setBookmarkedEvents(bookmarkedData);
+            return bookmarkedData;
           }
         } catch (err) {
           console.log(`Failed to fetch bookmarked events from ${endpoint}:`, err);
@@ -734,9 +735,10 @@ const UserDashboard = () => {
       const response = await api.tryMultipleEndpoints(endpoints, 'get');
       
       if (response && response.data) {
-        console.log(`Successfully fetched ${response.data.length} participations`);
-        setUserParticipations(response.data);
-        return response.data;
+        const participationsData = response.data.results || response.data;
+        console.log(`Successfully fetched ${participationsData.length} participations`);
+        setUserParticipations(participationsData);
+        return participationsData;
         } else {
         console.warn("Response format unexpected for participations", response);
         setUserParticipations([]);
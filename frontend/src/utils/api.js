@@ -104,6 +104,36 @@ api.tryMultipleEndpoints = async (endpoints, method = 'get', data = null, config
   throw lastError || new Error(`All ${endpoints.length} endpoints failed`);
 };
 
+// Get the cursor out of a paginated response's `next`/`previous` link
+api.cursorFrom = (link) => {
+  if (!link) return null;
+  return new URL(link, window.location.origin).searchParams.get('cursor');
+};
+
+// Fetch every row of a list endpoint, following cursor pagination's `next`
+// link until it runs out; unpaginated endpoints return their array as is.
+// resultsKey names the array in endpoints that do not use `results`.
+api.getAll = async (endpoint, config = {}, resultsKey = 'results') => {
+  const params = { page_size: 100, ...(config.params || {}) };
+  let rows = [];
+  let cursor = null;
+
+  do {
+    const response = await api.get(endpoint, {
+      ...config,
+      params: cursor ? { ...params, cursor } : params,
+    });
+    const data = response.data;
+    if (Array.isArray(data)) {
+      return data;
+    }
+    rows = rows.concat(data?.[resultsKey] || []);
+    cursor = api.cursorFrom(data?.next);
+  } while (cursor);
+
+  return rows;
+};
+
 // Helper function to get correct media URL
 export const getMediaUrl = (relativeUrl) => {
   if (!relativeUrl) return null;